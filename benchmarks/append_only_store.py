@@ -0,0 +1,102 @@
+"""
+Compares the `AppendOnlyTransport` with the `SQLiteTransport` on the objects of a
+synthetic model: each transport writes every object as `operations.send()` would,
+then reads them all back by id in a random order, one by one and in batches as
+`operations.receive()` would.
+
+Run with `poetry run python benchmarks/append_only_store.py [object count]`.
+
+The model is serialized once up front so only the transports are timed. Reads go
+through a newly opened transport, but the OS page cache is not dropped between
+runs.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Point
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.append_only import AppendOnlyTransport
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def make_objects(count: int):
+    model = Base(name="model")
+    model["@points"] = [Point(x=i, y=i, z=i, units="m") for i in range(count - 1)]
+    transport = MemoryTransport()
+    BaseObjectSerializer(write_transports=[transport]).write_json(model)
+    return list(transport.objects.items())
+
+
+def write(transport, objects) -> float:
+    start = time.perf_counter()
+    transport.begin_write()
+    for id, obj in objects:
+        transport.save_object(id, obj)
+    transport.end_write()
+    return time.perf_counter() - start
+
+
+def read_each(transport, ids) -> float:
+    start = time.perf_counter()
+    for id in ids:
+        transport.get_object(id)
+    return time.perf_counter() - start
+
+
+def read_batches(transport, ids) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(ids), 1000):
+        transport.get_objects(ids[i : i + 1000])
+    return time.perf_counter() - start
+
+
+def size(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    objects = make_objects(count)
+    ids = [id for id, _ in objects]
+    random.Random(0).shuffle(ids)
+
+    print(f"{len(objects)} objects")
+    print(f"{'':>16} {'write':>9} {'get':>9} {'batches':>9} {'size':>9}")
+    transports = {
+        "sqlite": lambda path: SQLiteTransport(base_path=path),
+        "sqlite (fast)": lambda path: SQLiteTransport(base_path=path, profile="fast"),
+        "append only": lambda path: AppendOnlyTransport(base_path=path),
+    }
+    for name, make_transport in transports.items():
+        with tempfile.TemporaryDirectory() as base_path:
+            transport = make_transport(base_path)
+            write_elapsed = write(transport, objects)
+            transport.close()
+
+            transport = make_transport(base_path)
+            each_elapsed = read_each(transport, ids)
+            transport.close()
+
+            transport = make_transport(base_path)
+            batches_elapsed = read_batches(transport, ids)
+            transport.close()
+            total_size = size(base_path)
+
+        print(
+            f"{name:>16} {write_elapsed:>8.2f}s {each_elapsed:>8.2f}s"
+            f" {batches_elapsed:>8.2f}s {total_size / 1e6:>7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
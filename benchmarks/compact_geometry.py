@@ -0,0 +1,63 @@
+"""
+Measures the memory taken per point by full Points, by compact points and by a
+`CompactPoints` sequence, along with the time it takes to create them.
+
+Run with `poetry run python benchmarks/compact_geometry.py [point count]`.
+
+The memory is traced by `tracemalloc` while the points are alive, so it includes
+the list holding them.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from specklepy.objects.compact import CompactPoint, CompactPoints
+from specklepy.objects.geometry import Point
+
+
+def full_points(count: int):
+    return [Point(x=i, y=i + 0.5, z=i + 0.25, units="m") for i in range(count)]
+
+
+def compact_points(count: int):
+    return [CompactPoint(i, i + 0.5, i + 0.25, units="m") for i in range(count)]
+
+
+def packed_points(count: int):
+    coordinates = (v for i in range(count) for v in (i, i + 0.5, i + 0.25))
+    return CompactPoints(coordinates, units="m")
+
+
+def measure(create, count: int):
+    # tracing slows down allocations, so the points are timed in a separate run
+    start = time.perf_counter()
+    points = create(count)
+    elapsed = time.perf_counter() - start
+    del points
+
+    tracemalloc.start()
+    points = create(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the points are only kept alive until their memory is measured
+    del points
+    return size / count, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"memory for {count} points")
+    print(f"{'':>15} {'bytes/point':>12} {'created in':>11}")
+    for name, create in (
+        ("Point", full_points),
+        ("CompactPoint", compact_points),
+        ("CompactPoints", packed_points),
+    ):
+        size, elapsed = measure(create, count)
+        print(f"{name:>15} {size:>12.1f} {elapsed:>10.3f}s")
+
+
+if __name__ == "__main__":
+    main()
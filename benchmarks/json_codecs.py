@@ -0,0 +1,79 @@
+"""
+Compares the encode and decode throughput of the JSON codecs on the objects of a
+synthetic model made of the kinds of objects Speckle models are: meshes with
+their chunks, points, lines and collections with references to their elements.
+
+Run with `poetry run python benchmarks/json_codecs.py [element count]`.
+
+Each codec encodes the dicts the serializer builds and decodes the JSON written
+to the transports. Codecs which are not installed are skipped.
+"""
+
+import random
+import sys
+import time
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Line, Mesh, Point
+from specklepy.objects.other import Collection, RenderMaterial
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.json_codecs import CODECS, get_codec
+from specklepy.transports.memory import MemoryTransport
+
+
+def make_model(count: int) -> Base:
+    rng = random.Random(0)
+    material = RenderMaterial(name="concrete", diffuse=-2894893)
+    elements = []
+    for i in range(count):
+        mesh = Mesh(
+            vertices=[rng.uniform(-1e3, 1e3) for _ in range(300)],
+            faces=[3, *rng.sample(range(100), 3)] * 50,
+            units="m",
+        )
+        mesh["renderMaterial"] = material
+        element = Base(name=f"element {i}", category="Walls", **{"@mesh": mesh})
+        element["@points"] = [
+            Point(x=rng.random(), y=rng.random(), z=rng.random()) for _ in range(20)
+        ]
+        element["axis"] = Line(start=Point(x=i), end=Point(x=i + rng.random()))
+        elements.append(element)
+    return Collection(name="model", collectionType="layer", elements=elements)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    transport = MemoryTransport()
+    BaseObjectSerializer(write_transports=[transport]).write_json(make_model(count))
+    serialized = list(transport.objects.values())
+    decoded = [get_codec("ujson").loads(obj) for obj in serialized]
+    size = sum(map(len, serialized)) / 1e6
+
+    print(f"{len(serialized)} objects, {size:.1f}MB")
+    print(f"{'':>8} {'encode':>12} {'decode':>12}")
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except SpeckleException:
+            print(f"{name:>8} {'not installed':>12}")
+            continue
+
+        start = time.perf_counter()
+        for obj in decoded:
+            codec.dumps(obj)
+        encode_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for obj in serialized:
+            codec.loads(obj)
+        decode_elapsed = time.perf_counter() - start
+
+        print(
+            f"{name:>8} {size / encode_elapsed:>8.1f}MB/s"
+            f" {size / decode_elapsed:>8.1f}MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measures the cost of looking up the serializable members of each object, and of
+sending a collection of one million detached points.
+
+Run with `poetry run python benchmarks/member_layout.py [point count]`.
+
+The members used to be found with `dir()` on every object. That lookup is kept
+here as a baseline for the cached class layout `Base` uses now.
+"""
+
+import sys
+import time
+
+from specklepy.core.api import operations
+from specklepy.objects.base import REMOVE_FROM_DIR, Base
+from specklepy.objects.geometry import Point
+from specklepy.objects.other import Collection
+from specklepy.transports.memory import MemoryTransport
+
+
+def dir_serializable_attributes(base: Base):
+    names = [
+        name
+        for name in set(dir(base)) - REMOVE_FROM_DIR
+        if not name.startswith("_") and not callable(getattr(base, name))
+    ]
+    return sorted(set(names) - base._serialize_ignore)
+
+
+def time_lookup(lookup, points) -> float:
+    start = time.perf_counter()
+    for point in points:
+        lookup(point)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    points = [Point(x=i, y=i, z=i, units="m") for i in range(count)]
+
+    print(f"member lookups for {count} points")
+    dir_elapsed = time_lookup(dir_serializable_attributes, points)
+    cached_elapsed = time_lookup(Base.get_serializable_attributes, points)
+    print(f"{'dir()':>8} {dir_elapsed:>10.3f}s")
+    print(f"{'cached':>8} {cached_elapsed:>10.3f}s")
+    print(f"{'speedup':>8} {dir_elapsed / cached_elapsed:>10.1f}x")
+
+    collection = Collection(name="points", collectionType="test", elements=points)
+    start = time.perf_counter()
+    operations.send(collection, [MemoryTransport()], use_default_cache=False)
+    elapsed = time.perf_counter() - start
+    print(
+        f"\nsend of {count} points: {elapsed:.3f}s ({elapsed / count * 1e6:.2f} us/point)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Measures how long it takes to recompose the objects of a synthetic model on
+receive, with their values validated and with them trusted.
+
+Run with `poetry run python benchmarks/receive_decoding.py [element count]`.
+
+Each element is a `Line` with two `Point`s, in detached collections of 100
+elements. The model is sent to a `MemoryTransport` up front, so only reading the
+objects back from it and recomposing them is timed.
+"""
+
+import sys
+import time
+
+from specklepy.objects.geometry import Line, Point
+from specklepy.objects.other import Collection
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+def make_model(count: int) -> Collection:
+    groups = [
+        Collection(
+            name=f"group {i}",
+            collectionType="group",
+            elements=[
+                Line(
+                    start=Point(x=i, y=j, z=0, units="m"),
+                    end=Point(x=j, y=i, z=1, units="m"),
+                    units="m",
+                    applicationId=f"{i}-{j}",
+                )
+                for j in range(100)
+            ],
+        )
+        for i in range(max(1, count // 100))
+    ]
+    return Collection(name="model", collectionType="model", elements=groups)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    transport = MemoryTransport()
+    obj_id, _ = BaseObjectSerializer(write_transports=[transport]).write_json(
+        make_model(count)
+    )
+    root = transport.get_object(obj_id)
+
+    print(f"{count} elements, {len(transport.objects)} objects")
+    for trusted in (False, True):
+        serializer = BaseObjectSerializer(read_transport=transport, trusted=trusted)
+        start = time.perf_counter()
+        serializer.read_json(root)
+        elapsed = time.perf_counter() - start
+        print(f"{'trusted' if trusted else 'validated':>9} {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures how serialization time scales with the depth and size of an object tree.
+
+Run with `poetry run python benchmarks/serializer_scaling.py`.
+
+Chains of detached objects have a closure table which grows with the square of
+their depth (every object lists all of its descendants), so the time per closure
+entry is reported alongside the total time for those.
+"""
+
+import time
+
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Point
+from specklepy.objects.other import Collection
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+def detached_chain(depth: int) -> Base:
+    root = Collection(name="root", collectionType="chain", elements=[])
+    parent = root
+    for i in range(depth):
+        child = Collection(name=f"level {i}", collectionType="chain", elements=[])
+        parent.elements.append(child)
+        parent = child
+    return root
+
+
+def wide_tree(object_count: int) -> Base:
+    elements = [
+        Collection(
+            name=f"group {i}",
+            collectionType="group",
+            elements=[Point(x=i, y=j, z=0) for j in range(10)],
+        )
+        for i in range(object_count // 11)
+    ]
+    return Collection(name="root", collectionType="wide", elements=elements)
+
+
+def serialize(base: Base):
+    serializer = BaseObjectSerializer(write_transports=[MemoryTransport()])
+    start = time.perf_counter()
+    serializer.write_json(base)
+    elapsed = time.perf_counter() - start
+    closure_entries = sum(len(c) for c in serializer.closure_table.values())
+    return elapsed, closure_entries
+
+
+def main():
+    print("detached chains")
+    print(f"{'depth':>8} {'seconds':>10} {'closure entries':>16} {'us/entry':>10}")
+    for depth in (250, 500, 1000, 2000, 4000):
+        elapsed, entries = serialize(detached_chain(depth))
+        print(
+            f"{depth:>8} {elapsed:>10.3f} {entries:>16} {elapsed / entries * 1e6:>10.2f}"
+        )
+
+    print("\nwide trees")
+    print(f"{'objects':>8} {'seconds':>10} {'us/object':>10}")
+    for count in (10_000, 50_000, 100_000, 200_000):
+        elapsed, _ = serialize(wide_tree(count))
+        print(f"{count:>8} {elapsed:>10.3f} {elapsed / count * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
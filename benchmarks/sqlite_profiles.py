@@ -0,0 +1,90 @@
+"""
+Compares the performance profiles of the `SQLiteTransport` on the objects of a
+synthetic model: each profile writes every object as `operations.send()` would,
+then reads them all back by id in a random order as `operations.receive()` would
+from a cold cache. The profiles are also compared with compressed storage, along
+with the size of the db.
+
+Run with `poetry run python benchmarks/sqlite_profiles.py [object count]`.
+
+The model is serialized once up front so only the transport is timed. Reads go
+through a new connection, but the OS page cache is not dropped between runs.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Point
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import PROFILES, SQLiteTransport
+
+
+def make_objects(count: int):
+    model = Base(name="model")
+    model["@points"] = [Point(x=i, y=i, z=i, units="m") for i in range(count - 1)]
+    transport = MemoryTransport()
+    BaseObjectSerializer(write_transports=[transport]).write_json(model)
+    return list(transport.objects.items())
+
+
+def write(transport: SQLiteTransport, objects) -> float:
+    start = time.perf_counter()
+    transport.begin_write()
+    for id, obj in objects:
+        transport.save_object(id, obj)
+    transport.end_write()
+    return time.perf_counter() - start
+
+
+def read(transport: SQLiteTransport, ids) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(ids), 1000):
+        transport.get_objects(ids[i : i + 1000])
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    objects = make_objects(count)
+    ids = [id for id, _ in objects]
+    random.Random(0).shuffle(ids)
+
+    print(f"{len(objects)} objects")
+    print(f"{'':>23} {'write':>9} {'read':>9} {'size':>9}")
+    runs = [(profile, False, None) for profile in PROFILES]
+    runs += [(profile, True, None) for profile in PROFILES]
+    runs += [(profile, True, "zlib") for profile in PROFILES]
+    for profile, bulk_import, compression in runs:
+        with tempfile.TemporaryDirectory() as base_path:
+            transport = SQLiteTransport(
+                base_path=base_path,
+                profile=profile,
+                scope="Benchmark",
+                bulk_import=bulk_import,
+                compression=compression,
+            )
+            write_elapsed = write(transport, objects)
+            transport.close()
+            size = os.path.getsize(os.path.join(base_path, "Benchmark.db"))
+
+            transport = SQLiteTransport(
+                base_path=base_path, scope="Benchmark", profile=profile
+            )
+            read_elapsed = read(transport, ids)
+            transport.close()
+
+        name = profile + (" (bulk)" if bulk_import else "")
+        name += f" ({compression})" if compression else ""
+        print(
+            f"{name:>23} {write_elapsed:>8.2f}s {read_elapsed:>8.2f}s"
+            f" {size / 1e6:>7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
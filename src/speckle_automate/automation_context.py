@@ -1,5 +1,7 @@
 """This module provides an abstraction layer above the Speckle Automate runtime."""
 
+import shutil
+import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,9 +23,14 @@ from specklepy.api.client import SpeckleClient
 from specklepy.core.api.models import Branch
 from specklepy.logging.exceptions import SpeckleException
 from specklepy.objects.base import Base
-from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.append_only import AppendOnlyTransport
+from specklepy.transports.memory import BoundedMemoryTransport, MemoryTransport
 from specklepy.transports.server import ServerTransport
 
+#: the size the objects received and sent by a run can take in memory, in MB.
+#: Larger models spill over to a store in a temporary folder
+MEMORY_TRANSPORT_BUDGET_MB = 512
+
 
 @dataclass
 class AutomationContext:
@@ -41,12 +48,35 @@ class AutomationContext:
     _speckle_token: str
 
     #: keep a memory transponrt at hand, to speed up things if needed
-    _memory_transport: MemoryTransport = field(default_factory=MemoryTransport)
+    _memory_transport: Optional[MemoryTransport] = None
+    #: the temporary folder the memory transport spills over to, once it does
+    _spill_path: Optional[str] = field(default=None, init=False)
 
     #: added for performance measuring
     _init_time: float = field(default_factory=time.perf_counter)
     _automation_result: AutomationResult = field(default_factory=AutomationResult)
 
+    def __post_init__(self) -> None:
+        if self._memory_transport is None:
+            self._memory_transport = BoundedMemoryTransport(
+                MEMORY_TRANSPORT_BUDGET_MB, spill_factory=self._create_spill_transport
+            )
+
+    def _create_spill_transport(self) -> AppendOnlyTransport:
+        self._spill_path = tempfile.mkdtemp(prefix="speckle-automate-")
+        return AppendOnlyTransport(base_path=self._spill_path)
+
+    def close(self) -> None:
+        """Remove the temporary store the memory transport spilled over to."""
+        if self._spill_path is None:
+            return
+        spill_transport = getattr(self._memory_transport, "spill_transport", None)
+        if spill_transport is not None:
+            spill_transport.close()
+            self._memory_transport.spill_transport = None
+        shutil.rmtree(self._spill_path, ignore_errors=True)
+        self._spill_path = None
+
     @classmethod
     def initialize(
         cls, automation_run_data: Union[str, AutomationRunData], speckle_token: str
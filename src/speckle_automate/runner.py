@@ -187,6 +187,8 @@ def run_function(
             "Function error. Check the automation run logs for details."
         )
     finally:
+        # the run is over, so are the objects it received and sent
+        automation_context.close()
         if not automation_context.context_view:
             automation_context.set_context_view()
         automation_context.report_run_status()
@@ -1,18 +1,26 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
+from specklepy.core.api.operations import async_receive as _untracked_async_receive
+from specklepy.core.api.operations import async_send as core_async_send
 from specklepy.core.api.operations import deserialize as core_deserialize
 from specklepy.core.api.operations import receive as _untracked_receive
 from specklepy.core.api.operations import send as core_send
 from specklepy.core.api.operations import serialize as core_serialize
 from specklepy.logging import metrics
 from specklepy.objects.base import Base
+from specklepy.serialization.serialization_cache import SerializationCache
+from specklepy.transports.abstract_async_transport import AbstractAsyncTransport
 from specklepy.transports.abstract_transport import AbstractTransport
+from specklepy.transports.known_objects import KnownObjectsIndex
 
 
 def send(
     base: Base,
     transports: Optional[List[AbstractTransport]] = None,
     use_default_cache: bool = True,
+    max_workers: Optional[int] = None,
+    cache: Optional[SerializationCache] = None,
+    known_objects: Optional[KnownObjectsIndex] = None,
 ):
     """Sends an object via the provided transports. Defaults to the local cache.
 
@@ -21,6 +29,15 @@ def send(
         transports {list} -- where you want to send them
         use_default_cache {bool} -- toggle for the default cache.
         If set to false, it will only send to the provided transports
+        max_workers {int} -- optional: the number of processes used to serialize
+        the items of detached lists in parallel. Serializes on the calling
+        process if not set
+        cache {SerializationCache} -- optional: remembers the detached objects
+        between sends, so resending the same objects only serializes what changed.
+        Items of detached lists are not serialized in parallel with a cache
+        known_objects {KnownObjectsIndex} -- optional: the objects already on the
+        target stream, which are not written to the `ServerTransport` given the
+        same index. The other transports, like the local cache, still get them
 
     Returns:
         str -- the object id of the sent object
@@ -30,13 +47,20 @@ def send(
     else:
         metrics.track(metrics.SEND, getattr(transports[0], "account", None))
 
-    return core_send(base, transports, use_default_cache)
+    return core_send(
+        base, transports, use_default_cache, max_workers, cache, known_objects
+    )
 
 
 def receive(
     obj_id: str,
     remote_transport: Optional[AbstractTransport] = None,
     local_transport: Optional[AbstractTransport] = None,
+    page_size: Optional[int] = None,
+    thread_count: Optional[int] = None,
+    lazy: bool = False,
+    numeric_arrays: Optional[str] = None,
+    trusted: bool = False,
 ) -> Base:
     """Receives an object from a transport.
 
@@ -45,12 +69,93 @@ def receive(
         remote_transport {Transport} -- the transport to receive from
         local_transport {Transport} -- the local cache to check for existing objects
                                        (defaults to `SQLiteTransport`)
+        page_size {int} -- optional: the number of children to request per page
+                           when copying from a `ServerTransport`
+        thread_count {int} -- optional: the number of pages to fetch in parallel
+                              when copying from a `ServerTransport`
+        lazy {bool} -- if True, detached children and chunked lists are only read
+                       from the local transport when they are first accessed
+        numeric_arrays {str} -- optional: set to "array" or "numpy" to receive
+                                 props typed as lists of floats or ints as compact
+                                 `array.array` or NumPy arrays
+        trusted {bool} -- if True, received values are set without validating
+                          them against the types of their props. Only use this
+                          for objects sent with specklepy
 
     Returns:
         Base -- the base object
     """
     metrics.track(metrics.RECEIVE, getattr(remote_transport, "account", None))
-    return _untracked_receive(obj_id, remote_transport, local_transport)
+    return _untracked_receive(
+        obj_id,
+        remote_transport,
+        local_transport,
+        page_size,
+        thread_count,
+        lazy,
+        numeric_arrays,
+        trusted,
+    )
+
+
+async def async_send(
+    base: Base,
+    transports: Optional[List[Union[AbstractAsyncTransport, AbstractTransport]]] = None,
+    use_default_cache: bool = True,
+) -> str:
+    """Sends an object via the provided transports without blocking the event loop.
+    Defaults to the local cache.
+
+    Arguments:
+        obj {Base} -- the object you want to send
+        transports {list} -- where you want to send them, either async or
+        regular transports
+        use_default_cache {bool} -- toggle for the default cache.
+        If set to false, it will only send to the provided transports
+
+    Returns:
+        str -- the object id of the sent object
+    """
+    if transports is None:
+        metrics.track(metrics.SEND)
+    else:
+        metrics.track(metrics.SEND, getattr(transports[0], "account", None))
+
+    return await core_async_send(base, transports, use_default_cache)
+
+
+async def async_receive(
+    obj_id: str,
+    remote_transport: Optional[AbstractAsyncTransport] = None,
+    local_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    numeric_arrays: Optional[str] = None,
+    trusted: bool = False,
+) -> Base:
+    """Receives an object from an async transport without blocking the event loop
+    on the download.
+
+    Arguments:
+        obj_id {str} -- the id of the object to receive
+        remote_transport {AbstractAsyncTransport} -- the transport to receive from
+        local_transport {Transport} -- the local cache to check for existing objects
+                                       (defaults to `SQLiteTransport`)
+        lazy {bool} -- if True, detached children and chunked lists are only read
+                       from the local transport when they are first accessed
+        numeric_arrays {str} -- optional: set to "array" or "numpy" to receive
+                                 props typed as lists of floats or ints as compact
+                                 `array.array` or NumPy arrays
+        trusted {bool} -- if True, received values are set without validating
+                          them against the types of their props. Only use this
+                          for objects sent with specklepy
+
+    Returns:
+        Base -- the base object
+    """
+    metrics.track(metrics.RECEIVE, getattr(remote_transport, "account", None))
+    return await _untracked_async_receive(
+        obj_id, remote_transport, local_transport, lazy, numeric_arrays, trusted
+    )
 
 
 def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str:
@@ -72,7 +177,11 @@ def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str
 
 
 def deserialize(
-    obj_string: str, read_transport: Optional[AbstractTransport] = None
+    obj_string: str,
+    read_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    numeric_arrays: Optional[str] = None,
+    trusted: bool = False,
 ) -> Base:
     """
     Deserialize a string object into a Base object.
@@ -86,12 +195,27 @@ def deserialize(
         read_transport {AbstractTransport}
             -- the transport to fetch children objects from
                 (defaults to SQLiteTransport)
+        lazy {bool} -- if True, detached children and chunked lists are only read
+                       from the read transport when they are first accessed
+        numeric_arrays {str} -- optional: set to "array" or "numpy" to receive
+                                 props typed as lists of floats or ints as compact
+                                 `array.array` or NumPy arrays
+        trusted {bool} -- if True, received values are set without validating
+                          them against the types of their props. Only use this
+                          for objects sent with specklepy
 
     Returns:
         Base -- the deserialized object
     """
     metrics.track(metrics.SDK, custom_props={"name": "Deserialize"})
-    return core_deserialize(obj_string, read_transport)
+    return core_deserialize(obj_string, read_transport, lazy, numeric_arrays, trusted)
 
 
-__all__ = ["receive", "send", "serialize", "deserialize"]
+__all__ = [
+    "receive",
+    "send",
+    "async_receive",
+    "async_send",
+    "serialize",
+    "deserialize",
+]
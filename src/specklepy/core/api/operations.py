@@ -1,10 +1,17 @@
-from typing import List, Optional
+import asyncio
+import concurrent.futures
+import contextlib
+import threading
+from typing import Dict, List, Optional, Tuple, Union
 
 # from specklepy.logging import metrics
 from specklepy.logging.exceptions import SpeckleException
 from specklepy.objects.base import Base
 from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.serialization_cache import SerializationCache
+from specklepy.transports.abstract_async_transport import AbstractAsyncTransport
 from specklepy.transports.abstract_transport import AbstractTransport
+from specklepy.transports.known_objects import KnownObjectsIndex
 from specklepy.transports.sqlite import SQLiteTransport
 
 
@@ -12,6 +19,9 @@ def send(
     base: Base,
     transports: Optional[List[AbstractTransport]] = None,
     use_default_cache: bool = True,
+    max_workers: Optional[int] = None,
+    cache: Optional[SerializationCache] = None,
+    known_objects: Optional[KnownObjectsIndex] = None,
 ):
     """Sends an object via the provided transports. Defaults to the local cache.
 
@@ -20,6 +30,15 @@ def send(
         transports {list} -- where you want to send them
         use_default_cache {bool} -- toggle for the default cache.
         If set to false, it will only send to the provided transports
+        max_workers {int} -- optional: the number of processes used to serialize
+        the items of detached lists in parallel. Serializes on the calling
+        process if not set
+        cache {SerializationCache} -- optional: remembers the detached objects
+        between sends, so resending the same objects only serializes what changed.
+        Items of detached lists are not serialized in parallel with a cache
+        known_objects {KnownObjectsIndex} -- optional: the objects already on the
+        target stream, which are not written to the `ServerTransport` given the
+        same index. The other transports, like the local cache, still get them
 
     Returns:
         str -- the object id of the sent object
@@ -42,7 +61,12 @@ def send(
     if use_default_cache:
         transports.insert(0, SQLiteTransport())
 
-    serializer = BaseObjectSerializer(write_transports=transports)
+    serializer = BaseObjectSerializer(
+        write_transports=transports,
+        max_workers=max_workers,
+        cache=cache,
+        known_objects=known_objects,
+    )
 
     obj_hash, _ = serializer.write_json(base=base)
 
@@ -53,6 +77,11 @@ def receive(
     obj_id: str,
     remote_transport: Optional[AbstractTransport] = None,
     local_transport: Optional[AbstractTransport] = None,
+    page_size: Optional[int] = None,
+    thread_count: Optional[int] = None,
+    lazy: bool = False,
+    numeric_arrays: Optional[str] = None,
+    trusted: bool = False,
 ) -> Base:
     """Receives an object from a transport.
 
@@ -61,6 +90,18 @@ def receive(
         remote_transport {Transport} -- the transport to receive from
         local_transport {Transport} -- the local cache to check for existing objects
                                        (defaults to `SQLiteTransport`)
+        page_size {int} -- optional: the number of children to request per page
+                           when copying from a `ServerTransport`
+        thread_count {int} -- optional: the number of pages to fetch in parallel
+                              when copying from a `ServerTransport`
+        lazy {bool} -- if True, detached children and chunked lists are only read
+                       from the local transport when they are first accessed
+        numeric_arrays {str} -- optional: set to "array" or "numpy" to receive
+                                 props typed as lists of floats or ints as compact
+                                 `array.array` or NumPy arrays
+        trusted {bool} -- if True, received values are set without validating
+                          them against the types of their props. Only use this
+                          for objects sent with specklepy
 
     Returns:
         Base -- the base object
@@ -68,7 +109,12 @@ def receive(
     if not local_transport:
         local_transport = SQLiteTransport()
 
-    serializer = BaseObjectSerializer(read_transport=local_transport)
+    serializer = BaseObjectSerializer(
+        read_transport=local_transport,
+        lazy=lazy,
+        numeric_arrays=numeric_arrays,
+        trusted=trusted,
+    )
 
     # try local transport first. if the parent is there, we assume all the children are there and continue with deserialization using the local transport
     obj_string = local_transport.get_object(obj_id)
@@ -83,13 +129,266 @@ def receive(
             )
         )
 
+    # only forward the paging knobs that were set, so transports that don't page
+    # their children keep working with the base signature
+    copy_options = {
+        k: v
+        for k, v in (("page_size", page_size), ("thread_count", thread_count))
+        if v is not None
+    }
     obj_string = remote_transport.copy_object_and_children(
-        id=obj_id, target_transport=local_transport
+        id=obj_id, target_transport=local_transport, **copy_options
     )
 
     return serializer.read_json(obj_string=obj_string)
 
 
+class _AsyncWriteFeed(AbstractTransport):
+    """
+    Hands the objects a serializer writes on a worker thread over to the event
+    loop in batches. The queue between them is bounded, so the serializer is held
+    back when the async transports fall behind rather than the model piling up in
+    memory.
+    """
+
+    batch_size = 1000
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_batches: int = 8) -> None:
+        super().__init__()
+        self._loop = loop
+        self._queue: "asyncio.Queue[Optional[List[Tuple[str, str]]]]" = asyncio.Queue(
+            max_batches
+        )
+        self._batch: List[Tuple[str, str]] = []
+        # set when the send is cancelled, so the serializer stops waiting on the loop
+        self.cancelled = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return "AsyncWriteFeed"
+
+    def begin_write(self) -> None:
+        pass
+
+    def end_write(self) -> None:
+        if self._batch:
+            self._put(self._batch)
+            self._batch = []
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        self._batch.append((id, serialized_object))
+        if len(self._batch) >= self.batch_size:
+            self._put(self._batch)
+            self._batch = []
+
+    def save_object_from_transport(
+        self, id: str, source_transport: AbstractTransport
+    ) -> None:
+        self.save_object(id, source_transport.get_object(id))
+
+    def get_object(self, id: str) -> Optional[str]:
+        return None
+
+    def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        return {id: False for id in id_list}
+
+    def copy_object_and_children(
+        self, id: str, target_transport: AbstractTransport
+    ) -> str:
+        raise SpeckleException(
+            "The write feed of `async_send` only accepts the objects being sent:"
+            " copying objects out of it is not supported",
+            NotImplementedError(),
+        )
+
+    def close(self) -> None:
+        """Tells the loop that the serializer is done, whether it succeeded or not"""
+        with contextlib.suppress(SpeckleException):
+            self._put(None)
+
+    async def get(self) -> Optional[List[Tuple[str, str]]]:
+        """Gets the next batch of objects, or None once the serializer is done"""
+        return await self._queue.get()
+
+    def _put(self, batch: Optional[List[Tuple[str, str]]]) -> None:
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(batch), self._loop)
+        while True:
+            try:
+                return future.result(timeout=0.1)
+            except concurrent.futures.TimeoutError:
+                if self.cancelled.is_set():
+                    future.cancel()
+                    raise SpeckleException("The send was cancelled")
+
+
+async def _forward(
+    feed: _AsyncWriteFeed, transports: List[AbstractAsyncTransport]
+) -> None:
+    """
+    Writes the batches of the feed to the async transports. After an error the
+    feed is still drained, so the serializer is never left waiting on it.
+    """
+    error = None
+    try:
+        for transport in transports:
+            await transport.begin_write()
+    except Exception as ex:
+        error = ex
+
+    while True:
+        batch = await feed.get()
+        if batch is None:
+            break
+        if error:
+            continue
+        try:
+            for id, obj in batch:
+                for transport in transports:
+                    await transport.save_object(id, obj)
+        except Exception as ex:
+            error = ex
+
+    if error:
+        raise error
+    for transport in transports:
+        await transport.end_write()
+
+
+async def async_send(
+    base: Base,
+    transports: Optional[List[Union[AbstractAsyncTransport, AbstractTransport]]] = None,
+    use_default_cache: bool = True,
+) -> str:
+    """Sends an object via the provided transports without blocking the event loop.
+    Defaults to the local cache.
+
+    The object is serialized on a worker thread, which also writes it to the
+    synchronous transports. The serialized objects are streamed to the async
+    transports on the event loop as they are made. Synchronous transports shared
+    by concurrent sends must be thread safe, as the `SQLiteTransport` and the
+    `MemoryTransport` are.
+
+    Arguments:
+        obj {Base} -- the object you want to send
+        transports {list} -- where you want to send them, either async or
+        regular transports
+        use_default_cache {bool} -- toggle for the default cache.
+        If set to false, it will only send to the provided transports
+
+    Returns:
+        str -- the object id of the sent object
+    """
+    if not transports and not use_default_cache:
+        raise SpeckleException(
+            message=(
+                "You need to provide at least one transport: cannot send with an empty"
+                " transport list and no default cache"
+            )
+        )
+
+    if isinstance(transports, (AbstractTransport, AbstractAsyncTransport)):
+        transports = [transports]
+
+    loop = asyncio.get_running_loop()
+    transports = list(transports or [])
+    if use_default_cache:
+        transports.insert(0, await loop.run_in_executor(None, SQLiteTransport))
+
+    async_transports = []
+    write_transports = []
+    for transport in transports:
+        if isinstance(transport, AbstractAsyncTransport):
+            async_transports.append(transport)
+        else:
+            write_transports.append(transport)
+    feed = _AsyncWriteFeed(loop) if async_transports else None
+    if feed:
+        write_transports.append(feed)
+    serializer = BaseObjectSerializer(write_transports=write_transports)
+
+    def serialize() -> str:
+        try:
+            return serializer.write_json(base)[0]
+        finally:
+            if feed:
+                feed.close()
+
+    tasks = [loop.run_in_executor(None, serialize)]
+    if feed:
+        tasks.append(_forward(feed, async_transports))
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    except BaseException:
+        if feed:
+            feed.cancelled.set()
+        raise
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+
+    return results[0]
+
+
+async def async_receive(
+    obj_id: str,
+    remote_transport: Optional[AbstractAsyncTransport] = None,
+    local_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    numeric_arrays: Optional[str] = None,
+    trusted: bool = False,
+) -> Base:
+    """Receives an object from an async transport without blocking the event loop.
+
+    The download runs on the event loop, while the local transport is read and
+    the object recomposed on worker threads.
+
+    Arguments:
+        obj_id {str} -- the id of the object to receive
+        remote_transport {AbstractAsyncTransport} -- the transport to receive from
+        local_transport {Transport} -- the local cache to check for existing objects
+                                       (defaults to `SQLiteTransport`)
+        lazy {bool} -- if True, detached children and chunked lists are only read
+                       from the local transport when they are first accessed
+        numeric_arrays {str} -- optional: set to "array" or "numpy" to receive
+                                 props typed as lists of floats or ints as compact
+                                 `array.array` or NumPy arrays
+        trusted {bool} -- if True, received values are set without validating
+                          them against the types of their props. Only use this
+                          for objects sent with specklepy
+
+    Returns:
+        Base -- the base object
+    """
+    loop = asyncio.get_running_loop()
+    if not local_transport:
+        local_transport = await loop.run_in_executor(None, SQLiteTransport)
+
+    serializer = BaseObjectSerializer(
+        read_transport=local_transport,
+        lazy=lazy,
+        numeric_arrays=numeric_arrays,
+        trusted=trusted,
+    )
+
+    obj_string = await loop.run_in_executor(None, local_transport.get_object, obj_id)
+    if obj_string:
+        return await loop.run_in_executor(None, serializer.read_json, obj_string)
+
+    if not remote_transport:
+        raise SpeckleException(
+            message=(
+                "Could not find the specified object using the local transport, and you"
+                " didn't provide a fallback remote from which to pull it."
+            )
+        )
+
+    obj_string = await remote_transport.copy_object_and_children(
+        id=obj_id, target_transport=local_transport
+    )
+
+    return await loop.run_in_executor(None, serializer.read_json, obj_string)
+
+
 def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str:
     """
     Serialize a base object. If no write transports are provided,
@@ -110,7 +409,11 @@ def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str
 
 
 def deserialize(
-    obj_string: str, read_transport: Optional[AbstractTransport] = None
+    obj_string: str,
+    read_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    numeric_arrays: Optional[str] = None,
+    trusted: bool = False,
 ) -> Base:
     """
     Deserialize a string object into a Base object.
@@ -124,6 +427,14 @@ def deserialize(
         read_transport {AbstractTransport}
             -- the transport to fetch children objects from
                 (defaults to SQLiteTransport)
+        lazy {bool} -- if True, detached children and chunked lists are only read
+                       from the read transport when they are first accessed
+        numeric_arrays {str} -- optional: set to "array" or "numpy" to receive
+                                 props typed as lists of floats or ints as compact
+                                 `array.array` or NumPy arrays
+        trusted {bool} -- if True, received values are set without validating
+                          them against the types of their props. Only use this
+                          for objects sent with specklepy
 
     Returns:
         Base -- the deserialized object
@@ -131,9 +442,21 @@ def deserialize(
     if not read_transport:
         read_transport = SQLiteTransport()
 
-    serializer = BaseObjectSerializer(read_transport=read_transport)
+    serializer = BaseObjectSerializer(
+        read_transport=read_transport,
+        lazy=lazy,
+        numeric_arrays=numeric_arrays,
+        trusted=trusted,
+    )
 
     return serializer.read_json(obj_string=obj_string)
 
 
-__all__ = ["receive", "send", "serialize", "deserialize"]
+__all__ = [
+    "receive",
+    "send",
+    "async_receive",
+    "async_send",
+    "serialize",
+    "deserialize",
+]
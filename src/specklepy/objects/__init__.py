@@ -2,6 +2,7 @@
 
 from specklepy.objects import (
     GIS,
+    compact,
     encoding,
     geometry,
     other,
@@ -13,6 +14,7 @@ from specklepy.objects.base import Base
 
 __all__ = [
     "Base",
+    "compact",
     "encoding",
     "geometry",
     "other",
@@ -1,11 +1,16 @@
 import contextlib
+from array import array
 from enum import Enum
+from functools import partial
 from inspect import isclass
+from itertools import count
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     ForwardRef,
+    FrozenSet,
     List,
     Optional,
     Set,
@@ -24,6 +29,10 @@ from specklepy.transports.memory import MemoryTransport
 
 PRIMITIVES = (int, float, str, bool)
 
+# every change to a Base takes the next version, so that caches can tell whether
+# an object was changed since they last saw it
+_next_version = count(1).__next__
+
 # to remove from dir() when calling get_member_names()
 REMOVE_FROM_DIR = {
     "Config",
@@ -103,6 +112,15 @@ class _RegisteringBase:
     _chunk_size_default: int = 1000
     _detachable: Set[str] = set()  # list of defined detachable props
     _serialize_ignore: Set[str] = set()
+    # the public, non callable class attributes (incl properties) of the class,
+    # cached so only the instance `__dict__` is inspected for each object
+    _member_names: ClassVar[FrozenSet[str]] = frozenset()
+    _serializable_members: ClassVar[Tuple[str, ...]] = ()
+    _property_names: ClassVar[FrozenSet[str]] = frozenset()
+    # `_validate_type` compiled for each typed attribute
+    _validators: ClassVar[Dict[str, Callable[[Any], Tuple[bool, Any]]]] = {}
+    # the validators of attributes holding enums, which are stored by their value
+    _enum_validators: ClassVar[Dict[str, Callable[[Any], Tuple[bool, Any]]]] = {}
 
     @classmethod
     def get_registered_type(cls, speckle_type: str) -> Optional[Type["Base"]]:
@@ -188,9 +206,65 @@ class _RegisteringBase:
             cls._detachable = cls._detachable.union(detachable)
         if serialize_ignore:
             cls._serialize_ignore = cls._serialize_ignore.union(serialize_ignore)
+        cls._cache_member_layout()
+        cls._compile_validators()
         # we know, that the super here is object, that takes no args on init subclass
         return super().__init_subclass__()
 
+    @classmethod
+    def _cache_member_layout(cls) -> None:
+        """Caches the member names which are defined on the class itself"""
+        cls._member_names = frozenset(
+            name
+            for name in set(dir(cls)) - REMOVE_FROM_DIR
+            if not name.startswith("_") and not callable(getattr(cls, name, None))
+        )
+        cls._serializable_members = tuple(
+            sorted(cls._member_names - cls._serialize_ignore)
+        )
+        cls._property_names = frozenset(
+            name for name in dir(cls) if isinstance(getattr(cls, name, None), property)
+        )
+
+    @classmethod
+    def _compile_validators(cls) -> None:
+        """Compiles the validators of the typed attributes of the class"""
+        cls._validators = {
+            name: _compile_validator(t) for name, t in cls._attr_types.items()
+        }
+        cls._enum_validators = {
+            name: cls._validators[name]
+            for name, t in cls._attr_types.items()
+            if _holds_enum(t)
+        }
+
+
+def numeric_buffer_type(value: Any) -> Optional[type]:
+    """
+    Gets the type of the items in a flat numeric buffer, ie an `array.array`,
+    a 1d `memoryview` or a 1d NumPy array. Returns None for any other value.
+    """
+    if isinstance(value, array):
+        code = value.typecode
+    elif isinstance(value, memoryview):
+        if value.ndim != 1:
+            return None
+        code = value.format.lstrip("@=<>!")
+    elif hasattr(value, "__array_interface__") and getattr(value, "ndim", 0) == 1:
+        return {"f": float, "i": int, "u": int, "b": bool}.get(value.dtype.kind)
+    else:
+        return None
+
+    if len(code) != 1:
+        return None
+    if code in "fd":
+        return float
+    if code in "bBhHiIlLqQnN":
+        return int
+    if code == "?":
+        return bool
+    return None
+
 
 # T = TypeVar("T")
 
@@ -262,6 +336,23 @@ def _validate_type(t: Optional[type], value: Any) -> Tuple[bool, Any]:
 
         if origin is list:
             if not isinstance(value, list):
+                # compact sequences stand in for lists of their full items
+                item_type = getattr(type(value), "item_full_type", None)
+                if item_type is not None:
+                    t_items = getattr(t, "__args__", (Any,))[0]
+                    valid = t_items is Any or (
+                        isclass(t_items) and issubclass(item_type, t_items)
+                    )
+                    return valid, value
+                # numeric buffers are stored as they are for lists of numbers
+                buffer_type = numeric_buffer_type(value)
+                t_items = getattr(t, "__args__", (Any,))[0]
+                if buffer_type is not None and (
+                    t_items in (Any, buffer_type)
+                    or (t_items is float and buffer_type is int)
+                    or getattr(t_items, "__name__", None) == "T"
+                ):
+                    return True, value
                 return False, value
             if value == []:
                 return True, value
@@ -308,6 +399,11 @@ def _validate_type(t: Optional[type], value: Any) -> Tuple[bool, Any]:
     if isinstance(value, t):
         return True, value
 
+    # compact geometry stands in for the full type it serializes as
+    full_type = getattr(type(value), "full_type", None)
+    if isclass(full_type) and isclass(t) and issubclass(full_type, t):
+        return True, value
+
     with contextlib.suppress(ValueError, TypeError):
         if t is float and value is not None:
             return True, float(value)
@@ -319,7 +415,93 @@ def _validate_type(t: Optional[type], value: Any) -> Tuple[bool, Any]:
     return False, value
 
 
+def _accept(value: Any) -> bool:
+    return True
+
+
+def _validate_float(value: Any) -> Tuple[bool, Any]:
+    value_type = type(value)
+    if value_type is float or value is None:
+        return True, value
+    if value_type is int:
+        return True, float(value)
+    return _validate_type(float, value)
+
+
+def _fast_check(t: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Gets a cheap check for values which `_validate_type(t, value)` accepts as they
+    are, or None if the type has no such shortcut.
+    """
+    if t is None or t is Any or isinstance(t, ForwardRef):
+        return _accept
+
+    if getattr(t, "__module__", None) == "typing":
+        args = getattr(t, "__args__", None)
+        if getattr(t, "__origin__", None) is list:
+            if not args or getattr(args[0], "__name__", None) == "T":
+                return lambda value: isinstance(value, list)
+            validate_item = _compile_validator(args[0])
+            return lambda value: isinstance(value, list) and (
+                not value or validate_item(value[0])[0]
+            )
+        return None
+
+    if isclass(t):
+        return lambda value: isinstance(value, t)
+    return None
+
+
+def _compile_validator(t: Any) -> Callable[[Any], Tuple[bool, Any]]:
+    """
+    Compiles `_validate_type` for a given type. Values which pass the type's fast
+    check are accepted straight away, anything else goes through the full
+    validation.
+    """
+    if t is float:
+        return _validate_float
+
+    if t is type(None):
+        return lambda value: (value is None, value)
+
+    if getattr(t, "__origin__", None) is Union:
+        # each type of the union gets a go at the value in turn, as they do in
+        # `_validate_type`
+        validators = tuple(_compile_validator(arg) for arg in t.__args__)
+
+        def validate_union(value: Any) -> Tuple[bool, Any]:
+            for validate_arg in validators:
+                valid, checked_value = validate_arg(value)
+                if valid:
+                    return True, checked_value
+            return False, value
+
+        return validate_union
+
+    check = _fast_check(t)
+    if check is _accept:
+        return lambda value: (True, value)
+    if check is None:
+        return partial(_validate_type, t)
+
+    def validate(value: Any) -> Tuple[bool, Any]:
+        if value is None or check(value):
+            return True, value
+        return _validate_type(t, value)
+
+    return validate
+
+
+def _holds_enum(t: Any) -> bool:
+    if isclass(t) and not hasattr(t, "__origin__"):
+        return issubclass(t, Enum)
+    return any(_holds_enum(arg) for arg in getattr(t, "__args__", None) or ())
+
+
 class Base(_RegisteringBase):
+    # the version of the last change made through `setattr`, `setitem` or `delattr`
+    __slots__ = ("_version",)
+
     id: Union[str, None] = None
     totalChildrenCount: Union[int, None] = None
     applicationId: Union[str, None] = None
@@ -360,6 +542,7 @@ class Base(_RegisteringBase):
     def __setitem__(self, name: str, value: Any) -> None:
         self.validate_prop_name(name)
         self.__dict__[name] = value
+        _set_version(self, _next_version())
 
     def __getitem__(self, name: str) -> Any:
         return self.__dict__[name]
@@ -380,13 +563,18 @@ class Base(_RegisteringBase):
             return
         # if value is not None:
         value = self._type_check(name, value)
-        attr = getattr(self.__class__, name, None)
-        if isinstance(attr, property):
+        if name in self._property_names:
+            attr = getattr(self.__class__, name)
             try:
                 attr.__set__(self, value)
             except AttributeError:
                 return  # the prop probably doesn't have a setter
         super().__setattr__(name, value)
+        _set_version(self, _next_version())
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        _set_version(self, _next_version())
 
     @classmethod
     def update_forward_refs(cls) -> None:
@@ -404,6 +592,8 @@ class Base(_RegisteringBase):
             cls._attr_types = get_type_hints(cls)
         except Exception as e:
             warn(f"Could not update forward refs for class {cls.__name__}: {e}")
+        cls._cache_member_layout()
+        cls._compile_validators()
 
     @classmethod
     def validate_prop_name(cls, name: str) -> None:
@@ -428,14 +618,16 @@ class Base(_RegisteringBase):
         Eg if you have a type Dict[str, float],
         we will only check if the value you're trying to set is a dict.
         """
-        types = getattr(self, "_attr_types", {})
-        t = types.get(name, None)
+        validator = self._validators.get(name)
+        if validator is None:
+            return value
 
-        valid, checked_value = _validate_type(t, value)
+        valid, checked_value = validator(value)
 
         if valid:
             return checked_value
 
+        t = self._attr_types.get(name)
         raise SpeckleException(
             f"Cannot set '{self.__class__.__name__}.{name}':"
             f"it expects type '{str(t)}',"
@@ -469,10 +661,11 @@ class Base(_RegisteringBase):
     @units.setter
     def units(self, value: Union[str, Units, None]):
         """While this property accepts any string value, geometry expects units to be specific strings (see Units enum)"""
+        # stored as is, as the value is checked here already
         if isinstance(value, str) or value is None:
-            self._units = value
+            self.__dict__["_units"] = value
         elif isinstance(value, Units):
-            self._units = value.value
+            self.__dict__["_units"] = value.value
         else:
             raise SpeckleInvalidUnitException(
                 f"Unknown type {type(value)} received for units"
@@ -480,16 +673,35 @@ class Base(_RegisteringBase):
 
     def get_member_names(self) -> List[str]:
         """Get all of the property names on this object, dynamic or not"""
-        attr_dir = list(set(dir(self)) - REMOVE_FROM_DIR)
-        return [
-            name
-            for name in attr_dir
-            if not name.startswith("_") and not callable(getattr(self, name))
-        ]
+        names = set(self._member_names)
+        for name, value in self.__dict__.items():
+            if callable(value):
+                names.discard(name)
+            elif not name.startswith("_") and name not in REMOVE_FROM_DIR:
+                names.add(name)
+        return list(names)
 
     def get_serializable_attributes(self) -> List[str]:
         """Get the attributes that should be serialized"""
-        return sorted(list(set(self.get_member_names()) - self._serialize_ignore))
+        member_names = self._member_names
+        ignored = self._serialize_ignore
+        instance_names = []
+        for name, value in self.__dict__.items():
+            if name in member_names:
+                if callable(value):
+                    # an instance value hides a class member
+                    return sorted(set(self.get_member_names()) - ignored)
+            elif (
+                not name.startswith("_")
+                and name not in REMOVE_FROM_DIR
+                and name not in ignored
+                and not callable(value)
+            ):
+                instance_names.append(name)
+
+        if not instance_names:
+            return list(self._serializable_members)
+        return sorted([*self._serializable_members, *instance_names])
 
     def get_typed_member_names(self) -> List[str]:
         """Get all of the names of the defined (typed) properties of this object"""
@@ -568,6 +780,9 @@ class Base(_RegisteringBase):
 Base.update_forward_refs()
 
 
+_set_version = Base._version.__set__
+
+
 class DataChunk(Base, speckle_type="Speckle.Core.Models.DataChunk"):
     data: Union[List[Any], None] = None
 
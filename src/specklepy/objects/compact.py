@@ -0,0 +1,366 @@
+"""
+Compact variants of the small geometry primitives which tend to be created in
+large numbers, eg the vertices of a Brep or the result of `Polyline.as_points()`.
+
+Each compact object is a flat `array.array` of doubles with named accessors, so
+it has no `__dict__` and holds its values unboxed. Compact objects share the
+`speckle_type`, serialization and `to_list`/`from_list` behaviour of the class
+they stand in for, and can be assigned to props typed as that class. Only their
+geometry and units are kept: use `to_base()` to get the full object.
+
+Large numbers of points are best kept in a `CompactPoints` sequence, which holds
+all their coordinates in a single buffer and only creates points when accessed.
+"""
+
+from array import array
+from math import isnan
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import ControlPoint, Plane, Point, Vector
+from specklepy.objects.primitive import Interval
+from specklepy.objects.units import (
+    Units,
+    get_encoding_from_units,
+    get_units_from_encoding,
+)
+
+__all__ = [
+    "CompactGeometry",
+    "CompactPoint",
+    "CompactVector",
+    "CompactControlPoint",
+    "CompactInterval",
+    "CompactPlane",
+    "CompactPoints",
+]
+
+# units are stored as an index into this table, which grows with any custom units
+_UNITS: List[Optional[str]] = [None, *(u.value for u in Units)]
+_UNITS_INDEX: Dict[Optional[str], float] = {u: float(i) for i, u in enumerate(_UNITS)}
+
+
+def _units_code(units: Union[str, Units, None]) -> float:
+    if isinstance(units, Units):
+        units = units.value
+    code = _UNITS_INDEX.get(units)
+    if code is None:
+        code = _UNITS_INDEX[units] = float(len(_UNITS))
+        _UNITS.append(units)
+    return code
+
+
+def _restore(
+    cls: Type["CompactGeometry"],
+    values: List[float],
+    units: Optional[List[Optional[str]]] = None,
+):
+    if units is not None:
+        # the codes of custom units only hold in the process which made them
+        for position, unit in zip(cls._units_positions, units):
+            values[position] = _units_code(unit)
+    return array.__new__(cls, "d", values)
+
+
+class CompactGeometry(array):
+    """
+    The base of the compact geometry types. The values of the fields named in
+    `_fields` are followed by the code of the units.
+    """
+
+    __slots__ = ()
+
+    full_type: ClassVar[Type[Base]]
+    speckle_type: ClassVar[str]
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    # where the codes of units are among the values
+    _units_positions: ClassVar[Tuple[int, ...]] = (-1,)
+
+    def __init_subclass__(cls, full_type: Type[Base], **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.full_type = full_type
+        cls.speckle_type = full_type.speckle_type
+        for i, name in enumerate(cls._fields):
+            setattr(cls, name, property(lambda self, i=i: self[i]))
+
+    @property
+    def units(self) -> Optional[str]:
+        return _UNITS[int(self[-1])]
+
+    @classmethod
+    def from_base(cls, base: Base) -> "CompactGeometry":
+        """Creates the compact variant of a full object"""
+        return cls(*(getattr(base, name) for name in cls._fields), units=base.units)
+
+    def to_base(self) -> Base:
+        """Creates the full object this compact object stands in for"""
+        values = {name: self[i] for i, name in enumerate(self._fields)}
+        return self.full_type(**values, units=self.units)
+
+    def __reduce__(self):
+        # pickled with the units themselves, eg for the worker processes of a send
+        values = list(self)
+        units = [_UNITS[int(values[i])] for i in self._units_positions]
+        return _restore, (type(self), values, units)
+
+    def __reduce_ex__(self, protocol: int):
+        # `array` defines its own, which would be used over `__reduce__`
+        return self.__reduce__()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}: {getattr(self, name)}" for name in self._fields)
+        return f"{self.__class__.__name__}({values}, units: {self.units})"
+
+    __str__ = __repr__
+
+
+class CompactPoint(CompactGeometry, full_type=Point):
+    __slots__ = ()
+    _fields = ("x", "y", "z")
+
+    def __new__(
+        cls,
+        x: float = 0.0,
+        y: float = 0.0,
+        z: float = 0.0,
+        units: Union[str, Units, None] = None,
+    ) -> "CompactPoint":
+        return array.__new__(cls, "d", (x, y, z, _units_code(units)))
+
+    @classmethod
+    def from_list(cls, args: List[float]) -> "CompactPoint":
+        return cls(args[0], args[1], args[2])
+
+    def to_list(self) -> List[float]:
+        return [self[0], self[1], self[2]]
+
+
+class CompactVector(CompactPoint, full_type=Vector):
+    __slots__ = ()
+
+
+class CompactControlPoint(CompactGeometry, full_type=ControlPoint):
+    __slots__ = ()
+    _fields = ("x", "y", "z")
+
+    def __new__(
+        cls,
+        x: float = 0.0,
+        y: float = 0.0,
+        z: float = 0.0,
+        weight: Optional[float] = None,
+        units: Union[str, Units, None] = None,
+    ) -> "CompactControlPoint":
+        weight = float("nan") if weight is None else weight
+        return array.__new__(cls, "d", (x, y, z, weight, _units_code(units)))
+
+    @property
+    def weight(self) -> Optional[float]:
+        return None if isnan(self[3]) else self[3]
+
+    @classmethod
+    def from_base(cls, base: Base) -> "CompactControlPoint":
+        return cls(base.x, base.y, base.z, base.weight, base.units)
+
+    def to_base(self) -> ControlPoint:
+        return ControlPoint(
+            x=self[0], y=self[1], z=self[2], weight=self.weight, units=self.units
+        )
+
+    @classmethod
+    def from_list(cls, args: List[float]) -> "CompactControlPoint":
+        return cls(args[0], args[1], args[2])
+
+    def to_list(self) -> List[float]:
+        return [self[0], self[1], self[2]]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(x: {self[0]}, y: {self[1]}, z: {self[2]},"
+            f" weight: {self.weight}, units: {self.units})"
+        )
+
+
+class CompactInterval(CompactGeometry, full_type=Interval):
+    __slots__ = ()
+    _fields = ("start", "end")
+
+    def __new__(
+        cls,
+        start: float = 0.0,
+        end: float = 0.0,
+        units: Union[str, Units, None] = None,
+    ) -> "CompactInterval":
+        return array.__new__(cls, "d", (start, end, _units_code(units)))
+
+    def length(self) -> float:
+        return abs(self[0] - self[1])
+
+    @classmethod
+    def from_list(cls, args: List[Any]) -> "CompactInterval":
+        return cls(args[0], args[1])
+
+    def to_list(self) -> List[Any]:
+        return [self[0], self[1]]
+
+
+class CompactPlane(CompactGeometry, full_type=Plane):
+    """
+    Holds the origin, normal, xdir and ydir of the plane, each as x, y, z and the
+    code of their units, followed by the code of the units of the plane
+    """
+
+    __slots__ = ()
+    _parts: ClassVar[Tuple[Tuple[str, Type[CompactPoint]], ...]] = (
+        ("origin", CompactPoint),
+        ("normal", CompactVector),
+        ("xdir", CompactVector),
+        ("ydir", CompactVector),
+    )
+    _units_positions = (3, 7, 11, 15, 16)
+
+    def __new__(
+        cls,
+        origin: Union[Point, CompactPoint, None] = None,
+        normal: Union[Vector, CompactVector, None] = None,
+        xdir: Union[Vector, CompactVector, None] = None,
+        ydir: Union[Vector, CompactVector, None] = None,
+        units: Union[str, Units, None] = None,
+    ) -> "CompactPlane":
+        values = []
+        for part in (origin, normal, xdir, ydir):
+            if part is None:
+                values.extend((0.0, 0.0, 0.0, 0.0))
+            else:
+                values.extend((part.x, part.y, part.z, _units_code(part.units)))
+        values.append(_units_code(units))
+        return array.__new__(cls, "d", values)
+
+    @property
+    def origin(self) -> CompactPoint:
+        return _restore(CompactPoint, self[0:4])
+
+    @property
+    def normal(self) -> CompactVector:
+        return _restore(CompactVector, self[4:8])
+
+    @property
+    def xdir(self) -> CompactVector:
+        return _restore(CompactVector, self[8:12])
+
+    @property
+    def ydir(self) -> CompactVector:
+        return _restore(CompactVector, self[12:16])
+
+    @classmethod
+    def from_base(cls, base: Base) -> "CompactPlane":
+        return cls(base.origin, base.normal, base.xdir, base.ydir, base.units)
+
+    def to_base(self) -> Plane:
+        parts = {name: getattr(self, name).to_base() for name, _ in self._parts}
+        return Plane(**parts, units=self.units)
+
+    @classmethod
+    def from_list(cls, args: List[Any]) -> "CompactPlane":
+        return cls(
+            origin=CompactPoint.from_list(args[:3]),
+            normal=CompactVector.from_list(args[3:6]),
+            xdir=CompactVector.from_list(args[6:9]),
+            ydir=CompactVector.from_list(args[9:12]),
+            units=get_units_from_encoding(args[-1]),
+        )
+
+    def to_list(self) -> List[Any]:
+        return [
+            *self[0:3],
+            *self[4:7],
+            *self[8:11],
+            *self[12:15],
+            get_encoding_from_units(self.units),
+        ]
+
+    def __repr__(self) -> str:
+        parts = ", ".join(f"{name}: {getattr(self, name)}" for name, _ in self._parts)
+        return f"{self.__class__.__name__}({parts}, units: {self.units})"
+
+
+class CompactPoints:
+    """
+    A sequence of points which share their units, with all the coordinates held in
+    one flat buffer. Indexing it creates a `CompactPoint`, and it serializes and
+    validates as a list of full Points.
+    """
+
+    __slots__ = ("coordinates", "units")
+
+    item_full_type: ClassVar[Type[Base]] = Point
+
+    def __init__(
+        self,
+        coordinates: Iterable[float] = (),
+        units: Union[str, Units, None] = None,
+    ) -> None:
+        self.coordinates = array("d", coordinates)
+        if len(self.coordinates) % 3:
+            raise ValueError("Points array malformed: length%3 != 0.")
+        self.units = units.value if isinstance(units, Units) else units
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[Union[Point, CompactPoint]]
+    ) -> "CompactPoints":
+        """Packs the given points, taking the units of the first one"""
+        compact = cls()
+        for point in points:
+            if not compact.coordinates:
+                compact.units = point.units
+            compact.append(point)
+        return compact
+
+    def append(self, point: Union[Point, CompactPoint]) -> None:
+        self.coordinates.extend((point.x, point.y, point.z))
+
+    def to_base(self) -> List[Point]:
+        """Creates the list of full Points this sequence stands in for"""
+        values = iter(self.coordinates)
+        return [
+            Point(x=v, y=next(values), z=next(values), units=self.units) for v in values
+        ]
+
+    def to_list(self) -> List[float]:
+        return self.coordinates.tolist()
+
+    def __len__(self) -> int:
+        return len(self.coordinates) // 3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            compact = CompactPoints(units=self.units)
+            for i in range(start, stop, step):
+                compact.coordinates.extend(self.coordinates[i * 3 : i * 3 + 3])
+            return compact
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactPoints index out of range")
+        i = index * 3
+        return CompactPoint(*self.coordinates[i : i + 3], units=self.units)
+
+    def __iter__(self) -> Iterator[CompactPoint]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"CompactPoints(count: {len(self)}, units: {self.units})"
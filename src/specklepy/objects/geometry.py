@@ -288,14 +288,24 @@ class Polyline(Base, speckle_type=GEOMETRY + "Polyline", chunkable={"value": 200
             get_encoding_from_units(self._units),
         ]
 
-    def as_points(self) -> List[Point]:
-        """Converts the `value` attribute to a list of Points"""
-        if not self.value:
+    def as_points(self, compact: bool = False) -> List[Point]:
+        """Converts the `value` attribute to a list of Points
+
+        Arguments:
+            compact {bool} -- if True, returns a `CompactPoints` sequence which
+                takes up a fraction of the memory of a list of Points
+        """
+        if self.value is None or not len(self.value):
             return
 
         if len(self.value) % 3:
             raise ValueError("Points array malformed: length%3 != 0.")
 
+        if compact:
+            from specklepy.objects.compact import CompactPoints
+
+            return CompactPoints(self.value, units=self.units)
+
         values = iter(self.value)
         return [
             Point(x=v, y=next(values), z=next(values), units=self.units) for v in values
@@ -347,14 +357,24 @@ class Curve(
     area: Optional[float] = None
     length: Optional[float] = None
 
-    def as_points(self) -> List[Point]:
-        """Converts the `value` attribute to a list of Points"""
-        if not self.points:
+    def as_points(self, compact: bool = False) -> List[Point]:
+        """Converts the `value` attribute to a list of Points
+
+        Arguments:
+            compact {bool} -- if True, returns a `CompactPoints` sequence which
+                takes up a fraction of the memory of a list of Points
+        """
+        if self.points is None or not len(self.points):
             return
 
         if len(self.points) % 3:
             raise ValueError("Points array malformed: length%3 != 0.")
 
+        if compact:
+            from specklepy.objects.compact import CompactPoints
+
+            return CompactPoints(self.points, units=self.units)
+
         values = iter(self.points)
         return [
             Point(x=v, y=next(values), z=next(values), units=self.units) for v in values
@@ -481,8 +501,10 @@ class Mesh(
         return cls(
             vertices=vertices,
             faces=faces,
-            colors=colors or [],
-            textureCoordinates=texture_coordinates or [],
+            colors=colors if colors is not None else [],
+            textureCoordinates=(
+                texture_coordinates if texture_coordinates is not None else []
+            ),
         )
 
 
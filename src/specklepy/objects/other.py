@@ -4,7 +4,7 @@ from deprecated import deprecated
 
 from specklepy.objects.geometry import Plane, Point, Polyline, Vector
 
-from .base import Base
+from .base import Base, numeric_buffer_type
 
 OTHER = "Objects.Other."
 OTHER_REVIT = OTHER + "Revit."
@@ -116,7 +116,9 @@ class Transform(
     @matrix.setter
     def matrix(self, value: List[float]) -> None:
         try:
-            value = [float(x) for x in value]
+            # float buffers are kept as they are, everything else becomes floats
+            if numeric_buffer_type(value) is not float:
+                value = [float(x) for x in value]
         except (ValueError, TypeError) as error:
             raise ValueError(
                 "Could not create a Transform object with the requested value. Input"
@@ -143,7 +145,7 @@ class Transform(
 
     @property
     def is_identity(self) -> bool:
-        return self._value == IDENTITY_TRANSFORM
+        return self._value is not None and list(self._value) == IDENTITY_TRANSFORM
 
     def apply_to_point(self, point: Point) -> Point:
         """Transform a single speckle Point
@@ -248,7 +250,7 @@ class Transform(
         Returns:
             Transform -- a complete transform object
         """
-        if not value:
+        if value is None or not len(value):
             value = IDENTITY_TRANSFORM
         return cls(value=value)
 
@@ -1,62 +1,197 @@
 import hashlib
 import re
 import warnings
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-from uuid import uuid4
+from functools import partial
+from typing import (
+    Any,
+    Container,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from warnings import warn
 
-import ujson
-
 # import for serialization
 from specklepy.logging.exceptions import SpeckleException, SpeckleWarning
-from specklepy.objects.base import Base, DataChunk
+from specklepy.objects.base import Base, DataChunk, numeric_buffer_type
+from specklepy.objects.compact import CompactGeometry, CompactPoints
+from specklepy.serialization.json_codecs import AbstractJsonCodec, get_codec
+from specklepy.serialization.lazy import LazyChunkedList, LazyReference
+from specklepy.serialization.serialization_cache import (
+    CachedSubtree,
+    SerializationCache,
+)
+from specklepy.serialization.type_decoder import TypeDecoder
 from specklepy.transports.abstract_transport import AbstractTransport
+from specklepy.transports.memory import MemoryTransport
 
 PRIMITIVES = (int, float, str, bool)
+# exact types which need no conversion before being encoded
+PLAIN_TYPES = frozenset((int, float, str, bool, type(None)))
 
 
 def hash_obj(obj: Any) -> str:
-    return hashlib.sha256(ujson.dumps(obj).encode()).hexdigest()[:32]
+    return hash_payload(get_codec().dumps(obj))
+
+
+def hash_payload(payload: str) -> str:
+    """Gets the id of an object from its encoding, made while its id is empty"""
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def splice_id(
+    obj_id: str, payload: str, closure: Optional[Dict[str, int]] = None
+) -> str:
+    """
+    Splices the id and closure of an object into the encoding it was hashed from,
+    which starts with an empty id. The result is the same as encoding the object
+    once both are set, as the closure is always its last key.
+    """
+    if not closure:
+        return f'{{"id":"{obj_id}"{payload[8:]}'
+    return (
+        f'{{"id":"{obj_id}"{payload[8:-1]},"__closure":{get_codec().dumps(closure)}}}'
+    )
+
+
+def _is_plain_sequence(value: Any) -> bool:
+    """
+    Whether the value is a list of plain values or a flat numeric buffer
+    (`array.array`, `memoryview` or a 1d NumPy array) which can be sliced and
+    encoded in bulk
+    """
+    if isinstance(value, list):
+        # `set(map(...))` checks every item without a python level loop
+        return set(map(type, value)) <= PLAIN_TYPES
+    return numeric_buffer_type(value) is not None
+
+
+def _numeric_item_type(t: Any) -> Optional[type]:
+    """Gets the item type of a (optional) `List[float]` or `List[int]` annotation"""
+    origin = getattr(t, "__origin__", None)
+    if origin is Union:
+        for arg in t.__args__:
+            item_type = _numeric_item_type(arg)
+            if item_type:
+                return item_type
+    elif origin is list and getattr(t, "__args__", None):
+        item_type = t.__args__[0]
+        if item_type in (float, int):
+            return item_type
+    return None
 
 
 def safe_json_loads(obj: str, obj_id=None) -> Any:
-    try:
-        return ujson.loads(obj)
-    except ValueError as err:
-        import json
+    """Decodes an object with the default codec, keeping big integers exact"""
+    return get_codec().loads(obj)
 
-        warn(
-            f"Failed to deserialise object (id: {obj_id}). This is likely a ujson big"
-            f" int error - falling back to json. \nError: {err}",
-            SpeckleWarning,
+
+def _serialize_detached(
+    base: Base, codec: str
+) -> Tuple[str, Dict[str, int], List[Tuple[str, str]], Dict[str, Dict[str, int]]]:
+    """Worker process entry point for serializing a detached subtree"""
+    transport = MemoryTransport()
+    serializer = BaseObjectSerializer(write_transports=[transport], codec=codec)
+    obj_id, obj = serializer.traverse_base(base)
+    return (
+        obj_id,
+        obj.get("__closure", {}),
+        list(transport.objects.items()),
+        serializer.closure_table,
+    )
+
+
+def _is_reference(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("speckle_type") == "reference"
+
+
+def _infer_numeric_type(values: List[Any]) -> Optional[type]:
+    """Gets the item type of a list of only ints, or of only ints and floats"""
+    value_types = set(map(type, values))
+    if value_types and value_types <= {int}:
+        return int
+    if value_types and value_types <= {int, float}:
+        return float
+    return None
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError as ex:
+        raise SpeckleException(
+            "NumPy must be installed to receive numeric lists as NumPy arrays", ex
         )
-        return json.loads(obj)
+    return np
 
 
 class BaseObjectSerializer:
     read_transport: AbstractTransport
     write_transports: List[AbstractTransport]
-    detach_lineage: List[bool]  # tracks depth and whether or not to detach
-    lineage: List[str]  # keeps track of hash chain through the object tree
-    family_tree: Dict[str, Dict[str, int]]
+    # the closure of each Base currently being traversed, from the root down.
+    # closures map child ids to the depth of the frame they were detached from
+    closure_stack: List[Dict[str, int]]
     closure_table: Dict[str, Dict[str, int]]
     deserialized: Dict[
         str, Base
     ]  # holds deserialized objects so objects with same id return the same instance
+    lazy: bool  # defer reading detached children until they are first used
+    max_workers: Optional[int]  # processes used to serialize detached list items
+    # receive typed numeric lists as "array" (`array.array`) or "numpy" arrays
+    numeric_arrays: Optional[str]
+    # how many objects from the root closure to read from the transport at once
+    prefetch_size: int
+    # skip validating the values of received objects, for data this SDK produced
+    trusted: bool
+    # remembers the detached subtrees of previous traversals, see `SerializationCache`
+    cache: Optional[SerializationCache]
+    # the ids of objects already on the target, eg a `KnownObjectsIndex`, which
+    # are not written to the transports keeping the same index
+    known_objects: Optional[Container[str]]
+    # encodes and decodes objects, see `json_codecs`
+    codec: AbstractJsonCodec
 
     def __init__(
         self,
         write_transports: Optional[List[AbstractTransport]] = None,
         read_transport: Optional[AbstractTransport] = None,
+        lazy: bool = False,
+        max_workers: Optional[int] = None,
+        numeric_arrays: Optional[str] = None,
+        prefetch_size: int = 1000,
+        trusted: bool = False,
+        cache: Optional[SerializationCache] = None,
+        known_objects: Optional[Container[str]] = None,
+        codec: Optional[Union[str, AbstractJsonCodec]] = None,
     ) -> None:
+        if numeric_arrays not in (None, "array", "numpy"):
+            raise SpeckleException(
+                f"Unknown numeric_arrays option '{numeric_arrays}': expected either"
+                " 'array' or 'numpy'"
+            )
         self.write_transports = write_transports or []
         self.read_transport = read_transport
-        self.detach_lineage = []
-        self.lineage = []
-        self.family_tree = {}
+        self.lazy = lazy
+        self.max_workers = max_workers
+        self.numeric_arrays = numeric_arrays
+        self.prefetch_size = prefetch_size
+        self.trusted = trusted
+        self.cache = cache
+        self.known_objects = known_objects
+        self.codec = get_codec(codec)
+        self._executor: Optional[Executor] = None
+        self._root_serialized: Tuple[Optional[str], Optional[str]] = None, None
+        self.closure_stack = []
         self.closure_table = {}
         self.deserialized = {}
+        self.__reset_reader()
 
     def write_json(self, base: Base):
         """Serializes a given base object into a json string
@@ -69,8 +204,10 @@ class BaseObjectSerializer:
         """
 
         obj_id, obj = self.traverse_base(base)
+        root_id, serialized = self._root_serialized
+        self._root_serialized = None, None
 
-        return obj_id, ujson.dumps(obj)
+        return obj_id, serialized if root_id == obj_id else self.codec.dumps(obj)
 
     def traverse_base(self, base: Base) -> Tuple[str, Dict[str, Any]]:
         """Decomposes the given base object and builds a serializable dictionary
@@ -88,7 +225,18 @@ class BaseObjectSerializer:
             for wt in self.write_transports:
                 wt.begin_write()
 
-        obj_id, obj = self._traverse_base(base)
+        # detached subtrees are only handed out to worker processes when there is
+        # somewhere to write them to
+        if self.write_transports and self.max_workers and self.max_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            obj_id, obj = self._traverse_base(base)
+        finally:
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+            self._memo = {}
+            self._saved = set()
 
         if self.write_transports:
             for wt in self.write_transports:
@@ -96,21 +244,190 @@ class BaseObjectSerializer:
 
         return obj_id, obj
 
-    def _traverse_base(self, base: Base) -> Tuple[str, Dict]:
-        if not self.detach_lineage:
-            self.detach_lineage = [True]
+    def _traverse_base(self, base: Base, detached: bool = True) -> Tuple[str, Dict]:
+        return self._run(self._base_frame(base, detached))
+
+    def _run(self, frame: Generator) -> Any:
+        """
+        Drives a traversal frame to completion without recursing.
+
+        Frames are generators which yield a `(base, detach)` request whenever they
+        reach a child Base. A new frame is pushed onto an explicit stack for the
+        child, and its `(id, object)` result is sent back to the waiting parent
+        once it completes. This keeps the Python call stack flat no matter how
+        deeply the objects are nested.
+
+        A Base which appears more than once is only traversed the first time: its
+        result is remembered for the rest of the traversal, unless a cache is used
+        which already remembers it.
+        """
+        stack = [frame]
+        # where the logs of each frame start, if its subtree is to be cached
+        marks: List[Optional[Tuple[int, int, int]]] = [None]
+        # the Base of each frame and whether it is detached, if it is to be memoized
+        keys: List[Optional[Tuple[Base, bool]]] = [None]
+        result = None
+        while True:
+            try:
+                child, detach = stack[-1].send(result)
+            except StopIteration as done:
+                stack.pop()
+                mark = marks.pop()
+                if mark is not None:
+                    self._cache_subtree(mark, *done.value)
+                key = keys.pop()
+                if key is not None:
+                    obj_id, obj = done.value
+                    self._memoize(*key, obj_id, obj, obj.get("__closure", {}))
+                if not stack:
+                    return done.value
+                result = done.value
+                continue
+
+            mark = key = None
+            if self.cache is None:
+                memo = self._current_memo(child, detach)
+                if memo is not None:
+                    result = self._replay_memo(memo)
+                    continue
+                # chunks are made afresh by each traversal
+                if type(child) is not DataChunk:
+                    key = child, detach
+            elif detach and id(child) not in self._transient:
+                entry = self.cache.get(child)
+                if entry is not None:
+                    result = self._replay_subtree(entry)
+                    continue
+                mark = len(self._written), len(self._visited), len(self._closed)
+            stack.append(self._base_frame(child, detach))
+            marks.append(mark)
+            keys.append(key)
+            result = None
+
+    def _memoize(
+        self,
+        base: Base,
+        detach: bool,
+        obj_id: str,
+        obj: Optional[Dict[str, Any]],
+        closure: Dict[str, int],
+    ) -> None:
+        """
+        Remembers the result of traversing the given Base for the rest of the
+        traversal. The Base is kept alive so its identity is not reused.
+        """
+        self._memo[(id(base), detach)] = (
+            base,
+            getattr(base, "_version", 0),
+            obj_id,
+            obj,
+            closure,
+        )
+
+    def _current_memo(
+        self, base: Base, detach: bool
+    ) -> Optional[Tuple[Base, int, str, Optional[Dict[str, Any]], Dict[str, int]]]:
+        """The memo of the given Base, unless it changed since it was memoized"""
+        memo = self._memo.get((id(base), detach))
+        if memo is not None and memo[1] == getattr(base, "_version", 0):
+            return memo
+        return None
+
+    def _replay_memo(
+        self, memo: Tuple[Base, int, str, Optional[Dict[str, Any]], Dict[str, int]]
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Merges the closure of a Base traversed earlier into the current frame, as
+        if it had just been traversed again. Its objects were already written.
+        """
+        _, _, obj_id, obj, closure = memo
+        if closure:
+            depth = len(self.closure_stack)
+            self._merge_closure({ref: d + depth for ref, d in closure.items()})
+        return obj_id, obj
+
+    def _cache_subtree(
+        self, mark: Tuple[int, int, int], obj_id: str, obj: Dict[str, Any]
+    ) -> None:
+        """Caches the subtree traversed since the given positions in the logs"""
+        written, visited, closed = mark
+        (base, version), *versions = self._visited[visited:]
+        objects = self._written[written:]
+        # inline objects have closures too, although they aren't written
+        closure_table = {id: self.closure_table[id] for id in self._closed[closed:]}
+        self.cache.put(
+            base,
+            version,
+            versions,
+            obj_id,
+            obj.get("__closure", {}),
+            objects,
+            closure_table,
+        )
+
+    def _replay_subtree(self, entry: CachedSubtree) -> Tuple[str, None]:
+        """
+        Writes a cached subtree and merges its closure into the current frame, as
+        if it had just been traversed. Detached objects are only ever referenced by
+        id, so there is no serialized object to hand back.
+        """
+        if self.known_objects is not None and entry.obj_id in self.known_objects:
+            # the whole subtree is on the target already, only the other
+            # transports need its objects
+            self._written.extend(entry.objects)
+            transports = self._untracked_transports()
+            for obj_id, serialized_object in entry.objects:
+                if obj_id not in self._saved:
+                    self._saved.add(obj_id)
+                    for t in transports:
+                        t.save_object(id=obj_id, serialized_object=serialized_object)
+        else:
+            for obj_id, serialized_object in entry.objects:
+                self._save(obj_id, serialized_object)
+        self._visited.append((entry.ref(), entry.version))
+        self._visited.extend(entry.versions)
+        self.closure_table.update(entry.closure_table)
+        self._closed.extend(entry.closure_table)
+        depth = len(self.closure_stack)
+        self._merge_closure({ref: d + depth for ref, d in entry.closure.items()})
+        return entry.obj_id, None
+
+    def _save(self, obj_id: str, serialized_object: str) -> None:
+        if self.cache is not None:
+            self._written.append((obj_id, serialized_object))
+        # equal objects have the same id, so each is only written once
+        if obj_id in self._saved:
+            return
+        self._saved.add(obj_id)
+        transports = self.write_transports
+        if self.known_objects is not None and obj_id in self.known_objects:
+            transports = self._untracked_transports()
+        for t in transports:
+            t.save_object(id=obj_id, serialized_object=serialized_object)
+
+    def _untracked_transports(self) -> List[AbstractTransport]:
+        """
+        The write transports which the known objects index does not describe. Only
+        the transports keeping the same index (ie a `ServerTransport` given it)
+        write to the stream it tracks, so all the others get every object.
+        """
+        return [
+            t
+            for t in self.write_transports
+            if getattr(t, "known_objects", None) is not self.known_objects
+        ]
+
+    def _base_frame(self, base: Base, detached: bool) -> Generator:
+        self.closure_stack.append({})
+        depth = len(self.closure_stack)
+        if self.cache is not None and id(base) not in self._transient:
+            self._visited.append((base, getattr(base, "_version", 0)))
 
-        self.lineage.append(uuid4().hex)
         object_builder = {"id": "", "speckle_type": "Base", "totalChildrenCount": 0}
         object_builder.update(speckle_type=base.speckle_type)
         obj, props = base, base.get_serializable_attributes()
 
-        while props:
-            prop = props.pop(0)
-            value = getattr(obj, prop, None)
-            chunkable = False
-            detach = False
-
+        for prop in props:
             # skip props marked to be ignored with "__" or "_"
             if prop.startswith(("__", "_")):
                 continue
@@ -119,6 +436,10 @@ class BaseObjectSerializer:
             if prop == "id":
                 continue
 
+            value = getattr(obj, prop, None)
+            chunkable = False
+            detach = False
+
             # only bother with chunking and detaching if there is a write transport
             if self.write_transports:
                 dynamic_chunk_match = prop.startswith("@") and re.match(
@@ -140,6 +461,9 @@ class BaseObjectSerializer:
                 object_builder[prop] = value
                 continue
 
+            if isinstance(value, (CompactGeometry, CompactPoints)):
+                value = value.to_base()
+
             # NOTE: for dynamic props, this won't be re-serialised as an enum but as an int
             if isinstance(value, Enum):
                 object_builder[prop] = value.value
@@ -147,17 +471,20 @@ class BaseObjectSerializer:
 
             # 2. handle Base objects
             elif isinstance(value, Base):
-                child_obj = self.traverse_value(value, detach=detach)
+                ref_id, child_obj = yield value, detach
                 if detach and self.write_transports:
-                    ref_id = child_obj["id"]
                     object_builder[prop] = self.detach_helper(ref_id=ref_id)
                 else:
                     object_builder[prop] = child_obj
 
             # 3. handle chunkable props
             elif chunkable and self.write_transports:
-                chunks = []
                 max_size = base._chunkable[prop]
+                if _is_plain_sequence(value):
+                    object_builder[prop] = self._chunk_plain_sequence(value, max_size)
+                    continue
+
+                chunks = []
                 chunk = DataChunk()
                 for count, item in enumerate(value):
                     if count and count % max_size == 0:
@@ -165,45 +492,84 @@ class BaseObjectSerializer:
                         chunk = DataChunk()
                     chunk.data.append(item)
                 chunks.append(chunk)
+                if self.cache is not None:
+                    self._transient.update(map(id, chunks))
 
                 chunk_refs = []
                 for c in chunks:
-                    self.detach_lineage.append(detach)
-                    ref_id, _ = self._traverse_base(c)
+                    ref_id, _ = yield c, detach
                     ref_obj = self.detach_helper(ref_id=ref_id)
                     chunk_refs.append(ref_obj)
                 object_builder[prop] = chunk_refs
 
             # 4. handle all other cases
             else:
-                child_obj = self.traverse_value(value, detach)
-                object_builder[prop] = child_obj
+                object_builder[prop] = yield from self._value_frame(value, detach)
 
-        closure = {}
         # add closures & children count to the object
-        detached = self.detach_lineage.pop()
-        if self.lineage[-1] in self.family_tree:
-            closure = {
-                ref: depth - len(self.detach_lineage)
-                for ref, depth in self.family_tree[self.lineage[-1]].items()
-            }
+        closure_refs = self.closure_stack.pop()
+        closure = {
+            ref: ref_depth - depth + 1 for ref, ref_depth in closure_refs.items()
+        }
         object_builder["totalChildrenCount"] = len(closure)
 
-        obj_id = hash_obj(object_builder)
+        self._merge_closure(closure_refs)
+
+        # the object is only encoded once, for both its id and the transports
+        payload = self.codec.dumps(object_builder)
+        obj_id = hash_payload(payload)
 
         object_builder["id"] = obj_id
         if closure:
             object_builder["__closure"] = self.closure_table[obj_id] = closure
+            if self.cache is not None:
+                self._closed.append(obj_id)
 
         # write detached or root objects to transports
-        if detached and self.write_transports:
-            for t in self.write_transports:
-                t.save_object(id=obj_id, serialized_object=ujson.dumps(object_builder))
-
-        del self.lineage[-1]
+        if detached:
+            serialized = splice_id(obj_id, payload, closure)
+            # the last one is the root, which `write_json` hands back
+            self._root_serialized = obj_id, serialized
+            if self.write_transports:
+                self._save(obj_id, serialized)
 
         return obj_id, object_builder
 
+    def _chunk_plain_sequence(self, value: Any, max_size: int) -> List[Dict[str, str]]:
+        """
+        Splits a plain sequence into detached `DataChunk`s without going through
+        the generic traversal. Each chunk is a slice of the sequence which is
+        encoded once: the id is hashed from the payload and then spliced into it.
+        The chunks are identical to the ones built item by item.
+        """
+        if isinstance(value, array):
+            # slices of a memoryview share the array's buffer instead of copying it
+            value = memoryview(value)
+
+        # the generic chunking never splits before the first item, so a zero size
+        # still makes one chunk of an empty sequence
+        max_size = max(max_size, 1)
+        chunk_refs = []
+        for start in range(0, len(value) or 1, max_size):
+            data = value[start : start + max_size]
+            if not isinstance(data, list):
+                data = data.tolist()
+            payload = self.codec.dumps(
+                {
+                    "id": "",
+                    "speckle_type": DataChunk.speckle_type,
+                    "totalChildrenCount": 0,
+                    "applicationId": None,
+                    "data": data,
+                    "units": None,
+                }
+            )
+            obj_id = hash_payload(payload)
+            serialized = splice_id(obj_id, payload)
+            self._save(obj_id, serialized)
+            chunk_refs.append(self.detach_helper(ref_id=obj_id))
+        return chunk_refs
+
     def traverse_value(self, obj: Any, detach: bool = False) -> Any:
         """Decomposes a given object and constructs a serializable object or dictionary
 
@@ -213,6 +579,9 @@ class BaseObjectSerializer:
         Returns:
             Any -- a serializable version of the given object
         """
+        return self._run(self._value_frame(obj, detach))
+
+    def _value_frame(self, obj: Any, detach: bool = False) -> Generator:
         if obj is None:
             return None
         if isinstance(obj, PRIMITIVES):
@@ -222,31 +591,47 @@ class BaseObjectSerializer:
         if isinstance(obj, Enum):
             return obj.value
 
+        elif isinstance(obj, (CompactGeometry, CompactPoints)):
+            return (yield from self._value_frame(obj.to_base(), detach))
+
         elif isinstance(obj, (list, tuple, set)):
-            if not detach:
-                return [self.traverse_value(o) for o in obj]
+            # cached subtrees are tracked as they are traversed, so not in workers
+            if (
+                detach
+                and self._executor
+                and self.cache is None
+                and sum(isinstance(o, (Base, CompactGeometry)) for o in obj) > 1
+            ):
+                return (yield from self._parallel_list_frame(obj))
 
-            detached_list = []
+            serialized_list = []
             for o in obj:
-                if isinstance(o, Base):
-                    self.detach_lineage.append(detach)
-                    ref_id, _ = self._traverse_base(o)
-                    detached_list.append(self.detach_helper(ref_id=ref_id))
+                if o is None or isinstance(o, PRIMITIVES):
+                    serialized_list.append(o)
+                elif isinstance(o, (Base, CompactGeometry)):
+                    if isinstance(o, CompactGeometry):
+                        o = o.to_base()
+                    ref_id, base_obj = yield o, detach
+                    serialized_list.append(
+                        self.detach_helper(ref_id=ref_id) if detach else base_obj
+                    )
                 else:
-                    detached_list.append(self.traverse_value(o, detach))
-            return detached_list
+                    serialized_list.append((yield from self._value_frame(o, detach)))
+            return serialized_list
+
+        elif numeric_buffer_type(obj) is not None:
+            return obj.tolist()
 
         elif isinstance(obj, dict):
             for k, v in obj.items():
                 if isinstance(v, PRIMITIVES) or v is None:
                     continue
                 else:
-                    obj[k] = self.traverse_value(v)
+                    obj[k] = yield from self._value_frame(v)
             return obj
 
         elif isinstance(obj, Base):
-            self.detach_lineage.append(detach)
-            _, base_obj = self._traverse_base(obj)
+            _, base_obj = yield obj, detach
             return base_obj
 
         else:
@@ -261,6 +646,67 @@ class BaseObjectSerializer:
 
                 return str(obj)
 
+    def _parallel_list_frame(self, obj: Any) -> Generator:
+        """
+        Serializes the Bases of a detached list in the worker processes.
+
+        Each item is an independent subtree, so workers return its id, closure and
+        serialized objects. These are written to the transports and merged into the
+        closure of the current frame in list order, exactly as if they had been
+        traversed here.
+        """
+        items = [o.to_base() if isinstance(o, CompactGeometry) else o for o in obj]
+        # repeated items and items traversed earlier are only serialized once
+        bases = {
+            id(o): o
+            for o in items
+            if isinstance(o, Base) and self._current_memo(o, True) is None
+        }
+        chunksize = max(1, len(bases) // (self.max_workers * 4))
+        results = self._executor.map(
+            partial(_serialize_detached, codec=self.codec.name),
+            bases.values(),
+            chunksize=chunksize,
+        )
+        depth = len(self.closure_stack)
+
+        serialized_list = []
+        for o in items:
+            if o is None or isinstance(o, PRIMITIVES):
+                serialized_list.append(o)
+            elif isinstance(o, Base):
+                memo = self._current_memo(o, True)
+                if memo is not None:
+                    ref_id, _ = self._replay_memo(memo)
+                    serialized_list.append(self.detach_helper(ref_id=ref_id))
+                    continue
+                ref_id, closure, objects, closure_table = next(results)
+                for obj_id, serialized_object in objects:
+                    self._save(obj_id, serialized_object)
+                self.closure_table.update(closure_table)
+                # the worker's closure depths are relative to the item itself
+                self._merge_closure({ref: d + depth for ref, d in closure.items()})
+                self._memoize(o, True, ref_id, None, closure)
+                serialized_list.append(self.detach_helper(ref_id=ref_id))
+            else:
+                serialized_list.append((yield from self._value_frame(o, True)))
+        return serialized_list
+
+    def _merge_closure(self, closure_refs: Dict[str, int]) -> None:
+        """
+        Hands the references of a finished object up to its parent frame: its
+        detached descendants are part of every ancestor's closure too
+        """
+        if not self.closure_stack or not closure_refs:
+            return
+        parent_refs = self.closure_stack[-1]
+        if not parent_refs:
+            self.closure_stack[-1] = closure_refs
+            return
+        for ref, ref_depth in closure_refs.items():
+            if parent_refs.get(ref, ref_depth + 1) > ref_depth:
+                parent_refs[ref] = ref_depth
+
     def detach_helper(self, ref_id: str) -> Dict[str, str]:
         """
         Helper to keep track of detached objects and their depth in the family tree
@@ -272,14 +718,10 @@ class BaseObjectSerializer:
         Returns:
             dict -- a reference object to be inserted into the given object's parent
         """
-
-        for parent in self.lineage:
-            if parent not in self.family_tree:
-                self.family_tree[parent] = {}
-            if ref_id not in self.family_tree[parent] or self.family_tree[parent][
-                ref_id
-            ] > len(self.detach_lineage):
-                self.family_tree[parent][ref_id] = len(self.detach_lineage)
+        closure_refs = self.closure_stack[-1]
+        depth = len(self.closure_stack)
+        if closure_refs.get(ref_id, depth + 1) > depth:
+            closure_refs[ref_id] = depth
 
         return {
             "referencedId": ref_id,
@@ -288,13 +730,33 @@ class BaseObjectSerializer:
 
     def __reset_writer(self) -> None:
         """
-        Reinitializes the lineage, and other variables that get used during the json
+        Reinitializes the closure tracking variables that get used during the json
         writing process
         """
-        self.detach_lineage = [True]
-        self.lineage = []
-        self.family_tree = {}
+        self.closure_stack = []
         self.closure_table = {}
+        # logs of the objects written, the Bases traversed and the ids added to
+        # the closure table, for the cache
+        self._written: List[Tuple[str, str]] = []
+        self._visited: List[Tuple[Base, int]] = []
+        self._closed: List[str] = []
+        # the ids of the chunks made while traversing, which are not cached
+        self._transient: Set[int] = set()
+        # the Bases traversed so far, by identity and whether they were detached
+        self._memo: Dict[Tuple[int, bool], Tuple] = {}
+        # the ids of the objects written so far
+        self._saved: Set[str] = set()
+
+    def __reset_reader(self) -> None:
+        """
+        Reinitializes the bounded cache of objects read ahead from the read transport
+        """
+        self._prefetched: Dict[str, str] = {}
+        self._prefetch_queue: List[str] = []
+        self._prefetch_position = 0
+        self._read_ids: Set[str] = set()
+        # how the objects of each `speckle_type` read so far are recomposed
+        self._decoders: Dict[str, TypeDecoder] = {}
 
     def read_json(self, obj_string: str) -> Base:
         """Recomposes a Base object from the string representation of the object
@@ -309,8 +771,12 @@ class BaseObjectSerializer:
             return None
 
         self.deserialized = {}
-        obj = safe_json_loads(obj_string)
-        return self.recompose_base(obj=obj)
+        self.__reset_reader()
+        obj = self.codec.loads(obj_string)
+        try:
+            return self.recompose_base(obj=obj)
+        finally:
+            self.__reset_reader()
 
     def recompose_base(self, obj: dict) -> Base:
         """Steps through a base object dictionary and recomposes the base object
@@ -325,12 +791,14 @@ class BaseObjectSerializer:
         if not obj:
             return
         if isinstance(obj, str):
-            obj = safe_json_loads(obj)
+            obj = self.codec.loads(obj)
 
         if "id" in obj and obj["id"] in self.deserialized:
             return self.deserialized[obj["id"]]
 
         if "speckle_type" in obj and obj["speckle_type"] == "reference":
+            if obj.get("referencedId") in self.deserialized:
+                return self.deserialized[obj["referencedId"]]
             obj = self.get_child(obj=obj)
 
         speckle_type = obj.get("speckle_type")
@@ -338,11 +806,10 @@ class BaseObjectSerializer:
         if not speckle_type:
             return obj
 
-        # get the registered type from base register.
-        object_type = Base.get_registered_type(speckle_type)
-
-        # initialise the base object using `speckle_type` fall back to base if needed
-        base = object_type() if object_type else Base.of_type(speckle_type=speckle_type)
+        decoder = self._decoders.get(speckle_type)
+        if decoder is None:
+            decoder = self._decoders[speckle_type] = TypeDecoder(speckle_type)
+        base = decoder.create()
         # get total children count
         if "__closure" in obj:
             if not self.read_transport:
@@ -351,37 +818,108 @@ class BaseObjectSerializer:
                 )
             closure = obj.pop("__closure")
             base.totalChildrenCount = len(closure)
-
+            # the root closure holds every descendant, with children listed after
+            # their own children, so it doubles as the read-ahead order
+            if self.prefetch_size > 1 and not self.lazy and not self._prefetch_queue:
+                self._prefetch_queue = list(closure)
+
+        if self.trusted and not self.lazy:
+            decoder.assign_trusted(base, self._recompose_values(base, decoder, obj))
+            if "id" in obj:
+                self.deserialized[obj["id"]] = base
+            return base
+
+        set_attr = (
+            partial(decoder.set_trusted, base) if self.trusted else base.__setattr__
+        )
         for prop, value in obj.items():
             # 1. handle primitives (ints, floats, strings, and bools) or None
             if isinstance(value, PRIMITIVES) or value is None:
-                base.__setattr__(prop, value)
+                set_attr(prop, value)
                 continue
 
             # 2. handle referenced child objects
             elif "referencedId" in value:
-                ref_id = value["referencedId"]
-                ref_obj_str = self.read_transport.get_object(id=ref_id)
-                if ref_obj_str:
-                    ref_obj = safe_json_loads(ref_obj_str, ref_id)
-                    base.__setattr__(prop, self.recompose_base(obj=ref_obj))
-                else:
-                    warnings.warn(
-                        f"Could not find the referenced child object of id `{ref_id}`"
-                        f" in the given read transport: {self.read_transport.name}",
-                        SpeckleWarning,
+                if self.lazy:
+                    self._set_lazy_attr(
+                        base,
+                        prop,
+                        LazyReference(value["referencedId"], self._resolve_reference),
                     )
-                    base.__setattr__(prop, self.handle_value(value))
+                    continue
+                set_attr(prop, self._recompose_reference(value))
 
             # 3. handle all other cases (base objects, lists, and dicts)
+            elif self.lazy:
+                self._set_lazy_attr(base, prop, self.handle_value(value))
+            elif self.numeric_arrays and isinstance(value, list) and value:
+                set_attr(prop, self._handle_numeric_list(base, prop, value))
             else:
-                base.__setattr__(prop, self.handle_value(value))
+                set_attr(prop, self.handle_value(value))
 
         if "id" in obj:
             self.deserialized[obj["id"]] = base
 
         return base
 
+    def _recompose_values(
+        self, base: Base, decoder: TypeDecoder, obj: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Recomposes the values of an object for `TypeDecoder.assign_trusted`. Plain
+        values are kept as they are, and chunked attributes are read straight from
+        their chunks.
+        """
+        values = {}
+        for prop, value in obj.items():
+            value_type = type(value)
+            if value_type in PLAIN_TYPES:
+                values[prop] = value
+            elif value_type is dict and "referencedId" in value:
+                values[prop] = self._recompose_reference(value)
+            elif value_type is not list or not value:
+                values[prop] = self.handle_value(value)
+            elif self.numeric_arrays:
+                values[prop] = self._handle_numeric_list(base, prop, value)
+            elif prop in decoder.chunked and _is_reference(value[0]):
+                values[prop] = self._read_chunked_list(value)
+            else:
+                values[prop] = self.handle_value(value)
+        return values
+
+    def _recompose_reference(self, value: Dict[str, Any]) -> Any:
+        """Recomposes the detached child a reference points to"""
+        ref_id = value["referencedId"]
+        if ref_id in self.deserialized:
+            return self.deserialized[ref_id]
+        ref_obj_str = self._read_object(ref_id)
+        if ref_obj_str:
+            return self.recompose_base(obj=self.codec.loads(ref_obj_str))
+        warnings.warn(
+            f"Could not find the referenced child object of id `{ref_id}`"
+            f" in the given read transport: {self.read_transport.name}",
+            SpeckleWarning,
+        )
+        return self.handle_value(value)
+
+    def _read_chunked_list(self, refs: List[Any]) -> Any:
+        """
+        Reads a chunked list straight from the data of its chunks, without
+        recomposing each chunk. Lists which aren't made of `DataChunk`s are handled
+        as any other list.
+        """
+        data = []
+        for ref in refs:
+            chunk = self.get_child(obj=ref) if _is_reference(ref) else ref
+            if "DataChunk" not in chunk.get("speckle_type", ""):
+                return self.handle_value(refs)
+            chunk_data = chunk.get("data") or []
+            if set(map(type, chunk_data)) <= PLAIN_TYPES:
+                data.extend(chunk_data)
+            else:
+                data.extend(self.handle_value(chunk_data))
+        return data
+
     def handle_value(self, obj: Any):
         """Helper for recomposing a base object by handling the dictionary
         representation's values
@@ -400,6 +938,11 @@ class BaseObjectSerializer:
 
         # lists (regular and chunked)
         if isinstance(obj, list):
+            if self.lazy:
+                return self._handle_lazy_list(obj)
+            # `set(map(...))` checks every item without a python level loop
+            if set(map(type, obj)) <= PLAIN_TYPES:
+                return obj
             obj_list = [self.handle_value(o) for o in obj]
             if (
                 hasattr(obj_list[0], "speckle_type")
@@ -414,6 +957,8 @@ class BaseObjectSerializer:
 
         # bases
         if isinstance(obj, dict) and "speckle_type" in obj:
+            if self.lazy and obj["speckle_type"] == "reference":
+                return LazyReference(obj["referencedId"], self._resolve_reference)
             return self.recompose_base(obj=obj)
 
         # dictionaries
@@ -427,7 +972,7 @@ class BaseObjectSerializer:
 
     def get_child(self, obj: Dict):
         ref_id = obj["referencedId"]
-        ref_obj_str = self.read_transport.get_object(id=ref_id)
+        ref_obj_str = self._read_object(ref_id)
         if not ref_obj_str:
             warnings.warn(
                 f"Could not find the referenced child object of id `{ref_id}` in the"
@@ -436,4 +981,177 @@ class BaseObjectSerializer:
             )
             return obj
 
-        return safe_json_loads(ref_obj_str, ref_id)
+        return self.codec.loads(ref_obj_str)
+
+    def _read_object(self, ref_id: str) -> Optional[str]:
+        """
+        Reads an object from the read transport. Objects which are not prefetched yet
+        are read in one batch with the next unread objects of the root closure, which
+        are kept in a bounded cache until they are needed.
+        """
+        self._read_ids.add(ref_id)
+        obj_str = self._prefetched.pop(ref_id, None)
+        if obj_str is not None:
+            return obj_str
+
+        queue = self._prefetch_queue
+        if self._prefetch_position >= len(queue):
+            return self.read_transport.get_object(id=ref_id)
+
+        batch = [ref_id]
+        size = self.prefetch_size - len(self._prefetched)
+        while len(batch) < size and self._prefetch_position < len(queue):
+            id = queue[self._prefetch_position]
+            self._prefetch_position += 1
+            if id not in self._read_ids and id not in self._prefetched:
+                batch.append(id)
+
+        if len(batch) == 1:
+            return self.read_transport.get_object(id=ref_id)
+        objects = self.read_transport.get_objects(batch)
+        obj_str = objects.pop(ref_id, None)
+        self._prefetched.update(objects)
+        return obj_str
+
+    def _handle_numeric_list(self, base: Base, prop: str, values: List[Any]) -> Any:
+        """
+        Handles a list when receiving numeric arrays. Chunked numeric lists are
+        decoded straight into an array, while other lists typed as floats or ints
+        are converted once they have been handled.
+        """
+        item_type = _numeric_item_type(base._attr_types.get(prop))
+        if _is_reference(values[0]):
+            decoded = self._read_chunked_array(values, item_type)
+            if decoded is not None:
+                return decoded
+
+        handled = self.handle_value(values)
+        if item_type and isinstance(handled, list):
+            return self._to_numeric_array(handled, item_type)
+        return handled
+
+    def _to_numeric_array(self, values: List[Any], item_type: type) -> Any:
+        """
+        Converts a list of floats or ints to a compact numeric array. Lists which
+        don't fit the array are returned as is.
+        """
+        try:
+            if self.numeric_arrays == "numpy":
+                np = _import_numpy()
+                dtype = np.float64 if item_type is float else np.int64
+                return np.asarray(values, dtype=dtype)
+
+            if item_type is float:
+                return array("d", values)
+            try:
+                return array("i", values)
+            except OverflowError:
+                return array("q", values)
+        except (TypeError, ValueError, OverflowError):
+            return values
+
+    def _read_chunked_array(
+        self, refs: List[Any], item_type: Optional[type]
+    ) -> Optional[Any]:
+        """
+        Reads the `DataChunk`s of a chunked list into one preallocated numeric
+        array. All chunks but the last one hold the same number of items, so the
+        size of the array is known once the first and last chunks are read.
+
+        Returns None if the list isn't made of numeric chunks, and a plain list if
+        their ints don't fit 64 bits.
+        """
+        if not all(_is_reference(ref) for ref in refs):
+            return None
+        first = self.get_child(obj=refs[0])
+        if "DataChunk" not in first.get("speckle_type", ""):
+            return None
+        last = self.get_child(obj=refs[-1]) if len(refs) > 1 else first
+        first_data, last_data = first.get("data"), last.get("data")
+        if not isinstance(first_data, list) or not isinstance(last_data, list):
+            return None
+
+        item_type = item_type or _infer_numeric_type(first_data)
+        if not item_type:
+            return None
+        allowed_types = {int} if item_type is int else {int, float}
+        size = len(first_data) * (len(refs) - 1) + len(last_data)
+
+        if self.numeric_arrays == "numpy":
+            np = _import_numpy()
+            decoded = np.empty(
+                size, dtype=np.float64 if item_type is float else np.int64
+            )
+        else:
+            decoded = array("d" if item_type is float else "i", [0]) * size
+
+        position = 0
+        for i, ref in enumerate(refs):
+            if i == 0:
+                data = first_data
+            elif i == len(refs) - 1:
+                data = last_data
+            else:
+                data = self.get_child(obj=ref).get("data")
+            if (
+                not isinstance(data, list)
+                or position + len(data) > size
+                or not set(map(type, data)) <= allowed_types
+            ):
+                return None
+
+            end = position + len(data)
+            try:
+                if isinstance(decoded, array):
+                    try:
+                        decoded[position:end] = array(decoded.typecode, data)
+                    except OverflowError:
+                        # widen int arrays which don't fit 32 bits
+                        decoded = array("q", decoded)
+                        decoded[position:end] = array("q", data)
+                else:
+                    decoded[position:end] = data
+            except OverflowError:
+                # ints which don't fit 64 bits are kept in a plain list
+                decoded = decoded.tolist()
+                decoded[position:end] = data
+            position = end
+
+        return decoded if position == size else None
+
+    def _set_lazy_attr(self, base: Base, prop: str, value: Any) -> None:
+        """
+        Sets a deserialized value without type checking it, as that would resolve
+        any lazy proxies within it. Properties still go through their setters.
+        """
+        if prop in base._property_names:
+            base.__setattr__(prop, value)
+        else:
+            base.__dict__[prop] = value
+
+    def _handle_lazy_list(self, obj: List[Any]) -> List[Any]:
+        """
+        Handles a list in lazy mode. Chunked lists are deferred as a whole, while
+        detached items in regular lists become lazy references.
+        """
+        first = obj[0]
+        if _is_reference(first):
+            first_obj = self.get_child(obj=first)
+            if "DataChunk" in first_obj.get("speckle_type", ""):
+                return LazyChunkedList(lambda: self._load_chunks(obj))
+
+        return [self.handle_value(o) for o in obj]
+
+    def _load_chunks(self, chunk_refs: List[Dict[str, str]]) -> List[Any]:
+        data = []
+        for ref in chunk_refs:
+            chunk = self.get_child(obj=ref)
+            data.extend(self.handle_value(chunk.get("data")) or [])
+        return data
+
+    def _resolve_reference(self, ref_id: str) -> Any:
+        if ref_id in self.deserialized:
+            return self.deserialized[ref_id]
+        return self.recompose_base(
+            obj={"referencedId": ref_id, "speckle_type": "reference"}
+        )
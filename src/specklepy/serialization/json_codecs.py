@@ -0,0 +1,227 @@
+"""
+The JSON libraries objects can be encoded and decoded with.
+
+Object ids are hashed from the encoding of each object, so every codec encodes
+objects exactly as `ujson` does by default: without whitespace, with non ASCII
+characters and forward slashes escaped, and with floats in their shortest form
+(eg `1e+16`, `2.5e-5`). Codecs are picked by name with `get_codec`, and the one
+used by default can be changed with `set_default_codec`.
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Union
+
+import ujson
+
+from specklepy.logging.exceptions import SpeckleException
+
+# a string in compact JSON, so the fixes below leave the contents of strings alone
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+# the start of a number with an exponent. Numbers follow one of these characters
+# in compact JSON, which they never do inside an id
+_PADDED_EXPONENT = re.compile(r"[:,\[]-?\d+(?:\.\d+)?e-0")
+_PADDED_EXPONENT_FIX = re.compile(_STRING + r"|(?<=\d)e-0(?=\d)")
+# orjson leaves out the sign of positive exponents, and writes numbers from 1e-5
+# to 1e-4 without an exponent
+_ORJSON_NUMBERS_FIX = re.compile(
+    _STRING + r"|(?<=\d)e(?=\d)|(?<=[:,\[])(-?)0\.0000([1-9])(\d*)"
+)
+# regular expressions are slow to scan whole objects with, so the checks for the
+# numbers to fix map the encoding with `bytes.translate` and search it for a marker.
+# With the digits removed and every character which comes before the exponent of
+# a number mapped to ",", each exponent becomes ",e"
+_EXPONENT_MARKS = bytes(
+    ord(",") if chr(i) in ".,:[-" else i if chr(i) == "e" else ord(" ")
+    for i in range(256)
+)
+# with the digits mapped to "0", a run of digits becomes a run of "0"
+_DIGIT_MARKS = bytes(ord("0") if "0" <= chr(i) <= "9" else ord(" ") for i in range(256))
+# integers this long may not fit in 64 bits, which `orjson` decodes as floats
+_LONG_DIGITS = b"0" * 19
+# the escaped DEL character, which `ujson` leaves as is, after any escaped backslash
+_ESCAPED_DEL = re.compile(r"(?<!\\)((?:\\\\)*)\\u007f")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _fix_outside_strings(pattern: re.Pattern, replacement: str, data: str) -> str:
+    return pattern.sub(
+        lambda match: match[0] if match[0][0] == '"' else replacement, data
+    )
+
+
+def _fix_orjson_number(match: re.Match) -> str:
+    if match[0][0] == '"':
+        return match[0]
+    if match[0] == "e":
+        return "e+"
+    sign, first, rest = match.groups()
+    return f"{sign}{first}.{rest}e-5" if rest else f"{sign}{first}e-5"
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    code = ord(match[0])
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | code >> 10:04x}\\u{0xDC00 | code & 0x3FF:04x}"
+
+
+class AbstractJsonCodec(ABC):
+    name: str
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Encodes the given value, exactly as `ujson.dumps` does by default
+
+        Arguments:
+            obj {Any} -- the value made of dicts, lists and primitives to encode
+
+        Returns:
+            str -- the compact JSON encoding of the value
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes the given JSON, keeping integers of any size exact
+
+        Arguments:
+            data {Union[str, bytes]} -- the JSON to decode
+
+        Returns:
+            Any -- the decoded value
+        """
+        pass
+
+
+class UjsonCodec(AbstractJsonCodec):
+    """The reference codec, which the encoding of the others is defined by"""
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            # older builds of ujson do not decode integers over 64 bits
+            return json.loads(data)
+
+
+class StdlibJsonCodec(AbstractJsonCodec):
+    """The codec of the standard library, which needs no other package"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        data = json.dumps(obj, separators=(",", ":"))
+        if "/" in data:
+            data = data.replace("/", "\\/")
+        if "\\u007f" in data:
+            data = _ESCAPED_DEL.sub("\\1\x7f", data)
+        # `repr` pads negative exponents to two digits
+        if _PADDED_EXPONENT.search(data):
+            data = _fix_outside_strings(_PADDED_EXPONENT_FIX, "e-", data)
+        return data
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(AbstractJsonCodec):
+    """
+    The codec of `orjson`, which must be installed. Objects which `orjson` cannot
+    handle, like integers over 64 bits, are handled by the standard library. NaN
+    and infinite floats are encoded as `null` as `orjson` does, which changes the
+    id of the objects which hold them.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as ex:
+            raise SpeckleException(
+                "orjson must be installed to use the orjson codec", ex
+            )
+        self._orjson = orjson
+        self._fallback = StdlibJsonCodec()
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            data = self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return self._fallback.dumps(obj)
+        needs_fix = (
+            b",e" in data.translate(_EXPONENT_MARKS, b"0123456789") or b"0.0000" in data
+        )
+        data = data.decode()
+        if not data.isascii():
+            data = _NON_ASCII.sub(_escape_non_ascii, data)
+        if "/" in data:
+            data = data.replace("/", "\\/")
+        if needs_fix:
+            data = _ORJSON_NUMBERS_FIX.sub(_fix_orjson_number, data)
+        return data
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # checked up front, as orjson decodes large integers as floats rather than
+        # failing
+        encoded = data.encode() if isinstance(data, str) else data
+        if _LONG_DIGITS in encoded.translate(_DIGIT_MARKS):
+            return self._fallback.loads(data)
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # eg NaN and infinite floats, which orjson rejects
+            return self._fallback.loads(data)
+
+
+CODECS: Dict[str, Callable[[], AbstractJsonCodec]] = {
+    UjsonCodec.name: UjsonCodec,
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+_default_codec: AbstractJsonCodec = UjsonCodec()
+
+
+def get_codec(
+    codec: Optional[Union[str, AbstractJsonCodec]] = None
+) -> AbstractJsonCodec:
+    """Gets a codec by name, or the default codec if none is given
+
+    Arguments:
+        codec {Union[str, AbstractJsonCodec]} -- optional: the name of the codec
+            ("ujson", "orjson" or "json"), or the codec itself
+
+    Returns:
+        AbstractJsonCodec -- the codec
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, AbstractJsonCodec):
+        return codec
+    if codec not in CODECS:
+        raise SpeckleException(
+            f"Unknown JSON codec '{codec}': expected one of {', '.join(CODECS)}"
+        )
+    return CODECS[codec]()
+
+
+def set_default_codec(codec: Union[str, AbstractJsonCodec]) -> None:
+    """Sets the codec used when none is given, eg by transports
+
+    Arguments:
+        codec {Union[str, AbstractJsonCodec]} -- the name of the codec, or the codec
+    """
+    global _default_codec
+    _default_codec = get_codec(codec)
@@ -0,0 +1,212 @@
+from typing import Any, Callable, Iterable, List
+
+_UNRESOLVED = object()
+
+
+class LazyReference:
+    """
+    A stand-in for a detached child that is only read from the transport and
+    recomposed the first time it is used.
+
+    Any attribute access, item access or `isinstance` check on the proxy resolves
+    it and forwards to the real object, so for most purposes it behaves exactly
+    like the object it points to.
+    """
+
+    __slots__ = ("_ref_id", "_resolver", "_target")
+
+    def __init__(self, ref_id: str, resolver: Callable[[str], Any]) -> None:
+        object.__setattr__(self, "_ref_id", ref_id)
+        object.__setattr__(self, "_resolver", resolver)
+        object.__setattr__(self, "_target", _UNRESOLVED)
+
+    def _resolve(self) -> Any:
+        target = object.__getattribute__(self, "_target")
+        if target is _UNRESOLVED:
+            ref_id = object.__getattribute__(self, "_ref_id")
+            target = object.__getattribute__(self, "_resolver")(ref_id)
+            object.__setattr__(self, "_target", target)
+            object.__setattr__(self, "_resolver", None)
+        return target
+
+    @property
+    def __class__(self):
+        return type(self._resolve())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._resolve()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._resolve()[key] = value
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self._resolve())
+
+    def __dir__(self) -> List[str]:
+        return dir(self._resolve())
+
+    def __repr__(self) -> str:
+        target = object.__getattribute__(self, "_target")
+        if target is _UNRESOLVED:
+            ref_id = object.__getattribute__(self, "_ref_id")
+            return f"LazyReference(referencedId: {ref_id})"
+        return repr(target)
+
+    def __str__(self) -> str:
+        return str(self._resolve())
+
+
+class LazyChunkedList(list):
+    """
+    A list whose items are held in detached `DataChunk`s and are only read from
+    the transport the first time the list is used.
+    """
+
+    def __init__(self, loader: Callable[[], Iterable[Any]]) -> None:
+        super().__init__()
+        self._loader = loader
+
+    def _materialize(self) -> None:
+        loader = self._loader
+        if loader is not None:
+            self._loader = None
+            super().extend(loader())
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._loader is None
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __reversed__(self):
+        self._materialize()
+        return super().__reversed__()
+
+    def __len__(self) -> int:
+        self._materialize()
+        return super().__len__()
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: Any) -> Any:
+        self._materialize()
+        return super().__getitem__(index)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._materialize()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._materialize()
+        super().__delitem__(index)
+
+    def __contains__(self, value: Any) -> bool:
+        self._materialize()
+        return super().__contains__(value)
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __add__(self, other: Any) -> List[Any]:
+        self._materialize()
+        return list(super().__iter__()) + other
+
+    def __iadd__(self, other: Any) -> "LazyChunkedList":
+        self._materialize()
+        return super().__iadd__(other)
+
+    def __mul__(self, n: int) -> List[Any]:
+        self._materialize()
+        return list(super().__iter__()) * n
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return super().__repr__()
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        self._materialize()
+        return (list, (list(super().__iter__()),))
+
+    def copy(self) -> List[Any]:
+        self._materialize()
+        return list(super().__iter__())
+
+    def append(self, value: Any) -> None:
+        self._materialize()
+        super().append(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self._materialize()
+        super().extend(values)
+
+    def insert(self, index: int, value: Any) -> None:
+        self._materialize()
+        super().insert(index, value)
+
+    def pop(self, index: int = -1) -> Any:
+        self._materialize()
+        return super().pop(index)
+
+    def remove(self, value: Any) -> None:
+        self._materialize()
+        super().remove(value)
+
+    def clear(self) -> None:
+        self._loader = None
+        super().clear()
+
+    def index(self, value: Any, *args: Any) -> int:
+        self._materialize()
+        return super().index(value, *args)
+
+    def count(self, value: Any) -> int:
+        self._materialize()
+        return super().count(value)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._materialize()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._materialize()
+        super().reverse()
+
+
+def is_lazy(value: Any) -> bool:
+    """Whether the value is a lazy proxy that hasn't been resolved yet"""
+    value_type = type(value)  # avoid `isinstance`, which would resolve references
+    if value_type is LazyReference:
+        return object.__getattribute__(value, "_target") is _UNRESOLVED
+    if value_type is LazyChunkedList:
+        return not value.is_materialized
+    return False
@@ -0,0 +1,81 @@
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from specklepy.objects.base import Base
+
+
+@dataclass
+class CachedSubtree:
+    """The serialized form of a detached subtree, as of the versions it was built"""
+
+    ref: weakref.ref
+    version: int
+    # every Base below the root and the version it had when it was serialized
+    versions: List[Tuple[Base, int]]
+    obj_id: str
+    # the closure of the subtree root, with depths relative to the root
+    closure: Dict[str, int]
+    # every object written while serializing the subtree, as `(id, json)` tuples
+    objects: List[Tuple[str, str]]
+    # the closures of every object in the subtree, detached or not
+    closure_table: Dict[str, Dict[str, int]]
+
+    def is_valid(self, base: Base) -> bool:
+        return getattr(base, "_version", 0) == self.version and all(
+            getattr(child, "_version", 0) == version for child, version in self.versions
+        )
+
+
+class SerializationCache:
+    """
+    Remembers the id and serialized objects of the detached subtrees of a send, so
+    sending the same objects again only serializes the subtrees which changed.
+
+    Provide the same cache to each `operations.send()`. Entries are keyed by the
+    identity of the subtree root and are dropped when it is garbage collected.
+    Every change made through `setattr`, `setitem` or `delattr` on any Base in a
+    subtree invalidates it, but changes made in place to the values of a Base (eg
+    appending to a list) are not seen: reassign the value after changing it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, CachedSubtree] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, base: Base) -> Optional[CachedSubtree]:
+        """Gets the entry of the given subtree root, if it is cached and unchanged"""
+        entry = self._entries.get(id(base))
+        if entry is None or entry.ref() is not base or not entry.is_valid(base):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        base: Base,
+        version: int,
+        versions: List[Tuple[Base, int]],
+        obj_id: str,
+        closure: Dict[str, int],
+        objects: List[Tuple[str, str]],
+        closure_table: Dict[str, Dict[str, int]],
+    ) -> None:
+        key = id(base)
+        ref = weakref.ref(base, lambda ref: self._drop(key, ref))
+        self._entries[key] = CachedSubtree(
+            ref, version, versions, obj_id, closure, objects, closure_table
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _drop(self, key: int, ref: weakref.ref) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.ref is ref:
+            del self._entries[key]
@@ -0,0 +1,73 @@
+from typing import Any, Dict, Optional, Type
+
+from specklepy.objects.base import Base
+
+
+class TypeDecoder:
+    """
+    How the objects of one `speckle_type` are recomposed, worked out once for the
+    type rather than for each object: the class to create and how to create it,
+    which attributes are chunked, and which attributes need more than being stored
+    as they are when their values are trusted.
+    """
+
+    def __init__(self, speckle_type: str) -> None:
+        self.speckle_type = speckle_type
+        self.object_type: Optional[Type[Base]] = Base.get_registered_type(speckle_type)
+        cls = self.object_type or Base
+        # classes without an `__init__` of their own need no setting up, so their
+        # objects are created without calling it
+        self._plain_init = cls.__init__ is Base.__init__
+        # the attributes which are chunked when the objects are sent
+        self.chunked = frozenset(cls._chunkable)
+        self._enum_validators = cls._enum_validators
+        # the setters of the properties, or None for read only properties
+        self._setters = {name: getattr(cls, name).fset for name in cls._property_names}
+        # the attributes which go through `set_trusted` rather than `__dict__`
+        self._special = frozenset((*self._enum_validators, *self._setters))
+
+    def __repr__(self) -> str:
+        return f"TypeDecoder(speckle_type: '{self.speckle_type}')"
+
+    def create(self) -> Base:
+        """Creates an empty object of the type, or a plain Base for unknown types"""
+        if self.object_type is None:
+            base = Base.__new__(Base)
+            base.__dict__["speckle_type"] = self.speckle_type
+            return base
+        if self._plain_init:
+            return self.object_type.__new__(self.object_type)
+        return self.object_type()
+
+    def set_trusted(self, base: Base, name: str, value: Any) -> None:
+        """
+        Sets a recomposed value without validating it. Values of enum attributes
+        are still turned back into members, and properties go through their setters
+        (once, rather than through `Base.__setattr__`).
+        """
+        if name == "speckle_type":
+            return
+        enum_validator = self._enum_validators.get(name)
+        if enum_validator:
+            value = enum_validator(value)[1]
+        if name in self._setters:
+            setter = self._setters[name]
+            if setter:
+                setter(base, value)
+        else:
+            base.__dict__[name] = value
+
+    def assign_trusted(self, base: Base, values: Dict[str, Any]) -> None:
+        """
+        Sets all the recomposed values of an object at once without validating
+        them, as `set_trusted` does for each value
+        """
+        values.pop("speckle_type", None)
+        special = self._special.intersection(values)
+        if not special:
+            base.__dict__.update(values)
+            return
+        special_values = [(name, values.pop(name)) for name in special]
+        base.__dict__.update(values)
+        for name, value in special_values:
+            self.set_trusted(base, name, value)
@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from specklepy.transports.abstract_transport import AbstractTransport
+
+
+class AbstractAsyncTransport(ABC):
+    """
+    The asyncio counterpart of `AbstractTransport`, for transports whose reads and
+    writes are awaited so many sends and receives can share one event loop.
+    Provide it to `operations.async_send()` or `operations.async_receive()`.
+    """
+
+    @property
+    @abstractmethod
+    def name(self):
+        pass
+
+    @abstractmethod
+    async def begin_write(self) -> None:
+        """Optional: signals to the transport that writes are about to begin."""
+        pass
+
+    @abstractmethod
+    async def end_write(self) -> None:
+        """
+        Optional: signals to the transport that no more items will need to be written.
+        Any pending writes are awaited before this returns.
+        """
+        pass
+
+    @abstractmethod
+    async def save_object(self, id: str, serialized_object: str) -> None:
+        """Saves the given serialized object.
+
+        Arguments:
+            id {str} -- the hash of the object
+            serialized_object {str} -- the full string representation of the object
+        """
+        pass
+
+    @abstractmethod
+    async def get_object(self, id: str) -> str or None:
+        """Gets an object.
+
+        Arguments:
+            id {str} -- the hash of the object
+
+        Returns:
+            str -- the full string representation of the object (or null if no object
+            is found)
+        """
+        pass
+
+    async def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        """Gets multiple objects at once.
+
+        Transports which can look up many objects in one go should override this,
+        otherwise the objects are fetched one by one with `get_object`.
+
+        Arguments:
+            id_list -- List of object ids to get
+
+        Returns:
+            Dict[str, str] -- keys: the ids of the objects that were found, values:
+                the full string representation of each object
+        """
+        objects = {}
+        for id in id_list:
+            obj = await self.get_object(id)
+            if obj is not None:
+                objects[id] = obj
+        return objects
+
+    @abstractmethod
+    async def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        """Checks the presence of multiple objects.
+
+        Arguments:
+            id_list -- List of object ids to check
+
+        Returns:
+            Dict[str, bool] -- keys: input ids, values: whether the transport has that
+            object
+        """
+        pass
+
+    @abstractmethod
+    async def copy_object_and_children(
+        self, id: str, target_transport: AbstractTransport
+    ) -> str:
+        """Copy an object with all its children to the target transport
+
+        Arguments:
+            id {str} -- the id of the object you want to copy
+            target_transport {AbstractTransport}
+                -- the transport you want to copy the object to
+        Returns:
+            str -- the string representation of the root object
+        """
+        pass
@@ -56,6 +56,26 @@ class AbstractTransport(ABC):
         """
         pass
 
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        """Gets multiple objects at once.
+
+        Transports which can look up many objects in one go should override this,
+        otherwise the objects are fetched one by one with `get_object`.
+
+        Arguments:
+            id_list -- List of object ids to get
+
+        Returns:
+            Dict[str, str] -- keys: the ids of the objects that were found, values:
+                the full string representation of each object
+        """
+        objects = {}
+        for id in id_list:
+            obj = self.get_object(id)
+            if obj is not None:
+                objects[id] = obj
+        return objects
+
     @abstractmethod
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
         """Checks the presence of multiple objects.
@@ -0,0 +1,400 @@
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.serialization.json_codecs import get_codec
+from specklepy.transports.abstract_transport import AbstractTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+# each object is appended to a segment as the length of its id and of its content
+# and the checksum of its content, followed by both. The id is kept so each index
+# hit can be checked, and the checksum catches records torn by a crash
+RECORD_HEADER = struct.Struct("<HII")
+# the index starts with a header the size of one slot, followed by a power of two
+# slots of two unsigned 64 bit ints: the hash of an id, then the segment number
+# (in the top 16 bits) and offset of its record
+INDEX_MAGIC = 0x53504B49
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<IIQ")
+INDEX_INITIAL_CAPACITY = 1 << 12
+SEGMENT_BITS = 48
+OFFSET_MASK = (1 << SEGMENT_BITS) - 1
+MAX_SEGMENTS = 1 << (64 - SEGMENT_BITS)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _hash(id: bytes) -> int:
+    # only spreads the ids over the slots, as every hit is checked against the id
+    # of its record. 0 marks an empty slot
+    return (zlib.adler32(id) << 32 | zlib.crc32(id)) or 1
+
+
+class AppendOnlyTransport(AbstractTransport):
+    """
+    A local store of serialized objects, for caches which only ever add objects.
+    As objects are immutable and addressed by their hash, they are appended to
+    segment files rather than kept in a db, and found through an open addressing
+    hash table kept in an index file next to them.
+
+    Both the index and the segments are memory mapped, so looking up an object
+    takes a few probes of the index and copies only the object out of its
+    segment, whatever the size of the store. Objects which are already stored are
+    not written again.
+
+    Arguments:
+        base_path {str} -- optional: the folder of the store (defaults to the
+            Speckle folder of the app)
+        app_name {str} -- optional: the app the store is for (defaults to
+            "Speckle")
+        scope {str} -- optional: the name of the store (defaults to "Objects")
+        max_segment_size_mb {int} -- optional: the size at which a new segment is
+            started (defaults to 1024)
+
+    The store is safe to share between the threads of a process, but not between
+    processes. Writes are flushed to disk by `end_write`: if the process dies in
+    the middle of a write, objects saved since the last `end_write` may be lost,
+    but the objects already stored stay readable.
+    """
+
+    def __init__(
+        self,
+        base_path: Optional[str] = None,
+        app_name: Optional[str] = None,
+        scope: Optional[str] = None,
+        max_segment_size_mb: int = 1024,
+    ) -> None:
+        super().__init__()
+        self.app_name = app_name or "Speckle"
+        self.scope = scope or "Objects"
+        self._name = self.scope
+        self._base_path = base_path or SQLiteTransport.get_base_path(self.app_name)
+        self._root_path = os.path.join(self._base_path, self.scope)
+        self.max_segment_size = max_segment_size_mb * 1024 * 1024
+        self.saved_obj_count = 0
+        self._lock = threading.RLock()
+        self.__index_file = None
+        self.__index = None
+        self.__slots: Optional[memoryview] = None
+        self.__capacity = 0
+        self.__count = 0
+        # the read only maps of the segments, remapped as the last one grows
+        self.__segments: List[Optional[mmap.mmap]] = []
+        self.__writer = None
+        self.__write_position = 0
+
+        try:
+            os.makedirs(self._root_path, exist_ok=True)
+            self.__open()
+        except Exception as ex:
+            self.close()
+            raise SpeckleException(
+                f"AppendOnlyTransport could not initialise the store at"
+                f" {self._root_path}. Provide a different `base_path` or `scope`.",
+                ex,
+            )
+
+    def __repr__(self) -> str:
+        return f"AppendOnlyTransport(app: '{self.app_name}', scope: '{self.scope}')"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def save_object_from_transport(
+        self, id: str, source_transport: AbstractTransport
+    ) -> None:
+        """Adds an object from the given transport to the store
+
+        Arguments:
+            id {str} -- the object id
+            source_transport {AbstractTransport)
+            -- the transport through which the object can be found
+        """
+        serialized_object = source_transport.get_object(id)
+        self.save_object(id, serialized_object)
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        """
+        Appends an object to the last segment, unless it is already stored. It can
+        be read back straight away, but is only flushed to disk by `end_write`.
+
+        Arguments:
+            id {str} -- the object id
+            serialized_object {str} -- the full string representation of the object
+        """
+        key = id.encode()
+        data = serialized_object.encode()
+        with self._lock:
+            self.__check_open()
+            slot, hash, stored = self.__find(key)
+            if stored is not None:
+                return
+            record_size = RECORD_HEADER.size + len(key) + len(data)
+            if (
+                self.__write_position
+                and self.__write_position + record_size > self.max_segment_size
+            ):
+                self.__start_segment(len(self.__segments))
+            segment = len(self.__segments) - 1
+            self.__writer.write(
+                RECORD_HEADER.pack(len(key), len(data), zlib.crc32(data))
+            )
+            self.__writer.write(key)
+            self.__writer.write(data)
+            self.__insert(slot, hash, segment << SEGMENT_BITS | self.__write_position)
+            self.__write_position += record_size
+            self.saved_obj_count += 1
+
+    def get_object(self, id: str) -> Optional[str]:
+        key = id.encode()
+        with self._lock:
+            self.__check_open()
+            data = self.__find(key)[2]
+        return None if data is None else data.decode()
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = {}
+        with self._lock:
+            self.__check_open()
+            for id in id_list:
+                data = self.__find(id.encode())[2]
+                if data is not None:
+                    objects[id] = data.decode()
+        return objects
+
+    def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        with self._lock:
+            self.__check_open()
+            return {id: self.__find(id.encode())[2] is not None for id in id_list}
+
+    def begin_write(self) -> None:
+        self.saved_obj_count = 0
+
+    def end_write(self) -> None:
+        with self._lock:
+            if self.__writer is None:
+                return
+            self.__writer.flush()
+            os.fsync(self.__writer.fileno())
+            self.__write_count()
+            self.__index.flush()
+
+    def copy_object_and_children(
+        self, id: str, target_transport: AbstractTransport
+    ) -> str:
+        """Copies the parent object and all its children to the provided transport.
+
+        Arguments:
+            id {str} -- the id of the object you want to copy
+            target_transport {AbstractTransport}
+                -- the transport you want to copy the object to
+        Returns:
+            str -- the string representation of the root object
+        """
+        root_obj_serialized = self.get_object(id)
+        if root_obj_serialized is None:
+            raise SpeckleException(f"Could not find object {id} in {self}")
+        children_ids = list(get_codec().loads(root_obj_serialized).get("__closure", {}))
+        found = target_transport.has_objects(children_ids)
+
+        target_transport.begin_write()
+        for child_id in children_ids:
+            if found[child_id]:
+                continue
+            child = self.get_object(child_id)
+            if child is None:
+                raise SpeckleException(f"Could not find object {child_id} in {self}")
+            target_transport.save_object(child_id, child)
+        target_transport.save_object(id, root_obj_serialized)
+        target_transport.end_write()
+
+        return root_obj_serialized
+
+    def close(self) -> None:
+        """Flush and close the files of the store. It is reopened if used again."""
+        with self._lock:
+            if self.__writer is not None:
+                self.__writer.close()
+                self.__writer = None
+            for segment in self.__segments:
+                if segment is not None:
+                    segment.close()
+            self.__segments = []
+            if self.__slots is not None:
+                self.__slots.release()
+                self.__slots = None
+            if self.__index is not None:
+                self.__write_count()
+                self.__index.flush()
+                self.__index.close()
+                self.__index = None
+            if self.__index_file is not None:
+                self.__index_file.close()
+                self.__index_file = None
+
+    def __open(self) -> None:
+        index_path = os.path.join(self._root_path, "index.dat")
+        if not os.path.exists(index_path):
+            self.__create_index(index_path, INDEX_INITIAL_CAPACITY)
+        self.__map_index(index_path)
+
+        segment_count = 0
+        while os.path.exists(self.__segment_path(segment_count)):
+            segment_count += 1
+        self.__segments = [None] * segment_count
+        if segment_count:
+            path = self.__segment_path(segment_count - 1)
+            self.__writer = open(path, "ab", buffering=WRITE_BUFFER_SIZE)
+            self.__write_position = os.path.getsize(path)
+        else:
+            self.__start_segment(0)
+
+    def __check_open(self) -> None:
+        if self.__index is None:
+            self.__open()
+
+    def __segment_path(self, segment: int) -> str:
+        return os.path.join(self._root_path, f"segment-{segment:05}.dat")
+
+    def __start_segment(self, segment: int) -> None:
+        if segment >= MAX_SEGMENTS:
+            raise SpeckleException(f"{self} has no room for another segment")
+        if self.__writer is not None:
+            self.__writer.close()
+        self.__writer = open(
+            self.__segment_path(segment), "ab", buffering=WRITE_BUFFER_SIZE
+        )
+        self.__write_position = 0
+        self.__segments.append(None)
+
+    def __segment(self, segment: int, end: int) -> Optional[mmap.mmap]:
+        """Maps the segment, or maps it again if it does not reach the given end"""
+        mapped = self.__segments[segment]
+        if mapped is not None and len(mapped) >= end:
+            return mapped
+        if segment == len(self.__segments) - 1:
+            self.__writer.flush()
+        if mapped is not None:
+            mapped.close()
+            self.__segments[segment] = None
+        with open(self.__segment_path(segment), "rb") as f:
+            if os.fstat(f.fileno()).st_size < end:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__segments[segment] = mapped
+        return mapped
+
+    def __find(self, key: bytes):
+        """
+        Probes the index for the given id. Returns the slot it was found in, or the
+        empty slot to insert it in, its hash, and its content if found.
+        """
+        slots = self.__slots
+        mask = self.__capacity - 1
+        hash = _hash(key)
+        slot = hash & mask
+        for _ in range(self.__capacity):
+            stored = slots[2 + 2 * slot]
+            if stored == 0:
+                return slot, hash, None
+            if stored == hash:
+                data = self.__read_record(slots[3 + 2 * slot], key)
+                if data is not None:
+                    return slot, hash, data
+            slot = (slot + 1) & mask
+        raise SpeckleException(f"The index of {self} is full")
+
+    def __read_record(self, location: int, key: bytes):
+        segment, start = location >> SEGMENT_BITS, location & OFFSET_MASK
+        if segment >= len(self.__segments):
+            return None
+        mapped = self.__segments[segment]
+        header_end = start + RECORD_HEADER.size
+        if mapped is None or len(mapped) < header_end:
+            mapped = self.__segment(segment, header_end)
+            if mapped is None:
+                return None
+        id_size, size, checksum = RECORD_HEADER.unpack_from(mapped, start)
+        if id_size != len(key):
+            return None
+        id_end = header_end + id_size
+        end = id_end + size
+        if len(mapped) < end:
+            mapped = self.__segment(segment, end)
+        # records the index points to but which were never flushed are missing
+        if mapped is None or mapped[header_end:id_end] != key:
+            return None
+        data = mapped[id_end:end]
+        return data if zlib.crc32(data) == checksum else None
+
+    def __insert(self, slot: int, hash: int, location: int) -> None:
+        self.__slots[2 + 2 * slot] = hash
+        self.__slots[3 + 2 * slot] = location
+        self.__count += 1
+        # keeps at least half the slots empty so probes stay short
+        if self.__count * 2 > self.__capacity:
+            self.__grow()
+
+    def __write_count(self) -> None:
+        INDEX_HEADER.pack_into(
+            self.__index, 0, INDEX_MAGIC, INDEX_VERSION, self.__count
+        )
+
+    def __create_index(self, path: str, capacity: int) -> None:
+        with open(path, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0))
+            f.truncate(INDEX_HEADER.size * (capacity + 1))
+
+    def __map_index(self, path: str) -> None:
+        self.__index_file = open(path, "r+b")
+        self.__index = mmap.mmap(self.__index_file.fileno(), 0)
+        magic, version, _ = INDEX_HEADER.unpack_from(self.__index, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise SpeckleException(f"{path} is not an index of a store")
+        self.__slots = memoryview(self.__index).cast("Q")
+        self.__capacity = len(self.__slots) // 2 - 1
+        # the slots are written through the map as objects are saved, but the count
+        # only by `end_write`, so it is stale if the process died since. Counted
+        # again from the slots, as the table would otherwise fill up unnoticed
+        self.__count = self.__capacity - self.__slots[2::2].tolist().count(0)
+
+    def __grow(self) -> None:
+        """Moves the slots into an index twice the size"""
+        index_path = os.path.join(self._root_path, "index.dat")
+        new_path = index_path + ".new"
+        capacity = self.__capacity * 2
+        self.__create_index(new_path, capacity)
+        with open(new_path, "r+b") as f:
+            with mmap.mmap(f.fileno(), 0) as new_index:
+                new_slots = memoryview(new_index).cast("Q")
+                slots, mask = self.__slots, capacity - 1
+                for i in range(2, len(slots), 2):
+                    hash = slots[i]
+                    if hash == 0:
+                        continue
+                    slot = hash & mask
+                    while new_slots[2 + 2 * slot]:
+                        slot = (slot + 1) & mask
+                    new_slots[2 + 2 * slot] = hash
+                    new_slots[3 + 2 * slot] = slots[i + 1]
+                new_slots.release()
+                INDEX_HEADER.pack_into(
+                    new_index, 0, INDEX_MAGIC, INDEX_VERSION, self.__count
+                )
+                new_index.flush()
+
+        self.__slots.release()
+        self.__index.close()
+        self.__index_file.close()
+        os.replace(new_path, index_path)
+        self.__map_index(index_path)
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Iterable, Optional, Set
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+class KnownObjectsIndex:
+    """
+    The ids of the objects known to be on a stream of a Speckle server, kept in a
+    local db so they survive between sessions.
+
+    Give the index to a `ServerTransport` to record the objects the server
+    acknowledges, either because it already had them or because they were
+    uploaded. Give it to `operations.send()` as well to skip writing those objects
+    to that transport the next time they are sent. Only the transports given the
+    same index skip them: the others, like the local cache, still get every object.
+
+    ```py
+    known = KnownObjectsIndex(client.url, stream_id)
+    transport = ServerTransport(stream_id, client=client, known_objects=known)
+    hash = operations.send(base, [transport], known_objects=known)
+    ```
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        stream_id: str,
+        base_path: Optional[str] = None,
+        app_name: Optional[str] = None,
+        scope: str = "KnownObjects",
+    ) -> None:
+        self.server_url = server_url.rstrip("/")
+        self.stream_id = stream_id
+        self._base_path = base_path or SQLiteTransport.get_base_path(
+            app_name or "Speckle"
+        )
+        self._root_path = os.path.join(self._base_path, f"{scope}.db")
+        # ids found in the db or added this session, so each is only looked up once
+        self._known: Set[str] = set()
+        # the acknowledgments come in on the sending threads of the transport
+        self._lock = threading.Lock()
+        self.__connection = None
+
+        try:
+            os.makedirs(self._base_path, exist_ok=True)
+            self.__connection = sqlite3.connect(
+                self._root_path, check_same_thread=False
+            )
+            with closing(self.__connection.cursor()) as c:
+                c.execute(
+                    """ CREATE TABLE IF NOT EXISTS known(
+                          server TEXT,
+                          stream TEXT,
+                          hash TEXT,
+                          PRIMARY KEY (server, stream, hash)
+                        ) WITHOUT ROWID;"""
+                )
+                c.execute("PRAGMA journal_mode='wal';")
+                self.__connection.commit()
+        except Exception as ex:
+            raise SpeckleException(
+                f"KnownObjectsIndex could not initialise {scope}.db at"
+                f" {self._base_path}. Provide a different `base_path`.",
+                ex,
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"KnownObjectsIndex(server: '{self.server_url}', stream:"
+            f" '{self.stream_id}')"
+        )
+
+    def __contains__(self, id: str) -> bool:
+        if id in self._known:
+            return True
+        with self._lock:
+            with closing(self.__connection.cursor()) as c:
+                row = c.execute(
+                    "SELECT 1 FROM known WHERE server = ? AND stream = ? AND hash = ?",
+                    (self.server_url, self.stream_id, id),
+                ).fetchone()
+        if row:
+            self._known.add(id)
+        return bool(row)
+
+    def add(self, ids: Iterable[str]) -> None:
+        """Records that the objects with the given ids are on the stream"""
+        new_ids = [id for id in ids if id not in self._known]
+        if not new_ids:
+            return
+        with self._lock:
+            with closing(self.__connection.cursor()) as c:
+                c.executemany(
+                    "INSERT OR IGNORE INTO known(server, stream, hash) VALUES(?,?,?)",
+                    ((self.server_url, self.stream_id, id) for id in new_ids),
+                )
+                self.__connection.commit()
+            self._known.update(new_ids)
+
+    def clear(self) -> None:
+        """Forgets every object of the stream, eg after it was deleted"""
+        with self._lock:
+            with closing(self.__connection.cursor()) as c:
+                c.execute(
+                    "DELETE FROM known WHERE server = ? AND stream = ?",
+                    (self.server_url, self.stream_id),
+                )
+                self.__connection.commit()
+            self._known.clear()
+
+    def close(self) -> None:
+        """Close the connection to the database"""
+        if self.__connection:
+            self.__connection.close()
+            self.__connection = None
+
+    def __del__(self):
+        self.close()
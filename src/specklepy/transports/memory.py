@@ -1,4 +1,6 @@
-from typing import Dict, List
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
 
 from specklepy.transports.abstract_transport import AbstractTransport
 
@@ -30,6 +32,9 @@ class MemoryTransport(AbstractTransport):
     def get_object(self, id: str) -> str or None:
         return self.objects[id] if id in self.objects else None
 
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        return {id: self.objects[id] for id in id_list if id in self.objects}
+
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
         return {id: (id in self.objects) for id in id_list}
 
@@ -43,3 +48,130 @@ class MemoryTransport(AbstractTransport):
         self, id: str, target_transport: AbstractTransport
     ) -> str:
         raise NotImplementedError
+
+
+class BoundedMemoryTransport(MemoryTransport):
+    """
+    A memory transport which keeps its objects within a size budget. Once the
+    objects take more than `max_size_mb`, the least recently saved or read ones are
+    evicted, and saved to the `spill_transport` if one is given. Objects read back
+    from the spill transport are not moved back into memory.
+
+    Without a spill transport evicted objects are lost, so the transport should only
+    be used as a cache which is allowed to miss.
+
+    Arguments:
+        max_size_mb {float} -- the size the objects can take in memory, in MB
+        spill_transport {AbstractTransport} -- optional: where to save the evicted
+            objects, eg a `SQLiteTransport` in a temporary folder
+        spill_factory {Callable} -- optional: creates the spill transport when the
+            first object is evicted, if no `spill_transport` is given
+        name {str} -- optional: the name of the transport
+
+    The `hits`, `spill_hits`, `misses` and `evictions` counters keep track of how
+    the budget performs.
+    """
+
+    def __init__(
+        self,
+        max_size_mb: float,
+        spill_transport: Optional[AbstractTransport] = None,
+        name="Memory",
+        spill_factory: Optional[Callable[[], AbstractTransport]] = None,
+    ) -> None:
+        super().__init__(name)
+        self.objects: "OrderedDict[str, str]" = OrderedDict()
+        self.max_size = int(max_size_mb * 1000 * 1000)
+        self.size = 0
+        self.spill_transport = spill_transport
+        self.spill_factory = spill_factory
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # whether the spill transport has been written to since its last end_write
+        self._spilling = False
+
+    def __repr__(self) -> str:
+        return (
+            f"BoundedMemoryTransport(objects: {len(self.objects)}, size:"
+            f" {self.size}/{self.max_size}, spill: {self.spill_transport})"
+        )
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        previous = self.objects.pop(id, None)
+        if previous is not None:
+            self.size -= sys.getsizeof(previous)
+        self.objects[id] = serialized_object
+        self.size += sys.getsizeof(serialized_object)
+        self.saved_object_count += 1
+
+        # the newest object is kept, even if it is larger than the whole budget
+        while self.size > self.max_size and len(self.objects) > 1:
+            self.__evict()
+
+    def get_object(self, id: str) -> Optional[str]:
+        serialized_object = self.objects.get(id)
+        if serialized_object is not None:
+            self.objects.move_to_end(id)
+            self.hits += 1
+            return serialized_object
+
+        if self.spill_transport is not None:
+            self.__end_spill()
+            serialized_object = self.spill_transport.get_object(id)
+            if serialized_object is not None:
+                self.spill_hits += 1
+                return serialized_object
+        self.misses += 1
+        return None
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = {}
+        missing = []
+        for id in id_list:
+            serialized_object = self.objects.get(id)
+            if serialized_object is None:
+                missing.append(id)
+                continue
+            self.objects.move_to_end(id)
+            objects[id] = serialized_object
+        self.hits += len(objects)
+
+        if missing and self.spill_transport is not None:
+            self.__end_spill()
+            spilled = self.spill_transport.get_objects(missing)
+            self.spill_hits += len(spilled)
+            objects.update(spilled)
+        self.misses += len(id_list) - len(objects)
+        return objects
+
+    def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        found = super().has_objects(id_list)
+        missing = [id for id, has in found.items() if not has]
+        if missing and self.spill_transport is not None:
+            self.__end_spill()
+            found.update(self.spill_transport.has_objects(missing))
+        return found
+
+    def end_write(self) -> None:
+        self.__end_spill()
+
+    def __evict(self) -> None:
+        id, serialized_object = self.objects.popitem(last=False)
+        self.size -= sys.getsizeof(serialized_object)
+        self.evictions += 1
+        if self.spill_transport is None:
+            if self.spill_factory is None:
+                return
+            self.spill_transport = self.spill_factory()
+        if not self._spilling:
+            self.spill_transport.begin_write()
+            self._spilling = True
+        self.spill_transport.save_object(id, serialized_object)
+
+    def __end_spill(self) -> None:
+        """Makes sure the spilled objects can be read from the spill transport"""
+        if self._spilling:
+            self.spill_transport.end_write()
+            self._spilling = False
@@ -1,3 +1,4 @@
+from specklepy.transports.server.async_server import AsyncServerTransport
 from specklepy.transports.server.server import ServerTransport
 
-__all__ = ["ServerTransport"]
+__all__ = ["AsyncServerTransport", "ServerTransport"]
@@ -0,0 +1,332 @@
+import asyncio
+import gzip
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from warnings import warn
+
+import httpx
+
+from specklepy.core.api.client import SpeckleClient
+from specklepy.core.api.credentials import Account, get_account_from_token
+from specklepy.logging.exceptions import SpeckleException, SpeckleWarning
+from specklepy.serialization.json_codecs import get_codec
+from specklepy.transports.abstract_async_transport import AbstractAsyncTransport
+from specklepy.transports.abstract_transport import AbstractTransport
+
+LOG = logging.getLogger(__name__)
+# the number of received objects written to the target transport at once
+WRITE_BATCH_SIZE = 500
+
+
+def _save_objects(transport: AbstractTransport, objects: List[Tuple[str, str]]) -> None:
+    for id, obj in objects:
+        transport.save_object(id, obj)
+
+
+class AsyncServerTransport(AbstractAsyncTransport):
+    """
+    The asyncio counterpart of `ServerTransport`, built on `httpx`. Provide it to
+    `operations.async_send()` or `operations.async_receive()`.
+
+    It is authenticated the same ways as the `ServerTransport`. Pass in an
+    `httpx.AsyncClient` to share one connection pool between many transports,
+    otherwise the transport opens its own and closes it in `aclose()`.
+
+    ```py
+    from specklepy.api import operations
+    from specklepy.transports.server import AsyncServerTransport
+
+    async with httpx.AsyncClient() as http_client:
+        transport = AsyncServerTransport(
+            stream_id=stream_id, client=client, http_client=http_client
+        )
+        hash = await operations.async_send(base=block, transports=[transport])
+    ```
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        client: Optional[SpeckleClient] = None,
+        account: Optional[Account] = None,
+        token: Optional[str] = None,
+        url: Optional[str] = None,
+        name: str = "AsyncRemoteTransport",
+        page_size: int = 10000,
+        concurrency: int = 4,
+        max_batch_size_mb: float = 1,
+        max_batch_length: int = 20000,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__()
+        if client is None and account is None and token is None and url is None:
+            raise SpeckleException(
+                "You must provide either a client or a token and url to construct an"
+                " AsyncServerTransport."
+            )
+
+        self._name = name
+        self.account = None
+        self.saved_obj_count = 0
+        if account:
+            self.account = account
+            url = account.serverInfo.url
+        elif client:
+            url = client.url
+            if not client.account.token:
+                warn(
+                    SpeckleWarning(
+                        "Unauthenticated Speckle Client provided to Server Transport"
+                        f" for {url}. Receiving from private streams will fail."
+                    )
+                )
+            else:
+                self.account = client.account
+        else:
+            self.account = get_account_from_token(token, url)
+
+        self.stream_id = stream_id
+        self.url = url
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.max_size = int(max_batch_size_mb * 1000 * 1000)
+        self.max_batch_length = int(max_batch_length)
+
+        self.headers = {"Accept": "text/plain"}
+        if self.account is not None and self.account.token:
+            self.headers["Authorization"] = f"Bearer {self.account.token}"
+
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=max(concurrency, 10)),
+        )
+
+        self._crt_batch: List[Tuple[str, str]] = []
+        self._crt_batch_size = 0
+        self._send_tasks: Set[asyncio.Task] = set()
+        self._send_slots: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self) -> str:
+        return f"AsyncServerTransport(url: '{self.url}', stream: '{self.stream_id}')"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def aclose(self) -> None:
+        """Closes the http client, unless it was provided to the transport"""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncServerTransport":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def begin_write(self) -> None:
+        self.saved_obj_count = 0
+        self._send_slots = asyncio.Semaphore(self.concurrency)
+
+    async def end_write(self) -> None:
+        if self._crt_batch:
+            await self._schedule_batch()
+        tasks, self._send_tasks = self._send_tasks, set()
+        # wait for every batch before raising the first error, like `BatchSender`
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+
+    async def save_object(self, id: str, serialized_object: str) -> None:
+        obj_size = len(serialized_object)
+        if self._crt_batch and (
+            self._crt_batch_size + obj_size >= self.max_size
+            or len(self._crt_batch) >= self.max_batch_length
+        ):
+            await self._schedule_batch()
+
+        self._crt_batch.append((id, serialized_object))
+        self._crt_batch_size += obj_size
+        self.saved_obj_count += 1
+
+    async def get_object(self, id: str) -> str:
+        raise SpeckleException(
+            "Getting a single object using `AsyncServerTransport.get_object()` is not"
+            " implemented. To get an object from the server, please use the"
+            " `SpeckleClient.object.get()` route",
+            NotImplementedError(),
+        )
+
+    async def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = {}
+        for i in range(0, len(id_list), self.page_size):
+            async for hash, obj in self._iter_page(id_list[i : i + self.page_size]):
+                objects[hash] = obj
+        return objects
+
+    async def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        return {id: False for id in id_list}
+
+    async def copy_object_and_children(
+        self,
+        id: str,
+        target_transport: AbstractTransport,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> str:
+        """Copies the parent object and all its children to the provided transport.
+
+        The children listed in the root's `__closure` are split into pages of
+        `page_size` ids, and up to `concurrency` pages are streamed at once. The
+        target transport is used on worker threads, so its I/O never blocks the
+        event loop, but only one batch of objects is written to it at a time.
+
+        Arguments:
+            id {str} -- the id of the object you want to copy
+            target_transport {AbstractTransport}
+                -- the transport you want to copy the object to
+            page_size {int} -- optional: the number of ids to request per page
+                (defaults to the transport's `page_size`)
+            concurrency {int} -- optional: the number of pages to fetch at once
+                (defaults to the transport's `concurrency`)
+        Returns:
+            str -- the string representation of the root object
+        """
+        loop = asyncio.get_running_loop()
+        page_size = page_size or self.page_size
+        slots = asyncio.Semaphore(concurrency or self.concurrency)
+        write_lock = asyncio.Lock()
+
+        r = await self.http_client.get(
+            f"{self.url}/objects/{self.stream_id}/{id}/single", headers=self.headers
+        )
+        if r.status_code != 200:
+            raise SpeckleException(
+                f"Can't get object {self.stream_id}/{id}: HTTP error"
+                f" {r.status_code} ({r.text[:1000]})"
+            )
+        root_obj_serialized = r.text
+        root_obj = get_codec().loads(root_obj_serialized)
+        closures = root_obj.get("__closure", {})
+
+        # Check which children are not already in the target transport
+        children_found_map = await loop.run_in_executor(
+            None, target_transport.has_objects, list(closures.keys())
+        )
+        new_children_ids = [
+            id for id in children_found_map if not children_found_map[id]
+        ]
+
+        async def write(batch: List[Tuple[str, str]]) -> None:
+            # waiting for the write holds the page back if the target is slower
+            async with write_lock:
+                await loop.run_in_executor(None, _save_objects, target_transport, batch)
+
+        async def copy_page(page: List[str]) -> None:
+            async with slots:
+                batch = []
+                async for hash, obj in self._iter_page(page):
+                    batch.append((hash, obj))
+                    if len(batch) >= WRITE_BATCH_SIZE:
+                        await write(batch)
+                        batch = []
+                if batch:
+                    await write(batch)
+
+        await loop.run_in_executor(None, target_transport.begin_write)
+        pages = [
+            asyncio.ensure_future(copy_page(new_children_ids[i : i + page_size]))
+            for i in range(0, len(new_children_ids), page_size)
+        ]
+        try:
+            await asyncio.gather(*pages)
+        except BaseException:
+            for page in pages:
+                page.cancel()
+            raise
+        await write([(id, root_obj_serialized)])
+        await loop.run_in_executor(None, target_transport.end_write)
+
+        return root_obj_serialized
+
+    async def _iter_page(self, page: List[str]) -> AsyncIterator[Tuple[str, str]]:
+        """Streams a page of objects, yielding `(id, object)` tuples"""
+        async with self.http_client.stream(
+            "POST",
+            f"{self.url}/api/getobjects/{self.stream_id}",
+            data={"objects": get_codec().dumps(page)},
+            headers=self.headers,
+        ) as r:
+            if r.status_code != 200:
+                await r.aread()
+                raise SpeckleException(
+                    f"Can't get objects from stream {self.stream_id}: HTTP error"
+                    f" {r.status_code} ({r.text[:1000]})"
+                )
+            async for line in r.aiter_lines():
+                if not line:
+                    continue
+                hash, obj = line.split("\t", 1)
+                yield hash, obj
+
+    async def _schedule_batch(self) -> None:
+        """
+        Hands the current batch over to a background task, waiting for a free slot
+        if `concurrency` batches are already being sent
+        """
+        batch, self._crt_batch, self._crt_batch_size = self._crt_batch, [], 0
+        if self._send_slots is None:
+            self._send_slots = asyncio.Semaphore(self.concurrency)
+        slots = self._send_slots
+        await slots.acquire()
+        task = asyncio.ensure_future(self._send_batch(batch))
+        task.add_done_callback(lambda _: slots.release())
+        self._send_tasks.add(task)
+
+    async def _send_batch(self, batch: List[Tuple[str, str]]) -> None:
+        object_ids = [obj[0] for obj in batch]
+        response = await self.http_client.post(
+            f"{self.url}/api/diff/{self.stream_id}",
+            data={"objects": get_codec().dumps(object_ids)},
+            headers=self.headers,
+        )
+        if response.status_code == 403:
+            raise SpeckleException(
+                f"Invalid credentials - cannot send objects to server {self.url}"
+            )
+        response.raise_for_status()
+        server_has_object = response.json()
+
+        new_objects = [obj[1] for obj in batch if not server_has_object[obj[0]]]
+        if not new_objects:
+            LOG.info(
+                f"Uploading batch of {len(batch)} objects: all objects are already in"
+                " the server"
+            )
+            return
+
+        upload_data = ("[" + ",".join(new_objects) + "]").encode()
+        # zlib releases the GIL, so compressing on a thread keeps the loop responsive
+        upload_data_gzip = await asyncio.get_running_loop().run_in_executor(
+            None, gzip.compress, upload_data
+        )
+        LOG.info(
+            "Uploading batch of %s objects (%s new): (size: %s, compressed size: %s)"
+            % (len(batch), len(new_objects), len(upload_data), len(upload_data_gzip))
+        )
+
+        r = await self.http_client.post(
+            f"{self.url}/objects/{self.stream_id}",
+            files={"batch-1": ("batch-1", upload_data_gzip, "application/gzip")},
+            headers=self.headers,
+        )
+        if r.status_code != 201:
+            LOG.warning("Upload server response: %s", r.text)
+            raise SpeckleException(
+                message=(
+                    "Could not save the object to the server - status code"
+                    f" {r.status_code} ({r.text[:1000]})"
+                )
+            )
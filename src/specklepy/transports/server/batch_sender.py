@@ -3,15 +3,37 @@ import json
 import logging
 import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
 from specklepy.logging.exceptions import SpeckleException
+from specklepy.serialization.json_codecs import get_codec
+from specklepy.transports.known_objects import KnownObjectsIndex
 
 LOG = logging.getLogger(__name__)
 
+# the stages of the sending pipeline, and what gets counted as it runs
+STAGES = ("diff", "compress", "upload")
+COUNTS = ("batches", "objects", "new_objects", "bytes", "compressed_bytes")
+
 
 class BatchSender(object):
+    """
+    Uploads objects to the server in batches, as a pipeline of three stages which
+    overlap each other: the diff threads ask the server which objects of each
+    batch it is missing, the compression pool gzips the new objects, and the
+    upload threads post the compressed batches.
+
+    The cumulative time spent in each stage is kept in `timings`, to help tune
+    `thread_count`, `compression_thread_count` and `max_batch_size_mb`.
+
+    If given a `KnownObjectsIndex`, the objects the server already has and the
+    objects it accepted are recorded in it.
+    """
+
     def __init__(
         self,
         server_url,
@@ -21,21 +43,40 @@ class BatchSender(object):
         max_batch_length=20000,
         batch_buffer_length=10,
         thread_count=4,
+        compression_thread_count=2,
+        known_objects: Optional[KnownObjectsIndex] = None,
     ):
         self.server_url = server_url
         self.stream_id = stream_id
         self._token = token
+        self.known_objects = known_objects
 
         self.max_size = int(max_batch_size_mb * 1000 * 1000)
         self.max_batch_length = int(max_batch_length)
         self._batches = queue.Queue(batch_buffer_length)
+        self._uploads = queue.Queue(batch_buffer_length)
         self._crt_batch = []
         self._crt_batch_size = 0
 
         self.thread_count = thread_count
+        self.compression_thread_count = compression_thread_count
         self._send_threads = []
+        self._compression_pool = None
         self._exception = None
 
+        self._timings_lock = threading.Lock()
+        self._timings = dict.fromkeys(STAGES, 0.0)
+        self._counts = dict.fromkeys(COUNTS, 0)
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """
+        The seconds spent in each stage of the pipeline (summed over all threads)
+        and the number of batches, objects and bytes which went through it
+        """
+        with self._timings_lock:
+            return {**self._timings, **self._counts}
+
     def send_object(self, id: str, obj: str):
         if not self._send_threads:
             self._create_threads()
@@ -60,47 +101,67 @@ class BatchSender(object):
             self._batches.put(self._crt_batch)
             self._crt_batch = []
             self._crt_batch_size = 0
-        # Wait for queued batches to be sent
+        # Wait for queued batches to be diffed, then for the new objects to be sent
         self._batches.join()
+        self._uploads.join()
         # End the sending threads
         self._delete_threads()
+        LOG.info("Sent objects to server, pipeline timings: %s", self.timings)
         # If there was any error, throw the first exception that occurred during upload
         if self._exception is not None:
             ex = self._exception
             self._exception = None
             raise ex
 
-    def _sending_thread_main(self):
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(
+            {"Authorization": f"Bearer {self._token}", "Accept": "text/plain"}
+        )
+        return session
+
+    def _record(self, stage: str, start: float, **counts: int) -> None:
+        elapsed = time.perf_counter() - start
+        with self._timings_lock:
+            self._timings[stage] += elapsed
+            for name, count in counts.items():
+                self._counts[name] += count
+
+    def _run_stage(self, tasks: queue.Queue, handle, name: str):
         try:
-            session = requests.Session()
-            session.headers.update(
-                {"Authorization": f"Bearer {self._token}", "Accept": "text/plain"}
-            )
+            session = self._create_session()
 
             while True:
-                batch = self._batches.get()
+                task = tasks.get()
 
                 # None is a sentinel value, meaning the thread should exit gracefully
-                if batch is None:
-                    self._batches.task_done()
+                if task is None:
+                    tasks.task_done()
                     break
 
                 try:
-                    self._bg_send_batch(session, batch)
+                    handle(session, task)
                 except Exception as ex:
                     self._exception = self._exception or ex
-                    LOG.error("Error sending batch of objects to server: " + str(ex))
+                    LOG.error(f"Error {name} batch of objects to server: " + str(ex))
 
-                self._batches.task_done()
+                tasks.task_done()
         except Exception as ex:
             self._exception = self._exception or ex
             LOG.error("ServerTransport sending thread error: " + str(ex))
 
-    def _bg_send_batch(self, session: requests.Session, batch):
+    def _diff_thread_main(self):
+        self._run_stage(self._batches, self._bg_diff_batch, "diffing")
+
+    def _upload_thread_main(self):
+        self._run_stage(self._uploads, self._bg_upload_batch, "sending")
+
+    def _bg_diff_batch(self, session: requests.Session, batch):
+        start = time.perf_counter()
         object_ids = [obj[0] for obj in batch]
         response = session.post(
             url=f"{self.server_url}/api/diff/{self.stream_id}",
-            data={"objects": json.dumps(object_ids)},
+            data={"objects": get_codec().dumps(object_ids)},
         )
         if response.status_code == 403:
             raise SpeckleException(
@@ -109,9 +170,10 @@ class BatchSender(object):
         response.raise_for_status()
         server_has_object = response.json()
 
-        new_object_ids = [x for x in object_ids if not server_has_object[x]]
-        new_object_ids = set(new_object_ids)
-        new_objects = [obj[1] for obj in batch if obj[0] in new_object_ids]
+        new_objects = [obj[1] for obj in batch if not server_has_object[obj[0]]]
+        self._record("diff", start, batches=1, objects=len(batch))
+        if self.known_objects is not None:
+            self.known_objects.add(id for id in object_ids if server_has_object[id])
 
         if not new_objects:
             LOG.info(
@@ -120,13 +182,32 @@ class BatchSender(object):
             )
             return
 
-        upload_data = "[" + ",".join(new_objects) + "]"
-        upload_data_gzip = gzip.compress(upload_data.encode())
+        new_ids = [obj[0] for obj in batch if not server_has_object[obj[0]]]
+        compressed = self._compression_pool.submit(self._compress_batch, new_objects)
+        self._uploads.put((len(batch), new_ids, compressed))
+
+    def _compress_batch(self, new_objects: List[str]) -> Tuple[int, bytes]:
+        start = time.perf_counter()
+        upload_data = ("[" + ",".join(new_objects) + "]").encode()
+        upload_data_gzip = gzip.compress(upload_data)
+        self._record(
+            "compress",
+            start,
+            new_objects=len(new_objects),
+            bytes=len(upload_data),
+            compressed_bytes=len(upload_data_gzip),
+        )
+        return len(upload_data), upload_data_gzip
+
+    def _bg_upload_batch(self, session: requests.Session, upload):
+        batch_length, new_ids, compressed = upload
+        size, upload_data_gzip = compressed.result()
         LOG.info(
             "Uploading batch of %s objects (%s new): (size: %s, compressed size: %s)"
-            % (len(batch), len(new_objects), len(upload_data), len(upload_data_gzip))
+            % (batch_length, len(new_ids), size, len(upload_data_gzip))
         )
 
+        start = time.perf_counter()
         try:
             r = session.post(
                 url=f"{self.server_url}/objects/{self.stream_id}",
@@ -140,6 +221,8 @@ class BatchSender(object):
                         f" {r.status_code} ({r.text[:1000]})"
                     )
                 )
+            if self.known_objects is not None:
+                self.known_objects.add(new_ids)
         except json.JSONDecodeError as error:
             return SpeckleException(
                 f"Failed to send objects to {self.server_url}. Please ensure this"
@@ -147,21 +230,35 @@ class BatchSender(object):
                 " permission to send to it.",
                 error,
             )
+        finally:
+            self._record("upload", start)
 
     def _create_threads(self):
-        for _ in range(self.thread_count):
-            t = threading.Thread(target=self._sending_thread_main, daemon=True)
-            t.start()
-            self._send_threads.append(t)
+        self._compression_pool = ThreadPoolExecutor(
+            max_workers=self.compression_thread_count
+        )
+        for target in (self._diff_thread_main, self._upload_thread_main):
+            for _ in range(self.thread_count):
+                t = threading.Thread(target=target, daemon=True)
+                t.start()
+                self._send_threads.append(t)
 
     def _delete_threads(self):
-        for _ in range(len(self._send_threads)):
+        if not self._send_threads:
+            return
+
+        # stop the diff threads first, as they feed the upload threads
+        for _ in range(self.thread_count):
             self._batches.put(None)
+        for _ in range(self.thread_count):
+            self._uploads.put(None)
 
         for thread in self._send_threads:
             thread.join()
 
         self._send_threads = []
+        self._compression_pool.shutdown()
+        self._compression_pool = None
 
     def __del__(self):
         self._delete_threads()
@@ -1,16 +1,24 @@
-import json
-from typing import Dict, List, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from warnings import warn
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from specklepy.core.api.client import SpeckleClient
 from specklepy.core.api.credentials import Account, get_account_from_token
 from specklepy.logging.exceptions import SpeckleException, SpeckleWarning
+from specklepy.serialization.json_codecs import get_codec
 from specklepy.transports.abstract_transport import AbstractTransport
+from specklepy.transports.known_objects import KnownObjectsIndex
 
 from .batch_sender import BatchSender
 
+# sentinel put on the receive queue by a page worker once its page is exhausted
+_PAGE_DONE = object()
+
 
 class ServerTransport(AbstractTransport):
     """
@@ -53,6 +61,9 @@ class ServerTransport(AbstractTransport):
         token: Optional[str] = None,
         url: Optional[str] = None,
         name: str = "RemoteTransport",
+        page_size: int = 10000,
+        thread_count: int = 4,
+        known_objects: Optional[KnownObjectsIndex] = None,
     ) -> None:
         super().__init__()
         if client is None and account is None and token is None and url is None:
@@ -83,8 +94,16 @@ class ServerTransport(AbstractTransport):
 
         self.stream_id = stream_id
         self.url = url
+        self.page_size = page_size
+        self.thread_count = thread_count
+        # records the objects the server acknowledges, see `KnownObjectsIndex`
+        self.known_objects = known_objects
 
         self.session = requests.Session()
+        # size the connection pool so parallel receive pages don't queue on it
+        adapter = HTTPAdapter(pool_maxsize=max(thread_count, 10))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         self.session.headers.update(
             {
@@ -94,7 +113,11 @@ class ServerTransport(AbstractTransport):
 
         if self.account is not None:
             self._batch_sender = BatchSender(
-                self.url, self.stream_id, self.account.token, max_batch_size_mb=1
+                self.url,
+                self.stream_id,
+                self.account.token,
+                max_batch_size_mb=1,
+                known_objects=known_objects,
             )
             self.session.headers.update(
                 {
@@ -136,12 +159,46 @@ class ServerTransport(AbstractTransport):
             NotImplementedError(),
         )
 
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = {}
+        cancelled = threading.Event()
+        for i in range(0, len(id_list), self.page_size):
+            for batch in self._iter_page(id_list[i : i + self.page_size], cancelled):
+                objects.update(batch)
+        return objects
+
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
         return {id: False for id in id_list}
 
     def copy_object_and_children(
-        self, id: str, target_transport: AbstractTransport
+        self,
+        id: str,
+        target_transport: AbstractTransport,
+        page_size: Optional[int] = None,
+        thread_count: Optional[int] = None,
     ) -> str:
+        """Copies the parent object and all its children to the provided transport.
+
+        The children listed in the root's `__closure` are split into pages of
+        `page_size` ids which are fetched concurrently by `thread_count` workers.
+        Objects are streamed into the target transport as they arrive, so peak
+        memory is bounded by the number of pages in flight rather than the size
+        of the closure.
+
+        Arguments:
+            id {str} -- the id of the object you want to copy
+            target_transport {AbstractTransport}
+                -- the transport you want to copy the object to
+            page_size {int} -- optional: the number of ids to request per page
+                (defaults to the transport's `page_size`)
+            thread_count {int} -- optional: the number of pages to fetch in
+                parallel (defaults to the transport's `thread_count`)
+        Returns:
+            str -- the string representation of the root object
+        """
+        page_size = page_size or self.page_size
+        thread_count = thread_count or self.thread_count
+
         endpoint = f"{self.url}/objects/{self.stream_id}/{id}/single"
         r = self.session.get(endpoint)
         r.encoding = "utf-8"
@@ -152,7 +209,7 @@ class ServerTransport(AbstractTransport):
                 f" {r.status_code} ({r.text[:1000]})"
             )
         root_obj_serialized = r.text
-        root_obj = json.loads(root_obj_serialized)
+        root_obj = get_codec().loads(root_obj_serialized)
         closures = root_obj.get("__closure", {})
 
         # Check which children are not already in the target transport
@@ -162,22 +219,106 @@ class ServerTransport(AbstractTransport):
             id for id in children_found_map if not children_found_map[id]
         ]
 
-        # Get the new children
-        endpoint = f"{self.url}/api/getobjects/{self.stream_id}"
-        r = self.session.post(
-            endpoint, data={"objects": json.dumps(new_children_ids)}, stream=True
-        )
-        r.encoding = "utf-8"
-        lines = r.iter_lines(decode_unicode=True)
-
-        # iter through returned objects saving them as we go
         target_transport.begin_write()
-        for line in lines:
-            if line:
-                hash, obj = line.split("\t")
-                target_transport.save_object(hash, obj)
-
+        self._copy_children(new_children_ids, target_transport, page_size, thread_count)
         target_transport.save_object(id, root_obj_serialized)
         target_transport.end_write()
 
+        if self.known_objects is not None:
+            self.known_objects.add([id, *children_ids])
+
         return root_obj_serialized
+
+    def _copy_children(
+        self,
+        children_ids: List[str],
+        target_transport: AbstractTransport,
+        page_size: int,
+        thread_count: int,
+    ) -> None:
+        """
+        Fetches the given children in parallel pages and saves them to the target
+        transport. All writes happen on the calling thread, as transports are not
+        expected to be thread safe.
+        """
+        pages = [
+            children_ids[i : i + page_size]
+            for i in range(0, len(children_ids), page_size)
+        ]
+        if not pages:
+            return
+
+        # each worker hands over lines in small batches through a bounded queue,
+        # which applies backpressure to the downloads if the target is slower
+        lines_queue: "queue.Queue" = queue.Queue(maxsize=thread_count * 4)
+        cancelled = threading.Event()
+
+        def fetch_page(page: List[str]) -> None:
+            try:
+                for batch in self._iter_page(page, cancelled):
+                    lines_queue.put(batch)
+            except Exception as ex:
+                lines_queue.put(ex)
+            finally:
+                lines_queue.put(_PAGE_DONE)
+
+        error = None
+        with ThreadPoolExecutor(
+            max_workers=min(thread_count, len(pages)),
+            thread_name_prefix="speckle_receive",
+        ) as executor:
+            for page in pages:
+                executor.submit(fetch_page, page)
+
+            pending = len(pages)
+            while pending:
+                item = lines_queue.get()
+                if item is _PAGE_DONE:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    # keep draining so no worker stays blocked on a full queue
+                    error = error or item
+                    cancelled.set()
+                elif not error:
+                    try:
+                        for hash, obj in item:
+                            target_transport.save_object(hash, obj)
+                    except Exception as ex:
+                        # stop the downloads, but drain them as for a failed page
+                        error = ex
+                        cancelled.set()
+
+        if error:
+            raise error
+
+    def _iter_page(
+        self, page: List[str], cancelled: threading.Event, batch_size: int = 500
+    ):
+        """Streams a page of objects, yielding batches of `(id, object)` tuples"""
+        if cancelled.is_set():
+            return
+
+        endpoint = f"{self.url}/api/getobjects/{self.stream_id}"
+        with self.session.post(
+            endpoint, data={"objects": get_codec().dumps(page)}, stream=True
+        ) as r:
+            if r.status_code != 200:
+                raise SpeckleException(
+                    f"Can't get objects from stream {self.stream_id}: HTTP error"
+                    f" {r.status_code} ({r.text[:1000]})"
+                )
+            r.encoding = "utf-8"
+
+            batch: List[Tuple[str, str]] = []
+            for line in r.iter_lines(decode_unicode=True):
+                if not line:
+                    continue
+                hash, obj = line.split("\t", 1)
+                batch.append((hash, obj))
+                if len(batch) >= batch_size:
+                    if cancelled.is_set():
+                        return
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
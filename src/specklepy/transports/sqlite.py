@@ -1,14 +1,134 @@
 import os
 import sqlite3
+import struct
+import threading
+import weakref
+import zlib
 from contextlib import closing
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from specklepy.core.helpers import speckle_path_provider
 from specklepy.logging.exceptions import SpeckleException
 from specklepy.transports.abstract_transport import AbstractTransport
 
+# stays below the default limit on host parameters of older SQLite builds
+MAX_QUERY_PARAMS = 999
+
+# the pragmas set on each connection by the performance profiles of the transport.
+# "default" keeps SQLite's own settings, "balanced" only risks losing the last
+# writes on a power loss, and "fast" risks corrupting the db on a crash
+PROFILES: Dict[str, Dict[str, Union[int, str]]] = {
+    "default": {},
+    "balanced": {
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,  # in KiB
+        "mmap_size": 256 * 1024 * 1024,
+    },
+    "fast": {
+        "synchronous": "OFF",
+        "cache_size": -256_000,
+        "mmap_size": 1024 * 1024 * 1024,
+        "wal_autocheckpoint": 10_000,
+    },
+}
+# compressed objects are stored as blobs starting with the codec and the id of
+# the dictionary they were compressed with (0 for none). They are raw deflate
+# streams, as the db already checks the integrity of its pages
+COMPRESSION_HEADER = struct.Struct("<BI")
+COMPRESSION_CODECS = {"zlib": 1}
+# set on the codec when the leading `"id"` of the object, which is the same as
+# its hash, is left out of the compressed data
+ID_STRIPPED = 0x80
+# a longer dictionary barely compresses better, but slows down every object as
+# each compressor has to index the whole dictionary
+MAX_DICTIONARY_SIZE = 4 * 1024
+# the number of objects of each speckle_type sampled into a dictionary
+DICTIONARY_SAMPLES_PER_TYPE = 4
+
+# the pragmas which can be set through a profile or the `pragmas` argument
+PRAGMAS = (
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "page_size",
+    "wal_autocheckpoint",
+    "temp_store",
+)
+
+
+def _strip_id(id: str, obj: str) -> Tuple[str, int]:
+    """Leaves out the leading id of a serialized object, which is kept as its hash"""
+    prefix = f'{{"id":"{id}",'
+    if obj.startswith(prefix):
+        return obj[len(prefix) :], ID_STRIPPED
+    return obj, 0
+
+
+def _sample_dictionary(batch: List[Tuple[str, str]]) -> bytes:
+    """
+    Samples a few objects of each speckle_type in the batch into a compression
+    dictionary. Their ids are left out, as they never repeat.
+    """
+    samples: Dict[str, List[str]] = {}
+    for id, obj in batch:
+        start = obj.find('"speckle_type":')
+        speckle_type = obj[start : obj.find(",", start)]
+        type_samples = samples.setdefault(speckle_type, [])
+        if len(type_samples) < DICTIONARY_SAMPLES_PER_TYPE:
+            type_samples.append(_strip_id(id, obj)[0])
+    data = "".join(obj for type_samples in samples.values() for obj in type_samples)
+    # zlib finds the matches nearest the end of the dictionary cheapest, so a
+    # sample which is too long is cut from the front
+    return data.encode()[-MAX_DICTIONARY_SIZE:]
+
+
+class _ThreadReader:
+    """
+    The reading connection of one thread. It is only held by the thread's local
+    storage, so it is dropped when the thread ends, which closes the connection.
+    """
+
+    __slots__ = ("connection", "generation", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection, generation: int) -> None:
+        self.connection = connection
+        self.generation = generation
+
+
+def _release_reader(
+    readers: Set[sqlite3.Connection], lock: threading.RLock, reader: sqlite3.Connection
+) -> None:
+    with lock:
+        readers.discard(reader)
+    reader.close()
+
 
 class SQLiteTransport(AbstractTransport):
+    """
+    Stores objects in a local SQLite db, by default the Speckle cache in the user's
+    application data folder.
+
+    The connections are tuned by a performance `profile` from `PROFILES`, and by
+    any `pragmas` which override it. The `page_size` only applies when the db is
+    created. In `bulk_import` mode, the WAL is not checkpointed while writing but
+    once in `end_write`.
+
+    With `compression="zlib"`, objects are written compressed. Unless
+    `train_dictionary` is False, the first batch written to a db is sampled into
+    a dictionary which is kept in the db and shared by all the objects compressed
+    after it. Objects are decompressed when read whatever the `compression` of
+    the transport, and objects written uncompressed stay readable. Other Speckle
+    clients, and older versions of specklepy, expect the objects of the shared
+    `Objects` cache to be JSON text, so compression needs a `scope` of its own.
+
+    The transport can be shared between threads. Each thread reads through its
+    own connection, which is closed when the thread ends, so reads run in parallel
+    and see every committed batch. All writes go through one connection, one at a
+    time: `save_object`, `begin_write` and `end_write` can be called from any
+    thread, but objects saved by one thread are only visible to the others once
+    their batch is written, which `end_write` guarantees.
+    """
+
     def __init__(
         self,
         base_path: Optional[str] = None,
@@ -16,6 +136,12 @@ class SQLiteTransport(AbstractTransport):
         scope: Optional[str] = None,
         max_batch_size_mb: float = 10.0,
         name: str = "SQLite",
+        profile: str = "default",
+        pragmas: Optional[Dict[str, Union[int, str]]] = None,
+        bulk_import: bool = False,
+        compression: Optional[str] = None,
+        compression_level: int = 6,
+        train_dictionary: bool = True,
     ) -> None:
         super().__init__()
         self._name = name
@@ -23,6 +149,31 @@ class SQLiteTransport(AbstractTransport):
         self.scope = scope or "Objects"
         self._base_path = base_path or self.get_base_path(self.app_name)
         self.max_size = int(max_batch_size_mb * 1000 * 1000)
+        self.__connection = None
+        # the reading connection of each thread, which are reopened after `close`
+        self._local = threading.local()
+        self._readers: Set[sqlite3.Connection] = set()
+        # reentrant, as a reader may be released by whichever thread drops it last
+        self._readers_lock = threading.RLock()
+        self._generation = 0
+        self._write_lock = threading.RLock()
+        self.pragmas = self.get_pragmas(profile, pragmas)
+        self.bulk_import = bulk_import
+        if compression is not None and compression not in COMPRESSION_CODECS:
+            raise SpeckleException(
+                f"Unknown SQLite compression '{compression}': expected one of"
+                f" {', '.join(COMPRESSION_CODECS)}"
+            )
+        if compression is not None and self.scope == "Objects":
+            raise SpeckleException(
+                "SQLite compression can't be used in the shared Objects cache, which"
+                " other Speckle clients read as JSON text: provide another `scope`"
+            )
+        self.compression = compression
+        self.compression_level = compression_level
+        self.train_dictionary = train_dictionary
+        self._dictionaries: Dict[int, bytes] = {}
+        self._dictionary_id: Optional[int] = None
         self.saved_obj_count = 0
         self._current_batch: List[Tuple[str, str]] = []
         self._current_batch_size = 0
@@ -49,6 +200,29 @@ class SQLiteTransport(AbstractTransport):
     def name(self) -> str:
         return self._name
 
+    @staticmethod
+    def get_pragmas(
+        profile: str, pragmas: Optional[Dict[str, Union[int, str]]] = None
+    ) -> Dict[str, Union[int, str]]:
+        """Gets the pragmas of a profile, updated with the given ones"""
+        if profile not in PROFILES:
+            raise SpeckleException(
+                f"Unknown SQLite profile '{profile}': expected one of"
+                f" {', '.join(PROFILES)}"
+            )
+        merged = {**PROFILES[profile], **(pragmas or {})}
+        for pragma, value in merged.items():
+            if pragma not in PRAGMAS:
+                raise SpeckleException(
+                    f"Unsupported SQLite pragma '{pragma}': expected one of"
+                    f" {', '.join(PRAGMAS)}"
+                )
+            if not isinstance(value, int) and not str(value).isalnum():
+                raise SpeckleException(
+                    f"Invalid value {value!r} for SQLite pragma '{pragma}'"
+                )
+        return merged
+
     @staticmethod
     def get_base_path(app_name):
         return str(
@@ -79,28 +253,34 @@ class SQLiteTransport(AbstractTransport):
             serialized_object {str} -- the full string representation of the object
         """
         obj_size = len(serialized_object)
-        if (
-            not self._current_batch
-            or self._current_batch_size + obj_size < self.max_size
-        ):
-            self._current_batch.append((id, serialized_object))
-            self._current_batch_size += obj_size
-            return
-
-        self.save_current_batch()
-        self._current_batch = [(id, serialized_object)]
-        self._current_batch_size = obj_size
+        with self._write_lock:
+            if (
+                not self._current_batch
+                or self._current_batch_size + obj_size < self.max_size
+            ):
+                self._current_batch.append((id, serialized_object))
+                self._current_batch_size += obj_size
+                return
+
+            self.save_current_batch()
+            self._current_batch = [(id, serialized_object)]
+            self._current_batch_size = obj_size
 
     def save_current_batch(self) -> None:
         """Save the current batch of objects to the local db"""
-        self.__check_connection()
         try:
-            with closing(self.__connection.cursor()) as c:
-                c.executemany(
-                    "INSERT OR IGNORE INTO objects(hash, content) VALUES(?,?)",
-                    self._current_batch,
-                )
-                self.__connection.commit()
+            with self._write_lock:
+                self.__check_connection()
+                batch = self._current_batch
+                if self.compression and batch:
+                    compress = self.__compressor(batch)
+                    batch = [(id, compress(id, obj)) for id, obj in batch]
+                with closing(self.__connection.cursor()) as c:
+                    c.executemany(
+                        "INSERT OR IGNORE INTO objects(hash, content) VALUES(?,?)",
+                        batch,
+                    )
+                    self.__connection.commit()
         except Exception as ex:
             raise SpeckleException(
                 "Could not save the batch of objects to the local db. Inner exception:"
@@ -109,33 +289,59 @@ class SQLiteTransport(AbstractTransport):
             )
 
     def get_object(self, id: str) -> str or None:
-        self.__check_connection()
-        with closing(self.__connection.cursor()) as c:
-            row = c.execute(
-                "SELECT * FROM objects WHERE hash = ? LIMIT 1", (id,)
-            ).fetchone()
-        return row[1] if row else None
+        row = (
+            self.__reader()
+            .execute("SELECT * FROM objects WHERE hash = ? LIMIT 1", (id,))
+            .fetchone()
+        )
+        return self.__decompress(id, row[1]) if row else None
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = {}
+        for rows in self.__query_in("SELECT hash, content", id_list):
+            objects.update((id, self.__decompress(id, obj)) for id, obj in rows)
+        return objects
 
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
-        ret = {}
-        self.__check_connection()
-        with closing(self.__connection.cursor()) as c:
-            for id in id_list:
-                row = c.execute(
-                    "SELECT 1 FROM objects WHERE hash = ? LIMIT 1", (id,)
-                ).fetchone()
-                ret[id] = bool(row)
-        return ret
+        found = set()
+        for rows in self.__query_in("SELECT hash", id_list):
+            found.update(row[0] for row in rows)
+        return {id: id in found for id in id_list}
+
+    def __query_in(self, select: str, id_list: List[str]):
+        """
+        Runs the select against the objects with the given hashes, in batches of
+        `IN (...)` queries. Yields the rows of each batch.
+        """
+        with closing(self.__reader().cursor()) as c:
+            for i in range(0, len(id_list), MAX_QUERY_PARAMS):
+                batch = id_list[i : i + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                yield c.execute(
+                    f"{select} FROM objects WHERE hash IN ({placeholders})", batch
+                ).fetchall()
 
     def begin_write(self):
         self._object_cache = []
         self.saved_obj_count = 0
+        if self.bulk_import:
+            with self._write_lock:
+                self.__check_connection()
+                self.__connection.execute("PRAGMA wal_autocheckpoint=0;")
 
     def end_write(self):
-        if self._current_batch:
-            self.save_current_batch()
-        self._current_batch = []
-        self._current_batch_size = 0
+        with self._write_lock:
+            if self._current_batch:
+                self.save_current_batch()
+            self._current_batch = []
+            self._current_batch_size = 0
+            if self.bulk_import:
+                self.__check_connection()
+                self.__connection.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+                autocheckpoint = self.pragmas.get("wal_autocheckpoint", 1000)
+                self.__connection.execute(
+                    f"PRAGMA wal_autocheckpoint={autocheckpoint};"
+                )
 
     def copy_object_and_children(
         self, id: str, target_transport: AbstractTransport
@@ -147,34 +353,155 @@ class SQLiteTransport(AbstractTransport):
         Returns all the objects in the store.
         NOTE: do not use for large collections!
         """
-        self.__check_connection()
-        with closing(self.__connection.cursor()) as c:
+        with closing(self.__reader().cursor()) as c:
             rows = c.execute("SELECT * FROM objects").fetchall()
-        return rows
+        return [(id, self.__decompress(id, obj)) for id, obj in rows]
+
+    def __compressor(self, batch: List[Tuple[str, str]]):
+        """Gets a function compressing objects with the current dictionary"""
+        if self._dictionary_id is None:
+            self._dictionary_id = self.__latest_dictionary(batch)
+        codec = COMPRESSION_CODECS[self.compression]
+        headers = {
+            flag: COMPRESSION_HEADER.pack(codec | flag, self._dictionary_id)
+            for flag in (0, ID_STRIPPED)
+        }
+        zdict = self.__dictionary(self._dictionary_id)
+        level = self.compression_level
+
+        def compress(id: str, obj: str) -> bytes:
+            obj, flag = _strip_id(id, obj)
+            if zdict:
+                compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=zdict)
+            else:
+                compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            data = compressor.compress(obj.encode()) + compressor.flush()
+            return headers[flag] + data
+
+        return compress
+
+    def __decompress(self, id: str, content) -> str:
+        if isinstance(content, str):
+            return content
+        codec, dictionary_id = COMPRESSION_HEADER.unpack_from(content)
+        data = memoryview(content)[COMPRESSION_HEADER.size :]
+        if dictionary_id:
+            zdict = self.__dictionary(dictionary_id)
+            decompressor = zlib.decompressobj(-15, zdict=zdict)
+        else:
+            decompressor = zlib.decompressobj(-15)
+        obj = (decompressor.decompress(data) + decompressor.flush()).decode()
+        if codec & ID_STRIPPED:
+            return f'{{"id":"{id}",{obj}'
+        return obj
+
+    def __latest_dictionary(self, batch: List[Tuple[str, str]]) -> int:
+        """
+        Gets the id of the newest dictionary in the db, or trains one from the
+        given batch if there is none yet (0 when not training dictionaries)
+        """
+        with closing(self.__connection.cursor()) as c:
+            row = c.execute(
+                "SELECT id, data FROM dictionaries ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+            if row:
+                self._dictionaries[row[0]] = row[1]
+                return row[0]
+            if not self.train_dictionary:
+                return 0
+
+            data = _sample_dictionary(batch)
+            c.execute("INSERT INTO dictionaries(data) VALUES(?)", (data,))
+            self.__connection.commit()
+            self._dictionaries[c.lastrowid] = data
+            return c.lastrowid
+
+    def __dictionary(self, dictionary_id: int) -> bytes:
+        if not dictionary_id:
+            return b""
+        if dictionary_id not in self._dictionaries:
+            row = (
+                self.__reader()
+                .execute("SELECT data FROM dictionaries WHERE id = ?", (dictionary_id,))
+                .fetchone()
+            )
+            if row is None:
+                raise SpeckleException(
+                    f"Missing compression dictionary {dictionary_id} in {self.scope}.db"
+                )
+            self._dictionaries[dictionary_id] = row[0]
+        return self._dictionaries[dictionary_id]
 
     def close(self):
-        """Close the connection to the database"""
-        if self.__connection:
-            self.__connection.close()
-            self.__connection = None
+        """
+        Close the connections to the database. They are reopened if the transport
+        is used again.
+        """
+        with self._write_lock:
+            if self.__connection:
+                self.__connection.close()
+                self.__connection = None
+        with self._readers_lock:
+            self._generation += 1
+            for reader in list(self._readers):
+                reader.close()
+            self._readers.clear()
 
     def __initialise(self) -> None:
-        self.__connection = sqlite3.connect(self._root_path)
+        self.__connect()
         with closing(self.__connection.cursor()) as c:
+            # the page size can only change before the first table is created
+            if "page_size" in self.pragmas:
+                c.execute(f"PRAGMA page_size={self.pragmas['page_size']};")
             c.execute(
                 """ CREATE TABLE IF NOT EXISTS objects(
                       hash TEXT PRIMARY KEY,
                       content TEXT
                     ) WITHOUT ROWID;"""
             )
+            c.execute(
+                """ CREATE TABLE IF NOT EXISTS dictionaries(
+                      id INTEGER PRIMARY KEY AUTOINCREMENT,
+                      data BLOB
+                    );"""
+            )
             c.execute("PRAGMA journal_mode='wal';")
             c.execute("PRAGMA count_changes=OFF;")
             c.execute("PRAGMA temp_store=MEMORY;")
             self.__connection.commit()
 
+    def __connect(self) -> None:
+        self.__connection = self.__open()
+
+    def __open(self) -> sqlite3.Connection:
+        # connections are closed by `close` on whichever thread calls it
+        connection = sqlite3.connect(self._root_path, check_same_thread=False)
+        for pragma, value in self.pragmas.items():
+            if pragma != "page_size":
+                connection.execute(f"PRAGMA {pragma}={value};")
+        return connection
+
+    def __reader(self) -> sqlite3.Connection:
+        """Gets the reading connection of the current thread"""
+        thread_reader = getattr(self._local, "reader", None)
+        if thread_reader is not None and thread_reader.generation == self._generation:
+            return thread_reader.connection
+        reader = self.__open()
+        reader.execute("PRAGMA query_only=ON;")
+        with self._readers_lock:
+            self._readers.add(reader)
+            thread_reader = _ThreadReader(reader, self._generation)
+        # closes the connection once the thread ends, so short lived threads don't
+        # each leave one open until `close`
+        weakref.finalize(
+            thread_reader, _release_reader, self._readers, self._readers_lock, reader
+        )
+        self._local.reader = thread_reader
+        return reader
+
     def __check_connection(self):
         if not self.__connection:
-            self.__connection = sqlite3.connect(self._root_path)
+            self.__connect()
 
     def __del__(self):
         self.close()
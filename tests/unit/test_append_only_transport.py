@@ -0,0 +1,172 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from specklepy.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.transports.append_only import (
+    INDEX_INITIAL_CAPACITY,
+    AppendOnlyTransport,
+)
+from specklepy.transports.memory import MemoryTransport
+
+
+@pytest.fixture()
+def transport(tmp_path) -> AppendOnlyTransport:
+    transport = AppendOnlyTransport(base_path=str(tmp_path), scope="test")
+    yield transport
+    transport.close()
+
+
+def save(transport: AppendOnlyTransport, count: int) -> None:
+    transport.begin_write()
+    for i in range(count):
+        transport.save_object(f"id{i}", f'{{"id":"id{i}","value":"{"é" * (i % 7)}"}}')
+    transport.end_write()
+
+
+def test_objects_round_trip_after_reopening(transport, tmp_path):
+    # enough objects to grow the index a few times
+    count = INDEX_INITIAL_CAPACITY * 3
+    save(transport, count)
+    assert transport.get_object("id5") == '{"id":"id5","value":"ééééé"}'
+    transport.close()
+
+    reopened = AppendOnlyTransport(base_path=str(tmp_path), scope="test")
+    assert len(reopened) == count
+    assert reopened.get_object("id5") == '{"id":"id5","value":"ééééé"}'
+    assert reopened.get_object("missing") is None
+    assert reopened.get_objects(["id1", "missing", f"id{count - 1}"]) == {
+        "id1": '{"id":"id1","value":"é"}',
+        f"id{count - 1}": f'{{"id":"id{count - 1}","value":"éé"}}',
+    }
+    assert reopened.has_objects(["id0", "missing"]) == {"id0": True, "missing": False}
+    reopened.close()
+
+
+def test_objects_are_readable_before_end_write(transport):
+    transport.begin_write()
+    transport.save_object("a", '{"id":"a"}')
+    assert transport.get_object("a") == '{"id":"a"}'
+    transport.save_object("b", '{"id":"b"}')
+    assert transport.get_objects(["a", "b"]) == {"a": '{"id":"a"}', "b": '{"id":"b"}'}
+    transport.end_write()
+
+
+def test_stored_objects_are_not_written_again(transport, tmp_path):
+    save(transport, 10)
+    size = os.path.getsize(tmp_path / "test" / "segment-00000.dat")
+
+    transport.begin_write()
+    transport.save_object("id3", '{"id":"id3","value":"changed"}')
+    transport.end_write()
+
+    assert transport.saved_obj_count == 0
+    assert os.path.getsize(tmp_path / "test" / "segment-00000.dat") == size
+    assert transport.get_object("id3") == '{"id":"id3","value":"ééé"}'
+
+
+def test_segments_roll_over(tmp_path):
+    transport = AppendOnlyTransport(
+        base_path=str(tmp_path), scope="test", max_segment_size_mb=0.01
+    )
+    save(transport, 1000)
+    transport.close()
+
+    segments = [name for name in os.listdir(tmp_path / "test") if "segment" in name]
+    assert len(segments) > 1
+    reopened = AppendOnlyTransport(base_path=str(tmp_path), scope="test")
+    assert len(reopened.get_objects([f"id{i}" for i in range(1000)])) == 1000
+    reopened.close()
+
+
+def test_records_lost_in_a_crash_are_missing(transport, tmp_path):
+    save(transport, 10)
+    transport.close()
+    # the index survived, but the end of the segment did not
+    path = tmp_path / "test" / "segment-00000.dat"
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 5)
+
+    reopened = AppendOnlyTransport(base_path=str(tmp_path), scope="test")
+    assert reopened.get_object("id9") is None
+    assert reopened.get_object("id8") is not None
+
+    reopened.save_object("id9", '{"id":"id9"}')
+    assert reopened.get_object("id9") == '{"id":"id9"}'
+    reopened.close()
+
+
+KILLED_WRITER = """
+import os, sys
+from specklepy.transports.append_only import AppendOnlyTransport
+
+transport = AppendOnlyTransport(base_path=sys.argv[1], scope="test")
+start = int(sys.argv[2])
+for i in range(start, start + 2000):
+    transport.save_object(f"id{i}", f'{{"id":"id{i}"}}')
+transport.end_write()
+for i in range(start + 2000, start + 2010):
+    transport.save_object(f"id{i}", f'{{"id":"id{i}"}}')
+os._exit(0)
+"""
+
+
+def test_index_count_survives_killed_writers(tmp_path):
+    # the slots written after the last `end_write` outlive the process, but the
+    # count in the header does not
+    for start in (0, 5000):
+        subprocess.run(
+            [sys.executable, "-c", KILLED_WRITER, str(tmp_path), str(start)],
+            check=True,
+            timeout=60,
+        )
+
+    reopened = AppendOnlyTransport(base_path=str(tmp_path), scope="test")
+    assert len(reopened) == 4020
+    save(reopened, 10000)
+    # the objects saved after the last `end_write` were lost, but keep their slots
+    assert len(reopened) == 4020 + 10000 - 4000
+    assert reopened.get_object("id6999") == '{"id":"id6999"}'
+    reopened.close()
+
+
+def test_invalid_index_is_rejected(tmp_path):
+    os.makedirs(tmp_path / "test")
+    with open(tmp_path / "test" / "index.dat", "wb") as f:
+        f.write(b"\0" * 64)
+
+    with pytest.raises(SpeckleException):
+        AppendOnlyTransport(base_path=str(tmp_path), scope="test")
+
+
+def test_send_and_receive(transport):
+    model = Base(name="model")
+    model["@meshes"] = [Mesh(vertices=[i] * 9, faces=[]) for i in range(5)]
+    obj_id = operations.send(model, [transport], use_default_cache=False)
+
+    received = operations.receive(obj_id, local_transport=transport)
+    assert received.get_id(decompose=True) == obj_id
+
+    target = MemoryTransport()
+    transport.copy_object_and_children(obj_id, target)
+    assert len(target.objects) == len(transport)
+    assert target.objects[obj_id] == transport.get_object(obj_id)
+
+
+def test_threads_share_the_store(transport):
+    def write_and_read(thread: int):
+        for i in range(INDEX_INITIAL_CAPACITY // 2):
+            transport.save_object(f"{thread}-{i}", f'{{"id":"{thread}-{i}"}}')
+            assert transport.get_object(f"{thread}-{i // 2}") is not None
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write_and_read, range(4)))
+    transport.end_write()
+
+    assert len(transport) == INDEX_INITIAL_CAPACITY * 2
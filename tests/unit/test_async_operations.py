@@ -0,0 +1,187 @@
+import asyncio
+import gzip
+import json
+import threading
+from typing import Dict
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import Collection
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.server import AsyncServerTransport
+
+
+class FakeServer:
+    def __init__(self) -> None:
+        self.objects: Dict[str, str] = {}
+        self.uploads = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/api/diff/"):
+            ids = json.loads(parse_qs(request.content.decode())["objects"][0])
+            return httpx.Response(200, json={i: i in self.objects for i in ids})
+        if path.startswith("/api/getobjects/"):
+            ids = json.loads(parse_qs(request.content.decode())["objects"][0])
+            lines = "\n".join(f"{i}\t{self.objects[i]}" for i in ids)
+            return httpx.Response(200, text=lines)
+        if path.endswith("/single"):
+            obj_id = path.split("/")[-2]
+            if obj_id not in self.objects:
+                return httpx.Response(404, text="not found")
+            return httpx.Response(200, text=self.objects[obj_id])
+
+        # multipart upload of a gzipped batch
+        body = request.content
+        start = body.index(b"\x1f\x8b")
+        end = body.index(b"\r\n--", start)
+        for obj in json.loads(gzip.decompress(body[start:end])):
+            self.objects[obj["id"]] = json.dumps(obj)
+        self.uploads += 1
+        return httpx.Response(201)
+
+    def transport(self, **kwargs) -> AsyncServerTransport:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+        return AsyncServerTransport(
+            "stream",
+            token="token",
+            url="http://localhost",
+            http_client=http_client,
+            **kwargs,
+        )
+
+
+def collection(n: int) -> Collection:
+    meshes = [
+        Mesh(vertices=[float(i)] * 300, faces=[3, 0, 1, 2], units="m") for i in range(n)
+    ]
+    collection = Collection(name=f"c{n}", collectionType="test", elements=meshes)
+    collection["@origin"] = Point(x=n)
+    return collection
+
+
+def test_async_send_and_receive_roundtrip():
+    server = FakeServer()
+    base = collection(5)
+
+    async def roundtrip():
+        obj_id = await operations.async_send(
+            base, [server.transport(max_batch_length=3)], use_default_cache=False
+        )
+        received = await operations.async_receive(
+            obj_id, server.transport(page_size=4), MemoryTransport()
+        )
+        return obj_id, received
+
+    obj_id, received = asyncio.run(roundtrip())
+
+    assert obj_id == base.get_id(decompose=True)
+    assert received.get_id(decompose=True) == obj_id
+    assert received["@origin"].x == 5
+    assert server.uploads > 1
+    assert set(server.objects) == set(
+        json.loads(server.objects[obj_id])["__closure"]
+    ) | {obj_id}
+
+
+def test_async_sends_share_one_loop():
+    server = FakeServer()
+    bases = [collection(n) for n in range(1, 20)]
+
+    async def send_all():
+        local = MemoryTransport()
+        ids = await asyncio.gather(
+            *(
+                operations.async_send(b, [server.transport(), local], False)
+                for b in bases
+            )
+        )
+        return ids, local
+
+    ids, local = asyncio.run(send_all())
+
+    assert ids == [b.get_id(decompose=True) for b in bases]
+    assert all(id in server.objects and id in local.objects for id in ids)
+
+
+def test_async_receive_raises_missing_objects():
+    server = FakeServer()
+
+    with pytest.raises(SpeckleException):
+        asyncio.run(
+            operations.async_receive("missing", server.transport(), MemoryTransport())
+        )
+
+
+class ThreadRecordingTransport(MemoryTransport):
+    """Records the threads each method of the transport is called on"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads = set()
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        self.threads.add(threading.get_ident())
+        super().save_object(id, serialized_object)
+
+    def get_object(self, id: str):
+        self.threads.add(threading.get_ident())
+        return super().get_object(id)
+
+    def has_objects(self, id_list):
+        self.threads.add(threading.get_ident())
+        return super().has_objects(id_list)
+
+
+def test_sync_transports_are_used_off_the_loop():
+    server = FakeServer()
+    sent_to, received_to = ThreadRecordingTransport(), ThreadRecordingTransport()
+
+    async def roundtrip():
+        obj_id = await operations.async_send(
+            collection(5), [server.transport(), sent_to], use_default_cache=False
+        )
+        await operations.async_receive(obj_id, server.transport(), received_to)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(roundtrip())
+
+    assert sent_to.threads and loop_thread not in sent_to.threads
+    assert received_to.threads and loop_thread not in received_to.threads
+
+
+class FailingAsyncTransport(AsyncServerTransport):
+    async def save_object(self, id: str, serialized_object: str) -> None:
+        raise SpeckleException("upload failed")
+
+
+def test_async_send_raises_transport_errors():
+    server = FakeServer()
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle))
+    transport = FailingAsyncTransport(
+        "stream", token="token", url="http://localhost", http_client=http_client
+    )
+    # enough objects to fill the queue between the serializer and the loop
+    base = Collection(
+        name="many",
+        collectionType="test",
+        elements=[Point(x=i) for i in range(20000)],
+    )
+
+    with pytest.raises(SpeckleException, match="upload failed"):
+        asyncio.run(operations.async_send(base, [transport], use_default_cache=False))
+
+
+def test_write_feed_only_accepts_writes():
+    loop = asyncio.new_event_loop()
+    try:
+        feed = operations._AsyncWriteFeed(loop)
+        with pytest.raises(SpeckleException):
+            feed.copy_object_and_children("id", MemoryTransport())
+    finally:
+        loop.close()
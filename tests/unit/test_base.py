@@ -171,3 +171,52 @@ def test_cached_deserialization() -> None:
     deserialized = operations.deserialize(serialized)
 
     assert deserialized["a"]["@material"] is deserialized["b"]["@material"]
+
+
+class LayoutModel(Base, serialize_ignore={"ignored"}):
+    typed: Optional[str] = None
+    annotated_only: int
+    ignored: str = "skip me"
+
+    @property
+    def computed(self) -> str:
+        return "value"
+
+    def method(self) -> None:
+        pass
+
+
+def test_serializable_attributes() -> None:
+    model = LayoutModel(typed="a")
+
+    assert model.get_serializable_attributes() == [
+        "applicationId",
+        "computed",
+        "id",
+        "speckle_type",
+        "totalChildrenCount",
+        "typed",
+        "units",
+    ]
+
+    model.annotated_only = 1
+    model["@dynamic"] = Base()
+    model.callback = print
+    assert model.get_serializable_attributes() == [
+        "@dynamic",
+        "annotated_only",
+        "applicationId",
+        "computed",
+        "id",
+        "speckle_type",
+        "totalChildrenCount",
+        "typed",
+        "units",
+    ]
+    assert "ignored" in model.get_member_names()
+
+    # callable instance values hide the class members of the same name
+    model.typed = None
+    model.__dict__["typed"] = print
+    assert "typed" not in model.get_serializable_attributes()
+    assert "typed" not in model.get_member_names()
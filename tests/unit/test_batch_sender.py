@@ -0,0 +1,113 @@
+import gzip
+import json
+import threading
+from typing import List
+
+import pytest
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.transports.known_objects import KnownObjectsIndex
+from specklepy.transports.server import batch_sender
+from specklepy.transports.server.batch_sender import BatchSender
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, body=None) -> None:
+        self.status_code = status_code
+        self.text = json.dumps(body)
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise SpeckleException(f"status {self.status_code}")
+
+
+class FakeServer:
+    def __init__(self, existing: List[str], fail_uploads: bool = False) -> None:
+        self.existing = set(existing)
+        self.fail_uploads = fail_uploads
+        self.diffs: List[List[str]] = []
+        self.uploads: List[List[dict]] = []
+        self.lock = threading.Lock()
+
+    def session(self):
+        server = self
+
+        class FakeSession:
+            headers = {}
+
+            def post(self, url: str, data=None, files=None):
+                with server.lock:
+                    if "/api/diff/" in url:
+                        ids = json.loads(data["objects"])
+                        server.diffs.append(ids)
+                        return FakeResponse(body={i: i in server.existing for i in ids})
+                    if server.fail_uploads:
+                        return FakeResponse(status_code=500, body="boom")
+                    _, upload, _ = files["batch-1"]
+                    server.uploads.append(json.loads(gzip.decompress(upload)))
+                    return FakeResponse(status_code=201)
+
+        return FakeSession()
+
+
+def send(server: FakeServer, count: int, monkeypatch, **kwargs) -> BatchSender:
+    monkeypatch.setattr(batch_sender.requests, "Session", server.session)
+    sender = BatchSender(
+        "http://localhost",
+        "stream",
+        "token",
+        max_batch_length=10,
+        thread_count=2,
+        **kwargs,
+    )
+    for i in range(count):
+        sender.send_object(f"id{i}", json.dumps({"id": f"id{i}"}))
+    sender.flush()
+    return sender
+
+
+def test_pipeline_uploads_only_new_objects(monkeypatch):
+    server = FakeServer(existing=[f"id{i}" for i in range(10, 20)])
+    sender = send(server, 45, monkeypatch)
+
+    assert sorted(len(ids) for ids in server.diffs) == [5, 10, 10, 10, 10]
+    uploaded = [obj["id"] for upload in server.uploads for obj in upload]
+    assert sorted(uploaded) == sorted(f"id{i}" for i in range(45) if not 10 <= i < 20)
+    assert len(server.uploads) == 4
+
+    timings = sender.timings
+    assert timings["batches"] == 5
+    assert timings["objects"] == 45
+    assert timings["new_objects"] == 35
+    assert timings["compressed_bytes"] > 0
+    assert all(timings[stage] > 0 for stage in batch_sender.STAGES)
+
+
+def test_pipeline_raises_upload_errors(monkeypatch):
+    server = FakeServer(existing=[], fail_uploads=True)
+
+    with pytest.raises(SpeckleException):
+        send(server, 25, monkeypatch)
+
+
+def test_pipeline_records_known_objects(monkeypatch, tmp_path):
+    known = KnownObjectsIndex("http://localhost", "stream", base_path=str(tmp_path))
+    server = FakeServer(existing=[f"id{i}" for i in range(10, 20)])
+    send(server, 25, monkeypatch, known_objects=known)
+
+    assert all(f"id{i}" in known for i in range(25))
+    assert "id25" not in known
+
+
+def test_pipeline_does_not_record_failed_uploads(monkeypatch, tmp_path):
+    known = KnownObjectsIndex("http://localhost", "stream", base_path=str(tmp_path))
+    server = FakeServer(existing=["id0"], fail_uploads=True)
+
+    with pytest.raises(SpeckleException):
+        send(server, 5, monkeypatch, known_objects=known)
+    assert "id0" in known
+    assert "id1" not in known
@@ -0,0 +1,81 @@
+from array import array
+
+import pytest
+
+from specklepy.objects.base import Base, DataChunk
+from specklepy.objects.geometry import Mesh
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+def chunk_id(data):
+    chunk = DataChunk()
+    chunk.data = list(data)
+    return BaseObjectSerializer().traverse_base(chunk)[0]
+
+
+def serialize(base: Base):
+    transport = MemoryTransport()
+    _, obj = BaseObjectSerializer(write_transports=[transport]).traverse_base(base)
+    return obj, transport
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        [0.5, 1, 2.0, -3.25e-7, 1e20],
+        [1, "two", None, True, 3.0],
+    ],
+)
+def test_plain_chunks_match_generic_chunks(data):
+    base = Base()
+    base["@(2)data"] = data
+    obj, transport = serialize(base)
+
+    expected = [chunk_id(data[i : i + 2]) for i in range(0, len(data) or 1, 2)]
+    assert [ref["referencedId"] for ref in obj["@(2)data"]] == expected
+    for ref_id in expected:
+        assert transport.get_object(ref_id).startswith(f'{{"id":"{ref_id}",')
+
+
+def test_buffers_chunk_like_lists():
+    vertices = [float(i) / 3 for i in range(4500)]
+    expected, _ = serialize(Mesh(vertices=vertices, faces=[], units="m"))
+
+    for buffer in (array("d", vertices), memoryview(array("d", vertices))):
+        base = Base(units="m")
+        base["@(2000)vertices"] = buffer
+        obj, transport = serialize(base)
+        assert obj["@(2000)vertices"] == expected["vertices"]
+        assert len(transport.objects) == 4
+
+
+def test_numpy_chunks_like_lists():
+    np = pytest.importorskip("numpy")
+    vertices = [float(i) / 3 for i in range(4500)]
+    base = Base()
+    base["@(2000)vertices"] = vertices
+    expected, _ = serialize(base)
+
+    base["@(2000)vertices"] = np.array(vertices)
+    obj, _ = serialize(base)
+    assert obj["@(2000)vertices"] == expected["@(2000)vertices"]
+
+
+def test_chunks_with_nested_values_use_generic_path():
+    base = Base()
+    base["@(2)nested"] = [[1, 2], Base(name="inner"), 3]
+    obj, transport = serialize(base)
+
+    assert len(obj["@(2)nested"]) == 2
+    assert len(transport.objects) == 3
+
+
+def test_empty_chunks_of_zero_size():
+    base = Base()
+    base["@(0)data"] = []
+    obj, transport = serialize(base)
+
+    assert [ref["referencedId"] for ref in obj["@(0)data"]] == [chunk_id([])]
+    assert chunk_id([]) in transport.objects
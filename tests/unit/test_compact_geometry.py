@@ -0,0 +1,142 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from specklepy.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.compact import (
+    CompactControlPoint,
+    CompactInterval,
+    CompactPlane,
+    CompactPoint,
+    CompactPoints,
+    CompactVector,
+)
+from specklepy.objects.geometry import (
+    ControlPoint,
+    Line,
+    Plane,
+    Point,
+    Polyline,
+    Vector,
+)
+from specklepy.objects.primitive import Interval
+
+
+@pytest.fixture()
+def plane() -> Plane:
+    return Plane(
+        origin=Point(x=1, y=2, z=3, units="m"),
+        normal=Vector(x=0, y=0, z=1, units="m"),
+        xdir=Vector(x=1, y=0, z=0, units="m"),
+        ydir=Vector(x=0, y=1, z=0, units="m"),
+        units="m",
+    )
+
+
+@pytest.fixture()
+def full_objects(plane):
+    return [
+        Point(x=1, y=2.5, z=-3, units="mm"),
+        Vector(x=0.1, y=0.2, z=0.3, units="custom units"),
+        ControlPoint(x=1, y=2, z=3, weight=0.5, units="ft"),
+        ControlPoint(x=1, y=2, z=3, units="none"),
+        Interval(start=-1, end=4.5),
+        plane,
+    ]
+
+
+COMPACT_TYPES = {
+    Point: CompactPoint,
+    Vector: CompactVector,
+    ControlPoint: CompactControlPoint,
+    Interval: CompactInterval,
+    Plane: CompactPlane,
+}
+
+
+def test_compact_objects_round_trip(full_objects):
+    for full in full_objects:
+        compact = COMPACT_TYPES[type(full)].from_base(full)
+        assert compact.speckle_type == full.speckle_type
+        assert compact.to_base().get_id() == full.get_id()
+        assert pickle.loads(pickle.dumps(compact)).to_base().get_id() == full.get_id()
+
+
+UNPICKLE = """
+import pickle, sys
+for obj in pickle.load(sys.stdin.buffer):
+    print(obj.units, getattr(obj, "origin", obj).units)
+"""
+
+
+def test_custom_units_are_pickled_across_processes():
+    plane = CompactPlane(origin=CompactPoint(units="league"), units="furlong")
+    pickled = pickle.dumps([CompactPoint(1, 2, 3, units="furlong"), plane])
+
+    result = subprocess.run(
+        [sys.executable, "-c", UNPICKLE],
+        input=pickled,
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout.decode().split() == ["furlong", "furlong", "furlong", "league"]
+
+
+def test_compact_objects_serialize_as_full_type(full_objects):
+    full, compact = Base(), Base()
+    for i, obj in enumerate(full_objects):
+        full[f"prop_{i}"] = obj
+        full[f"@detached_{i}"] = obj
+        compact[f"prop_{i}"] = compact[f"@detached_{i}"] = COMPACT_TYPES[
+            type(obj)
+        ].from_base(obj)
+    compact["@list"] = [CompactPoint.from_base(full_objects[0]), None, 1]
+    full["@list"] = [full_objects[0], None, 1]
+
+    assert compact.get_id(decompose=True) == full.get_id(decompose=True)
+    assert operations.serialize(compact) == operations.serialize(full)
+
+
+def test_compact_to_list_matches_full(full_objects):
+    for full in full_objects:
+        compact_type = COMPACT_TYPES[type(full)]
+        assert compact_type.from_base(full).to_list() == full.to_list()
+        assert compact_type.from_list(full.to_list()).to_list() == full.to_list()
+
+
+def test_compact_plane_keeps_units(plane):
+    compact = CompactPlane.from_list(plane.to_list())
+    assert compact.units == "m"
+    assert compact.origin == CompactPoint(1, 2, 3)
+
+
+def test_compact_objects_are_valid_for_typed_props():
+    line = Line(start=CompactPoint(0, 0, 0, "m"), end=CompactPoint(1, 1, 1, "m"))
+    assert isinstance(line.start, CompactPoint)
+
+    with pytest.raises(Exception):
+        line.start = CompactInterval(0, 1)
+
+
+def test_compact_points_sequence():
+    polyline = Polyline(value=[0, 1, 2, 3, 4, 5, 6, 7, 8], units="m")
+    points = polyline.as_points(compact=True)
+
+    assert isinstance(points, CompactPoints)
+    assert len(points) == 3
+    assert points[-1] == CompactPoint(6, 7, 8, "m")
+    assert [p.to_list() for p in points[1:]] == [[3, 4, 5], [6, 7, 8]]
+    assert [p.get_id() for p in points.to_base()] == [
+        p.get_id() for p in polyline.as_points()
+    ]
+
+    full, compact = Base(), Base()
+    full["@points"] = polyline.as_points()
+    compact["@points"] = points
+    assert compact.get_id(decompose=True) == full.get_id(decompose=True)
+
+    with pytest.raises(IndexError):
+        points[3]
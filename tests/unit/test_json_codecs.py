@@ -0,0 +1,116 @@
+import random
+import struct
+
+import pytest
+import ujson
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Line, Mesh, Point
+from specklepy.objects.other import BlockDefinition, BlockInstance, RenderMaterial
+from specklepy.serialization import json_codecs
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.json_codecs import get_codec, set_default_codec
+from specklepy.transports.memory import MemoryTransport
+
+
+def codec_param(name: str):
+    try:
+        get_codec(name)
+    except SpeckleException:
+        return pytest.param(name, marks=pytest.mark.skip(f"{name} is not installed"))
+    return name
+
+
+CODECS = [codec_param(name) for name in json_codecs.CODECS]
+
+TRICKY = {
+    "text": 'a/é€😀  \x00\x1f\x7f"\\ \\u007f \\\x7f ,1e5 :2e-05 [3e20 0.00001',
+    "ints": [0, -1, 2**53 + 1, 2**63, -(2**63), 2**64 - 1, 2**64, -(2**63) - 1],
+    "big": 10**30,
+    "floats": [0.0, -0.0, 0.1, 1.5, 1e15, 1e16, 1e22, 1e-4, 1e-5, 1.5e-5, 2e-9],
+    "extremes": [5e-324, 1.7976931348623157e308, -2.5e-300],
+    1: "int key",
+    "nested": {"list": [[], {}], "bools": [True, False], "none": None},
+}
+
+
+def random_floats(count: int):
+    rng = random.Random(0)
+    floats = []
+    while len(floats) < count:
+        if rng.random() < 0.5:
+            value = struct.unpack("d", struct.pack("Q", rng.getrandbits(64)))[0]
+        else:
+            value = rng.uniform(-1, 1) * 10 ** rng.randint(-12, 22)
+        if value == value and abs(value) != float("inf"):
+            floats.append(value)
+    return floats
+
+
+def make_model() -> Base:
+    material = RenderMaterial(name="béton / concrete", diffuse=-2894893)
+    definition = BlockDefinition(name="bolt", basePoint=Point(x=1e-5, y=2e20))
+    definition.geometry = [Mesh(vertices=random_floats(300), faces=[3, 0, 1, 2])]
+    model = Base(name="model €", units="m")
+    model["@instances"] = [BlockInstance(definition=definition) for _ in range(3)]
+    model["@lines"] = [
+        Line(start=Point(x=x, units="mm"), end=Point(y=-x)) for x in random_floats(20)
+    ]
+    model["renderMaterial"] = material
+    model["@(10)values"] = random_floats(35)
+    return model
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codecs_encode_like_ujson(name):
+    codec = get_codec(name)
+    assert codec.dumps(TRICKY) == ujson.dumps(TRICKY)
+
+    floats = random_floats(20_000)
+    obj = {"id": "", "values": floats, "text": ",".join(map(repr, floats[:100]))}
+    assert codec.dumps(obj) == ujson.dumps(obj)
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codecs_decode_exactly(name):
+    codec = get_codec(name)
+    encoded = ujson.dumps(TRICKY)
+    assert codec.loads(encoded) == ujson.loads(encoded)
+    assert codec.loads(encoded.encode()) == ujson.loads(encoded)
+    assert codec.loads("[NaN,Infinity]")[1] == float("inf")
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codecs_produce_identical_ids(name):
+    model = make_model()
+    expected = MemoryTransport()
+    expected_id, _ = BaseObjectSerializer(write_transports=[expected]).write_json(model)
+
+    transport = MemoryTransport()
+    serializer = BaseObjectSerializer(write_transports=[transport], codec=name)
+    obj_id, serialized = serializer.write_json(model)
+
+    assert obj_id == expected_id
+    assert transport.objects == expected.objects
+    received = BaseObjectSerializer(read_transport=transport, codec=name).read_json(
+        serialized
+    )
+    expected_received = BaseObjectSerializer(read_transport=expected).read_json(
+        serialized
+    )
+    assert received.get_id(decompose=True) == expected_received.get_id(decompose=True)
+
+
+def test_default_codec_can_be_changed():
+    try:
+        set_default_codec("json")
+        assert get_codec().name == "json"
+        assert BaseObjectSerializer().codec.name == "json"
+    finally:
+        set_default_codec("ujson")
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(SpeckleException):
+        get_codec("simplejson")
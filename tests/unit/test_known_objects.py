@@ -0,0 +1,104 @@
+import pytest
+
+from specklepy.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.serialization.serialization_cache import SerializationCache
+from specklepy.transports.known_objects import KnownObjectsIndex
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+@pytest.fixture()
+def known(tmp_path) -> KnownObjectsIndex:
+    return KnownObjectsIndex("https://example.org/", "stream", base_path=str(tmp_path))
+
+
+def make_model() -> Base:
+    model = Base(name="model")
+    model["@elements"] = [
+        Base(name=f"element {i}", **{"@mesh": Mesh(vertices=[i] * 9, faces=[])})
+        for i in range(5)
+    ]
+    return model
+
+
+class RemoteTransport(MemoryTransport):
+    """Stands in for a `ServerTransport` keeping the index of its stream"""
+
+    def __init__(self, known_objects: KnownObjectsIndex) -> None:
+        super().__init__()
+        self.known_objects = known_objects
+
+
+def send(model: Base, **kwargs):
+    transport = MemoryTransport()
+    obj_id = operations.send(model, [transport], use_default_cache=False, **kwargs)
+    return obj_id, transport.objects
+
+
+def test_index_is_persisted_per_stream(known, tmp_path):
+    known.add(["a", "b"])
+    assert "a" in known
+    assert "c" not in known
+
+    reopened = KnownObjectsIndex(
+        "https://example.org", "stream", base_path=str(tmp_path)
+    )
+    assert "b" in reopened
+    other_stream = KnownObjectsIndex(
+        "https://example.org", "other", base_path=str(tmp_path)
+    )
+    assert "a" not in other_stream
+
+    known.clear()
+    assert "a" not in known
+
+
+@pytest.mark.parametrize("cache", [None, SerializationCache()])
+def test_send_skips_known_objects(known, cache):
+    model = make_model()
+    obj_id, objects = send(model, cache=cache)
+
+    # everything but the root and one of the elements is already on the server
+    element = model["@elements"][2]
+    new_ids = {obj_id, element.get_id(decompose=True)}
+    known.add(id for id in objects if id not in new_ids)
+
+    element.name = "changed"
+    expected_id, expected = send(model)
+    remote, local = RemoteTransport(known), MemoryTransport()
+    skipped_id = operations.send(
+        model,
+        [remote, local],
+        use_default_cache=False,
+        cache=cache,
+        known_objects=known,
+    )
+
+    assert skipped_id == expected_id
+    written = remote.objects
+    assert set(written) == {id for id in expected if id not in objects or id in new_ids}
+    assert all(written[id] == expected[id] for id in written)
+    # the index only describes the stream, so local transports get everything
+    assert local.objects == expected
+
+
+@pytest.mark.parametrize("cache", [None, SerializationCache()])
+def test_send_writes_known_objects_to_local_transports(known, cache, tmp_path):
+    model = make_model()
+    obj_id, objects = send(model)
+    known.add(objects)
+
+    if cache is not None:
+        # the cached subtrees are replayed on the second send
+        send(model, cache=cache)
+    sqlite = SQLiteTransport(base_path=str(tmp_path), scope="local")
+    operations.send(
+        model, [sqlite], use_default_cache=False, cache=cache, known_objects=known
+    )
+
+    assert {id for id, _ in sqlite.get_all_objects()} == set(objects)
+    received = operations.receive(obj_id, local_transport=sqlite)
+    assert received.get_id() == model.get_id()
+    sqlite.close()
@@ -0,0 +1,86 @@
+from typing import List
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import Collection
+from specklepy.serialization.lazy import LazyChunkedList, is_lazy
+from specklepy.transports.memory import MemoryTransport
+
+
+class CountingTransport(MemoryTransport):
+    def __init__(self, name="Counting") -> None:
+        super().__init__(name)
+        self.reads: List[str] = []
+
+    def get_object(self, id: str):
+        self.reads.append(id)
+        return super().get_object(id)
+
+
+@pytest.fixture()
+def collection() -> Collection:
+    meshes = [
+        Mesh(vertices=[float(i)] * 4500, faces=[3, 0, 1, 2], units="m")
+        for i in range(5)
+    ]
+    collection = Collection(name="lazy", collectionType="test", elements=meshes)
+    collection["@origin"] = Point(x=1, y=2, z=3)
+    return collection
+
+
+def test_lazy_deserialize_defers_reads(collection: Collection):
+    transport = CountingTransport()
+    serialized = operations.serialize(collection, [transport])
+    transport.reads.clear()
+
+    received = operations.deserialize(serialized, transport, lazy=True)
+
+    # only the first element of the detached list is peeked at
+    assert len(transport.reads) == 1
+    assert is_lazy(received["@origin"])
+    assert all(is_lazy(element) for element in received.elements)
+
+    assert received["@origin"].y == 2
+    assert isinstance(received["@origin"], Point)
+    assert not is_lazy(received["@origin"])
+
+    mesh = received.elements[2]
+    assert isinstance(mesh, Mesh)
+    assert type(mesh.vertices) is LazyChunkedList
+    assert is_lazy(mesh.vertices)
+
+    reads = len(transport.reads)
+    assert mesh.vertices[0] == 2.0
+    assert len(transport.reads) == reads + 3
+    assert len(mesh.vertices) == 4500
+    assert not is_lazy(mesh.vertices)
+    assert is_lazy(received.elements[0])
+
+
+def test_lazy_deserialize_matches_eager(collection: Collection):
+    transport = MemoryTransport()
+    serialized = operations.serialize(collection, [transport])
+
+    eager = operations.deserialize(serialized, transport)
+    lazy = operations.deserialize(serialized, transport, lazy=True)
+
+    assert lazy.elements[4].vertices == eager.elements[4].vertices
+    assert lazy.get_id() == eager.get_id() == collection.get_id()
+    assert lazy.get_id(decompose=True) == collection.get_id(decompose=True)
+
+
+def test_lazy_shared_references_resolve_to_same_instance():
+    child = Base(name="shared")
+    parent = Base()
+    parent["@a"] = child
+    parent["@b"] = child
+    transport = MemoryTransport()
+    serialized = operations.serialize(parent, [transport])
+
+    received = operations.deserialize(serialized, transport, lazy=True)
+
+    assert received["@a"].name == "shared"
+    assert received["@b"]._resolve() is received["@a"]._resolve()
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import pytest
+
+from speckle_automate.automation_context import AutomationContext
+from specklepy.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.transports.append_only import AppendOnlyTransport
+from specklepy.transports.memory import BoundedMemoryTransport, MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+OBJECT = '{"id":"%03d","data":"' + "x" * 100 + '"}'
+OBJECT_SIZE = sys.getsizeof(OBJECT % 0)
+
+
+def save(transport: MemoryTransport, ids) -> None:
+    transport.begin_write()
+    for i in ids:
+        transport.save_object(str(i), OBJECT % i)
+    transport.end_write()
+
+
+def test_least_recently_used_objects_are_evicted():
+    transport = BoundedMemoryTransport(max_size_mb=OBJECT_SIZE * 3 / 1e6)
+    save(transport, range(3))
+    assert transport.get_object("0") == OBJECT % 0
+
+    save(transport, [3])
+    assert list(transport.objects) == ["2", "0", "3"]
+    assert transport.size == OBJECT_SIZE * 3
+    assert transport.evictions == 1
+    assert transport.get_object("1") is None
+    assert transport.has_objects(["0", "1"]) == {"0": True, "1": False}
+    assert (transport.hits, transport.misses) == (1, 1)
+
+
+def test_objects_larger_than_the_budget_are_kept():
+    transport = BoundedMemoryTransport(max_size_mb=OBJECT_SIZE / 2 / 1e6)
+    save(transport, range(2))
+    assert list(transport.objects) == ["1"]
+
+
+@pytest.mark.parametrize("spill_type", [SQLiteTransport, AppendOnlyTransport])
+def test_evicted_objects_spill(tmp_path, spill_type):
+    spill_transport = spill_type(base_path=str(tmp_path))
+    transport = BoundedMemoryTransport(
+        max_size_mb=OBJECT_SIZE * 10 / 1e6, spill_transport=spill_transport
+    )
+    transport.begin_write()
+    save(transport, range(100))
+    # spilled objects can be read back before end_write
+    assert transport.get_object("5") == OBJECT % 5
+    transport.end_write()
+
+    assert len(transport.objects) == 10
+    assert transport.get_objects([str(i) for i in range(100)]) == {
+        str(i): OBJECT % i for i in range(100)
+    }
+    assert all(transport.has_objects(["0", "99", "42"]).values())
+    assert transport.get_object("missing") is None
+    assert transport.evictions == 90
+    assert (transport.hits, transport.spill_hits, transport.misses) == (10, 91, 1)
+    spill_transport.close()
+
+
+def test_send_and_receive_larger_than_the_budget(tmp_path):
+    model = Base(name="model")
+    model["@meshes"] = [Mesh(vertices=[i] * 300, faces=[]) for i in range(20)]
+    spill_transport = AppendOnlyTransport(base_path=str(tmp_path))
+    transport = BoundedMemoryTransport(
+        max_size_mb=0.005, spill_transport=spill_transport
+    )
+
+    obj_id = operations.send(model, [transport], use_default_cache=False)
+    assert transport.evictions > 0
+    received = operations.receive(obj_id, local_transport=transport)
+    assert received.get_id(decompose=True) == obj_id
+    spill_transport.close()
+
+
+def test_spill_transport_is_created_on_the_first_eviction(tmp_path):
+    created = []
+
+    def spill_factory():
+        created.append(AppendOnlyTransport(base_path=str(tmp_path)))
+        return created[-1]
+
+    transport = BoundedMemoryTransport(
+        max_size_mb=OBJECT_SIZE * 2 / 1e6, spill_factory=spill_factory
+    )
+    save(transport, range(2))
+    assert transport.get_object("missing") is None
+    assert not created
+
+    save(transport, range(2, 5))
+    assert created == [transport.spill_transport]
+    assert transport.get_object("0") == OBJECT % 0
+    transport.spill_transport.close()
+
+
+def test_automation_context_removes_its_spill_store():
+    context = AutomationContext(None, None, None, "token")
+    transport = context._memory_transport
+    transport.max_size = OBJECT_SIZE
+    assert transport.spill_transport is None
+    context.close()
+
+    save(transport, range(2))
+    spill_path = context._spill_path
+    assert os.path.isdir(spill_path)
+    assert transport.get_object("0") == OBJECT % 0
+
+    context.close()
+    assert not os.path.exists(spill_path)
+    assert transport.spill_transport is None
@@ -0,0 +1,124 @@
+import json
+from array import array
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base, DataChunk
+from specklepy.objects.geometry import Mesh, Pointcloud, Polyline
+from specklepy.objects.other import Transform
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+VERTICES = [float(i) / 7 for i in range(6000)]
+
+
+@pytest.fixture()
+def mesh() -> Mesh:
+    return Mesh(
+        vertices=array("d", VERTICES),
+        faces=array("i", [3, 0, 1, 2] * 100),
+        units="m",
+    )
+
+
+def test_geometry_stores_buffers(mesh: Mesh):
+    assert isinstance(mesh.vertices, array)
+    assert Pointcloud(points=memoryview(array("d", VERTICES))).points.ndim == 1
+    assert len(Polyline(value=array("d", VERTICES[:9])).as_points()) == 3
+
+    with pytest.raises(SpeckleException):
+        Mesh(faces=array("d", [1.5]))
+
+
+def test_buffers_serialize_like_lists(mesh: Mesh):
+    as_lists = Mesh(vertices=VERTICES, faces=[3, 0, 1, 2] * 100, units="m")
+
+    assert mesh.get_id() == as_lists.get_id()
+    assert mesh.get_id(decompose=True) == as_lists.get_id(decompose=True)
+
+
+def test_transform_keeps_float_buffers():
+    matrix = array("d", [float(i == j) for i in range(4) for j in range(4)])
+    transform = Transform(matrix=matrix)
+
+    assert transform.matrix is matrix
+    assert transform.is_identity
+    assert transform.get_id() == Transform(matrix=list(matrix)).get_id()
+    assert isinstance(Transform(matrix=array("i", range(16))).matrix, list)
+
+
+def test_receive_numeric_arrays(mesh: Mesh):
+    transport = MemoryTransport()
+    serialized = operations.serialize(mesh, [transport])
+
+    received = operations.deserialize(serialized, transport, numeric_arrays="array")
+
+    assert received.vertices == array("d", VERTICES)
+    assert received.faces.typecode == "i"
+    assert received.get_id() == mesh.get_id()
+
+
+def test_receive_numpy_arrays(mesh: Mesh):
+    np = pytest.importorskip("numpy")
+    transport = MemoryTransport()
+    serialized = operations.serialize(mesh, [transport])
+
+    received = operations.deserialize(serialized, transport, numeric_arrays="numpy")
+
+    assert isinstance(received.vertices, np.ndarray)
+    assert received.faces.dtype == np.int64
+    assert received.get_id() == mesh.get_id()
+
+
+def test_receive_chunked_dynamic_props_as_arrays():
+    base = Base()
+    base["@(100)floats"] = [i / 3 for i in range(250)]
+    base["@(100)ints"] = list(range(250))
+    base["@(100)big_ints"] = [2**40 + i for i in range(250)]
+    base["@(100)strings"] = ["foo"] * 250
+    transport = MemoryTransport()
+    serialized = operations.serialize(base, [transport])
+
+    received = operations.deserialize(serialized, transport, numeric_arrays="array")
+
+    assert received["@(100)floats"] == array("d", base["@(100)floats"])
+    assert received["@(100)ints"] == array("i", base["@(100)ints"])
+    assert received["@(100)big_ints"] == array("q", base["@(100)big_ints"])
+    assert received["@(100)strings"] == base["@(100)strings"]
+
+
+@pytest.mark.parametrize("numeric_arrays", ["array", "numpy"])
+def test_receive_chunks_of_ints_wider_than_64_bits(numeric_arrays):
+    if numeric_arrays == "numpy":
+        pytest.importorskip("numpy")
+    base = Base()
+    base["@(5)ints"] = [1, 2**70, 3]
+    base["@(2)more_ints"] = [1, 2, 3, 2**70, 5]
+    transport = MemoryTransport()
+    serialized = operations.serialize(base, [transport])
+
+    received = operations.deserialize(
+        serialized, transport, numeric_arrays=numeric_arrays
+    )
+
+    assert received["@(5)ints"] == [1, 2**70, 3]
+    assert received["@(2)more_ints"] == [1, 2, 3, 2**70, 5]
+    assert received.get_id() == base.get_id()
+
+
+def test_receive_uneven_chunks_falls_back_to_lists():
+    transport = MemoryTransport()
+    refs = []
+    for data in ([1.0, 2.0], [3.0], [4.0, 5.0]):
+        chunk = DataChunk()
+        chunk.data = data
+        chunk_id, chunk_json = BaseObjectSerializer().write_json(chunk)
+        transport.save_object(chunk_id, chunk_json)
+        refs.append({"referencedId": chunk_id, "speckle_type": "reference"})
+    serialized = json.dumps({"speckle_type": "Base", "values": refs})
+
+    received = operations.deserialize(serialized, transport, numeric_arrays="array")
+
+    assert received["values"] == [1.0, 2.0, 3.0, 4.0, 5.0]
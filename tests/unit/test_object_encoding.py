@@ -0,0 +1,59 @@
+import json
+
+import pytest
+import ujson
+
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Line, Mesh, Point
+from specklepy.serialization.base_object_serializer import (
+    BaseObjectSerializer,
+    hash_obj,
+    splice_id,
+)
+from specklepy.transports.memory import MemoryTransport
+
+
+@pytest.fixture()
+def model() -> Base:
+    model = Base(name="model", units="m", text='quotes " and unicode é / \\\\')
+    model["@line"] = Line(start=Point(x=1.5), end=Point(y=-2e-9))
+    model["@meshes"] = [
+        Mesh(vertices=[float(i)] * 9, faces=[3, 0, 1, 2]) for i in range(3)
+    ]
+    model["inline"] = Base(nested=Base(value=1), **{"@detached": Point(z=3)})
+    return model
+
+
+def test_objects_are_encoded_as_before(model):
+    transport = MemoryTransport()
+    obj_id, serialized = BaseObjectSerializer(write_transports=[transport]).write_json(
+        model
+    )
+
+    assert transport.objects[obj_id] == serialized
+    for id, obj in transport.objects.items():
+        decoded = json.loads(obj)
+        # the id is hashed from the object before its id and closure are set
+        assert decoded.pop("id") == id
+        closure = decoded.pop("__closure", None)
+        assert hash_obj({"id": "", **decoded}) == id
+        expected = {"id": id, **decoded}
+        if closure:
+            expected["__closure"] = closure
+        assert obj == ujson.dumps(expected)
+
+
+def test_root_is_encoded_without_transports(model):
+    obj_id, serialized = BaseObjectSerializer().write_json(model)
+    _, obj = BaseObjectSerializer().traverse_base(model)
+
+    assert obj["id"] == obj_id
+    assert serialized == ujson.dumps(obj)
+
+
+def test_splice_id():
+    payload = ujson.dumps({"id": "", "a": [1, 2]})
+    assert splice_id("abc", payload) == '{"id":"abc","a":[1,2]}'
+    assert splice_id("abc", payload, {"x": 1}) == (
+        '{"id":"abc","a":[1,2],"__closure":{"x":1}}'
+    )
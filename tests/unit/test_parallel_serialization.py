@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import Collection
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+@pytest.fixture()
+def collection() -> Collection:
+    shared = Base(name="shared")
+    groups = [
+        Collection(
+            name=f"group {i}",
+            collectionType="group",
+            elements=[
+                Mesh(vertices=[float(i)] * 2500, faces=[3, 0, 1, 2], units="m"),
+                Point(x=i),
+            ],
+        )
+        for i in range(6)
+    ]
+    for group in groups:
+        group["@shared"] = shared
+    collection = Collection(name="root", collectionType="test", elements=groups)
+    collection["@origin"] = Point(x=1, y=2, z=3)
+    collection["@mixed"] = [42, *groups[:3], [1, 2, Point(y=1)]]
+    return collection
+
+
+def test_parallel_serialization_matches_serial(collection: Collection):
+    serial_transport = MemoryTransport()
+    serial = BaseObjectSerializer(write_transports=[serial_transport])
+    serial_id, serial_json = serial.write_json(collection)
+
+    parallel_transport = MemoryTransport()
+    parallel = BaseObjectSerializer(
+        write_transports=[parallel_transport], max_workers=2
+    )
+    parallel_id, parallel_json = parallel.write_json(collection)
+
+    assert parallel_id == serial_id
+    assert parallel_json == serial_json
+    assert parallel_transport.objects == serial_transport.objects
+    assert parallel.closure_table == serial.closure_table
+
+
+def test_parallel_send_writes_children_before_parents(collection: Collection):
+    transport = MemoryTransport()
+    obj_id = operations.send(
+        collection, [transport], use_default_cache=False, max_workers=2
+    )
+
+    written = list(transport.objects)
+    assert written[-1] == obj_id
+    for position, id in enumerate(written):
+        closure = json.loads(transport.objects[id]).get("__closure", {})
+        assert all(written.index(ref) < position for ref in closure)
@@ -0,0 +1,82 @@
+from typing import List
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import Collection
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+class CountingTransport(MemoryTransport):
+    def __init__(self, name="Counting") -> None:
+        super().__init__(name)
+        self.single_reads: List[str] = []
+        self.batches: List[List[str]] = []
+
+    def get_object(self, id: str):
+        self.single_reads.append(id)
+        return super().get_object(id)
+
+    def get_objects(self, id_list: List[str]):
+        self.batches.append(id_list)
+        return super().get_objects(id_list)
+
+
+@pytest.fixture()
+def collection() -> Collection:
+    shared = Point(x=1)
+    groups = []
+    for i in range(20):
+        points = [Point(x=i, y=j) for j in range(5)]
+        for point in points:
+            point["@shared"] = shared
+        groups.append(Collection(name=str(i), collectionType="g", elements=points))
+    groups.append(Mesh(vertices=[0.5] * 2500, faces=[3, 0, 1, 2], units="m"))
+    return Collection(name="root", collectionType="test", elements=groups)
+
+
+@pytest.mark.parametrize("prefetch_size", [1, 7, 1000])
+def test_prefetching_matches_single_reads(collection: Collection, prefetch_size):
+    transport = CountingTransport()
+    serialized = operations.serialize(collection, [transport])
+
+    serializer = BaseObjectSerializer(
+        read_transport=transport, prefetch_size=prefetch_size
+    )
+    received = serializer.read_json(serialized)
+
+    assert received.get_id() == collection.get_id()
+    assert received.elements[3].elements[0]["@shared"] is (
+        received.elements[7].elements[2]["@shared"]
+    )
+    assert all(len(batch) <= prefetch_size for batch in transport.batches)
+    read_ids = transport.single_reads + [id for b in transport.batches for id in b]
+    assert sorted(read_ids) == sorted(set(transport.objects) - {received.id})
+
+
+def test_prefetching_reads_in_batches(collection: Collection):
+    transport = CountingTransport()
+    serialized = operations.serialize(collection, [transport])
+
+    BaseObjectSerializer(read_transport=transport, prefetch_size=50).read_json(
+        serialized
+    )
+
+    assert len(transport.batches) == len(transport.objects) // 50 + 1
+    assert len(transport.single_reads) <= 1
+
+
+def test_prefetching_without_closure_reads_single_objects():
+    child = Base(name="child")
+    parent = Base()
+    parent["@child"] = child
+    transport = CountingTransport()
+    obj = operations.serialize(parent, [transport]).replace('"__closure"', '"other"')
+
+    received = BaseObjectSerializer(read_transport=transport).read_json(obj)
+
+    assert received["@child"].name == "child"
+    assert transport.batches == []
@@ -0,0 +1,118 @@
+import gc
+
+import pytest
+
+from specklepy.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Line, Mesh, Point
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.serialization_cache import SerializationCache
+from specklepy.transports.memory import MemoryTransport
+
+
+def make_model() -> Base:
+    model = Base(name="model")
+    model["@elements"] = [
+        Base(
+            name=f"element {i}",
+            line=Line(start=Point(x=i), end=Point(y=i)),
+            **{"@mesh": Mesh(vertices=[float(i)] * 300, faces=[3, 0, 1, 2])},
+        )
+        for i in range(10)
+    ]
+    model["@(3)numbers"] = list(range(10))
+    return model
+
+
+def send(model: Base, cache: SerializationCache):
+    transport = MemoryTransport()
+    obj_id = operations.send(model, [transport], use_default_cache=False, cache=cache)
+    return obj_id, transport.objects
+
+
+def fresh_send(model: Base):
+    return send(model, None)
+
+
+@pytest.fixture()
+def model() -> Base:
+    return make_model()
+
+
+def test_cached_send_matches_uncached(model):
+    cache = SerializationCache()
+    expected = fresh_send(model)
+
+    assert send(model, cache) == expected
+    assert cache.hits == 0
+    assert send(model, cache) == expected
+    # every element hits, so nothing below them is looked up
+    assert cache.hits == 10
+    assert cache.misses == 10 + 10
+
+
+def test_cached_closure_table_matches_uncached(model):
+    for element in model["@elements"]:
+        # an inline object with a closure of its own
+        element["inline"] = Base(**{"@mesh": Mesh(vertices=[0.5] * 9, faces=[])})
+
+    def closure_table(cache):
+        serializer = BaseObjectSerializer(
+            write_transports=[MemoryTransport()], cache=cache
+        )
+        serializer.write_json(model)
+        return serializer.closure_table
+
+    cache = SerializationCache()
+    expected = closure_table(None)
+    assert closure_table(cache) == expected
+    assert closure_table(cache) == expected
+    assert cache.hits == 10
+
+
+@pytest.mark.parametrize(
+    "mutate, hits",
+    [
+        (lambda model: setattr(model["@elements"][3], "name", "changed"), 10),
+        (lambda model: setattr(model["@elements"][3].line.start, "x", 42), 10),
+        (lambda model: delattr(model["@elements"][3], "line"), 10),
+        (lambda model: model["@elements"][3]["@mesh"].__setitem__("extra", 1), 9),
+        (lambda model: setattr(model["@elements"][3]["@mesh"], "faces", [3, 2]), 9),
+    ],
+)
+def test_changes_invalidate_their_subtree(model, mutate, hits):
+    cache = SerializationCache()
+    send(model, cache)
+
+    mutate(model)
+    expected = fresh_send(model)
+    cache.hits = 0
+    assert send(model, cache) == expected
+    # the other elements are still cached, and so is the mesh of a changed element
+    assert cache.hits == hits
+
+
+def test_entries_are_dropped_with_their_objects():
+    cache = SerializationCache()
+    model = make_model()
+    send(model, cache)
+    assert len(cache) == 20
+
+    del model
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_shared_subtrees_are_serialized_once():
+    cache = SerializationCache()
+    shared = Mesh(vertices=[1.0, 2.0, 3.0], faces=[])
+    model = Base()
+    model["@a"] = shared
+    model["@b"] = shared
+
+    transport = MemoryTransport()
+    serializer = BaseObjectSerializer(write_transports=[transport], cache=cache)
+    obj_id, _ = serializer.write_json(model)
+
+    assert cache.hits == 1
+    assert (obj_id, transport.objects) == fresh_send(model)
@@ -0,0 +1,109 @@
+import json
+import threading
+from typing import List
+
+import pytest
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.server import ServerTransport
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, text: str = "", lines=None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.encoding = None
+        self._lines = lines or []
+
+    def iter_lines(self, decode_unicode: bool = False):
+        return iter(self._lines)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakeSession:
+    def __init__(self, root: dict, objects: dict, fail: bool = False) -> None:
+        self.root = root
+        self.objects = objects
+        self.fail = fail
+        self.pages: List[List[str]] = []
+
+    def get(self, url: str, **kwargs):
+        return FakeResponse(text=json.dumps(self.root))
+
+    def post(self, url: str, data: dict, **kwargs):
+        page = json.loads(data["objects"])
+        self.pages.append(page)
+        if self.fail:
+            return FakeResponse(status_code=500, text="boom")
+        return FakeResponse(lines=[f"{id}\t{self.objects[id]}" for id in page])
+
+
+@pytest.fixture()
+def children():
+    return {f"child{i}": json.dumps({"id": f"child{i}", "n": i}) for i in range(25)}
+
+
+@pytest.fixture()
+def root(children):
+    return {"id": "root", "__closure": {id: 1 for id in children}}
+
+
+def test_copy_object_and_children_pages(root, children):
+    transport = ServerTransport("stream", token="token", url="http://localhost")
+    transport.session = FakeSession(root, children)
+    target = MemoryTransport()
+    target.save_object("child0", children["child0"])
+
+    root_str = transport.copy_object_and_children(
+        "root", target, page_size=10, thread_count=3
+    )
+
+    assert json.loads(root_str)["id"] == "root"
+    assert sorted(len(p) for p in transport.session.pages) == [4, 10, 10]
+    assert "child0" not in {id for p in transport.session.pages for id in p}
+    assert set(target.objects) == {"root", *children}
+    assert target.objects["child24"] == children["child24"]
+
+
+def test_copy_object_and_children_raises_page_errors(root, children):
+    transport = ServerTransport("stream", token="token", url="http://localhost")
+    transport.session = FakeSession(root, children, fail=True)
+
+    with pytest.raises(SpeckleException):
+        transport.copy_object_and_children(
+            "root", MemoryTransport(), page_size=5, thread_count=2
+        )
+
+
+class FailingTransport(MemoryTransport):
+    def save_object(self, id: str, serialized_object: str) -> None:
+        raise OSError("disk full")
+
+
+def test_copy_object_and_children_raises_target_errors():
+    children = {f"child{i}": json.dumps({"id": f"child{i}"}) for i in range(20000)}
+    root = {"id": "root", "__closure": {id: 1 for id in children}}
+    transport = ServerTransport("stream", token="token", url="http://localhost")
+    transport.session = FakeSession(root, children)
+    errors = []
+
+    def copy():
+        try:
+            transport.copy_object_and_children(
+                "root", FailingTransport(), page_size=1000, thread_count=2
+            )
+        except OSError as ex:
+            errors.append(ex)
+
+    # the copy used to hang on the downloads blocked on the full queue
+    thread = threading.Thread(target=copy, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+    assert [str(ex) for ex in errors] == ["disk full"]
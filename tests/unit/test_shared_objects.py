@@ -0,0 +1,102 @@
+import copy
+import json
+from collections import Counter
+
+import pytest
+
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import BlockDefinition, BlockInstance, RenderMaterial
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+class CountingTransport(MemoryTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.saves = Counter()
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        super().save_object(id, serialized_object)
+        self.saves[id] += 1
+
+
+def make_model() -> Base:
+    material = RenderMaterial(name="steel", diffuse=123)
+    definition = BlockDefinition(
+        name="bolt",
+        basePoint=Point(x=0, y=0, z=0),
+        geometry=[Mesh(vertices=[1.0, 2.0, 3.0] * 3, faces=[3, 0, 1, 2])],
+    )
+    definition["renderMaterial"] = material
+    model = Base(name="model")
+    model["@instances"] = [BlockInstance(definition=definition) for _ in range(50)]
+    model["@materials"] = [material] * 3
+    model["origin"] = model["@instances"][0].definition.basePoint
+    return model
+
+
+def serialize(model: Base, **kwargs):
+    transport = CountingTransport()
+    serializer = BaseObjectSerializer(write_transports=[transport], **kwargs)
+    obj_id, serialized = serializer.write_json(model)
+    return obj_id, serialized, transport
+
+
+def unshare(model: Base) -> Base:
+    """Copies the model so no Base appears in it more than once"""
+    unshared = copy.deepcopy(model)
+    unshared["@instances"] = [copy.deepcopy(i) for i in unshared["@instances"]]
+    unshared["@materials"] = [copy.deepcopy(m) for m in unshared["@materials"]]
+    unshared["origin"] = copy.deepcopy(unshared["origin"])
+    return unshared
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_shared_objects_serialize_like_copies(max_workers):
+    model = make_model()
+    obj_id, serialized, transport = serialize(model, max_workers=max_workers)
+    expected_id, expected, expected_transport = serialize(unshare(model))
+
+    assert (obj_id, serialized) == (expected_id, expected)
+    assert transport.objects == expected_transport.objects
+    assert set(transport.saves.values()) == {1}
+
+
+def test_changed_shared_objects_are_traversed_again():
+    model = make_model()
+    material = model["@materials"][0]
+    serializer = BaseObjectSerializer(write_transports=[CountingTransport()])
+    serializer.write_json(model)
+
+    material.name = "brass"
+    obj_id, serialized = serializer.write_json(model)
+    assert (obj_id, serialized) == serialize(unshare(model))[:2]
+    assert serializer._memo == {}
+
+
+class Renamer(Base, speckle_type="Test.SharedObjects.Renamer"):
+    """Renames its target while it is serialized"""
+
+    def get_serializable_attributes(self):
+        self._target.name = "renamed"
+        return super().get_serializable_attributes()
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_objects_changed_during_traversal_are_traversed_again(max_workers):
+    shared = Base(name="shared")
+    renamer = Renamer()
+    renamer._target = shared
+    model = Base(name="model")
+    # the attributes are serialized in alphabetical order
+    model["@a"] = shared
+    model["@b"] = renamer
+    model["@c"] = [shared, Base(name="other")]
+
+    _, serialized, transport = serialize(model, max_workers=max_workers)
+
+    renamed_id = Base(name="renamed").get_id()
+    elements = json.loads(serialized)["@c"]
+    assert elements[0]["referencedId"] == renamed_id
+    assert renamed_id in transport.objects
@@ -0,0 +1,232 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import MAX_QUERY_PARAMS, SQLiteTransport
+
+
+@pytest.fixture()
+def transport(tmp_path) -> SQLiteTransport:
+    transport = SQLiteTransport(base_path=str(tmp_path), scope="test")
+    transport.begin_write()
+    for i in range(MAX_QUERY_PARAMS + 10):
+        transport.save_object(f"id{i}", f'{{"id":"id{i}"}}')
+    transport.end_write()
+    yield transport
+    transport.close()
+
+
+def test_has_objects_spans_batches(transport: SQLiteTransport):
+    ids = [f"id{i}" for i in range(0, MAX_QUERY_PARAMS + 10, 3)] + ["missing"]
+    result = transport.has_objects(ids)
+
+    assert list(result) == ids
+    assert result.pop("missing") is False
+    assert all(result.values())
+
+
+def test_get_objects_spans_batches(transport: SQLiteTransport):
+    ids = [f"id{i}" for i in range(MAX_QUERY_PARAMS + 10)] + ["missing"]
+    objects = transport.get_objects(ids)
+
+    assert len(objects) == MAX_QUERY_PARAMS + 10
+    assert "missing" not in objects
+    assert objects["id1000"] == '{"id":"id1000"}'
+    assert transport.get_objects([]) == {}
+
+
+def test_get_objects_default_falls_back_to_get_object(transport: SQLiteTransport):
+    memory = MemoryTransport()
+    memory.save_object("a", "{}")
+    assert memory.get_objects(["a", "b"]) == {"a": "{}"}
+
+    # the base implementation, as used by transports that don't override it
+    objects = super(SQLiteTransport, transport).get_objects(["id1", "missing"])
+    assert objects == {"id1": '{"id":"id1"}'}
+
+
+def pragma(transport: SQLiteTransport, name: str):
+    return transport._SQLiteTransport__connection.execute(f"PRAGMA {name}").fetchone()[
+        0
+    ]
+
+
+def test_profile_pragmas_are_applied(tmp_path):
+    transport = SQLiteTransport(
+        base_path=str(tmp_path),
+        scope="profiled",
+        profile="balanced",
+        pragmas={"cache_size": -1000, "page_size": 8192},
+    )
+    assert pragma(transport, "synchronous") == 1  # NORMAL
+    assert pragma(transport, "cache_size") == -1000
+    assert pragma(transport, "page_size") == 8192
+
+    # the pragmas are set again when reconnecting
+    transport.close()
+    transport.begin_write()
+    transport.save_object("a", "{}")
+    transport.end_write()
+    assert pragma(transport, "synchronous") == 1
+    assert transport.get_object("a") == "{}"
+    transport.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"profile": "unknown"},
+        {"pragmas": {"journal_mode": "off"}},
+        {"pragmas": {"synchronous": "OFF; DROP TABLE objects"}},
+    ],
+)
+def test_invalid_pragmas_are_rejected(tmp_path, kwargs):
+    with pytest.raises(SpeckleException):
+        SQLiteTransport(base_path=str(tmp_path), scope="invalid", **kwargs)
+
+
+def test_bulk_import_checkpoints_at_the_end(tmp_path):
+    transport = SQLiteTransport(
+        base_path=str(tmp_path), scope="bulk", bulk_import=True, max_batch_size_mb=0
+    )
+    wal = tmp_path / "bulk.db-wal"
+
+    transport.begin_write()
+    assert pragma(transport, "wal_autocheckpoint") == 0
+    for i in range(2000):
+        transport.save_object(f"id{i}", "x" * 1000)
+    transport.save_current_batch()
+    assert wal.stat().st_size > 0
+
+    transport.end_write()
+    assert wal.stat().st_size == 0
+    assert pragma(transport, "wal_autocheckpoint") == 1000
+    assert len(transport.get_objects([f"id{i}" for i in range(2000)])) == 2000
+    transport.close()
+
+
+def test_compressed_objects_round_trip(tmp_path):
+    objects = {
+        f"id{i}": f'{{"id":"id{i}","speckle_type":"Base","value":{i}}}'
+        for i in range(50)
+    }
+    objects["odd"] = '{"speckle_type":"Base","id":"odd"}'
+    plain = SQLiteTransport(base_path=str(tmp_path), scope="compressed")
+    plain.begin_write()
+    plain.save_object("old", '{"id":"old"}')
+    plain.end_write()
+    plain.close()
+
+    transport = SQLiteTransport(
+        base_path=str(tmp_path), scope="compressed", compression="zlib"
+    )
+    transport.begin_write()
+    for id, obj in objects.items():
+        transport.save_object(id, obj)
+    transport.end_write()
+    rows = dict(transport._SQLiteTransport__connection.execute("SELECT * FROM objects"))
+    assert isinstance(rows["id1"], bytes)
+    assert isinstance(rows["old"], str)
+
+    # rows are decompressed whatever the compression of the reading transport
+    for reader in (transport, plain):
+        assert reader.get_objects(list(objects)) == objects
+        assert reader.get_object("id7") == objects["id7"]
+        assert reader.get_object("old") == '{"id":"old"}'
+        assert len(reader.get_all_objects()) == len(objects) + 1
+    transport.close()
+
+
+def test_compression_dictionary_is_shared(tmp_path):
+    def write(ids):
+        transport = SQLiteTransport(
+            base_path=str(tmp_path), scope="dictionary", compression="zlib"
+        )
+        transport.begin_write()
+        for id in ids:
+            transport.save_object(id, f'{{"id":"{id}","speckle_type":"Base"}}')
+        transport.end_write()
+        return transport
+
+    first = write(["a", "b"])
+    second = write(["c"])
+    dictionaries = second._SQLiteTransport__connection.execute(
+        "SELECT count(*) FROM dictionaries"
+    ).fetchone()[0]
+    assert dictionaries == 1
+    assert first.get_object("c") == '{"id":"c","speckle_type":"Base"}'
+    first.close()
+    second.close()
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(SpeckleException):
+        SQLiteTransport(base_path=str(tmp_path), scope="invalid", compression="lz4")
+
+
+def test_compression_is_rejected_in_the_shared_cache(tmp_path):
+    with pytest.raises(SpeckleException):
+        SQLiteTransport(base_path=str(tmp_path), compression="zlib")
+    assert not (tmp_path / "Objects.db").exists()
+
+
+def test_threads_read_through_their_own_connections(transport: SQLiteTransport):
+    ids = [f"id{i}" for i in range(MAX_QUERY_PARAMS + 10)]
+    barrier = threading.Barrier(4)
+
+    def read(start: int):
+        barrier.wait()
+        objects = transport.get_objects(ids[start:])
+        assert transport.get_object(ids[start]) == objects[ids[start]]
+        return len(objects), transport._SQLiteTransport__reader()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(read, range(4)))
+
+    assert [count for count, _ in results] == [len(ids) - i for i in range(4)]
+    assert len({id(reader) for _, reader in results}) == 4
+
+    transport.close()
+    assert transport.get_object("id0") == '{"id":"id0"}'
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_threads_write_through_one_connection(tmp_path, compression):
+    transport = SQLiteTransport(
+        base_path=str(tmp_path),
+        scope="threads",
+        max_batch_size_mb=0.001,
+        compression=compression,
+    )
+
+    def write(thread: int):
+        for i in range(200):
+            transport.save_object(f"{thread}-{i}", f'{{"id":"{thread}-{i}"}}')
+            transport.get_object(f"{thread}-0")
+
+    transport.begin_write()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write, range(4)))
+    transport.end_write()
+
+    objects = transport.get_all_objects()
+    assert len(objects) == 800
+    assert all(obj == f'{{"id":"{id}"}}' for id, obj in objects)
+    transport.close()
+
+
+def test_readers_are_closed_when_their_threads_end(transport: SQLiteTransport):
+    def read():
+        assert transport.get_object("id0") == '{"id":"id0"}'
+
+    for _ in range(50):
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+    assert len(transport._readers) == 0
+    assert transport.get_object("id1") == '{"id":"id1"}'
+    assert len(transport._readers) == 1
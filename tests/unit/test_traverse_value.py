@@ -2,6 +2,7 @@ from typing import List
 
 from specklepy.objects.base import Base
 from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
 
 
 class FakeBase(Base):
@@ -23,3 +24,40 @@ def test_traverse_value():
         "bar": 1,
         "totalChildrenCount": 0,
     }
+
+
+def test_traverse_deep_detached_tree():
+    # deeper than the default recursion limit would allow a recursive traversal
+    depth = 1200
+    root = Base(name="root")
+    parent = root
+    for i in range(depth):
+        child = Base(name=i)
+        parent["@child"] = child
+        parent = child
+
+    transport = MemoryTransport()
+    serializer = BaseObjectSerializer(write_transports=[transport])
+    object_id, object_dict = serializer.traverse_base(root)
+
+    assert object_dict["totalChildrenCount"] == depth
+    assert list(object_dict["__closure"].values()) == list(range(depth, 0, -1))
+    assert len(transport.objects) == depth + 1
+    assert serializer.closure_table[object_id] == object_dict["__closure"]
+
+
+def test_traverse_closure_keeps_shallowest_depth():
+    shared = Base(name="shared")
+    inline = Base(name="inline")
+    inline["@nested"] = Base(name="nested", **{"@shared": shared})
+    root = Base(name="root")
+    root["@shared"] = shared
+    root.inline = inline
+
+    serializer = BaseObjectSerializer(write_transports=[MemoryTransport()])
+    _, object_dict = serializer.traverse_base(root)
+
+    shared_id = object_dict["@shared"]["referencedId"]
+    nested_id = object_dict["inline"]["@nested"]["referencedId"]
+    assert object_dict["__closure"] == {shared_id: 1, nested_id: 2}
+    assert object_dict["inline"]["__closure"] == {shared_id: 2, nested_id: 1}
@@ -0,0 +1,42 @@
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.geometry import Line, Point
+from specklepy.objects.other import Collection
+from specklepy.objects.structural.loading import ActionType, LoadCase, LoadType
+from specklepy.transports.memory import MemoryTransport
+
+
+@pytest.fixture()
+def collection() -> Collection:
+    load_case = LoadCase(
+        name="dead", loadType=LoadType.Dead, actionType=ActionType.Permanent
+    )
+    line = Line(start=Point(x=1, y=2), end=Point(x=3), units="mm")
+    return Collection(name="trusted", collectionType="test", elements=[load_case, line])
+
+
+def test_trusted_deserialize_matches_validated(collection: Collection):
+    transport = MemoryTransport()
+    serialized = operations.serialize(collection, [transport])
+
+    validated = operations.deserialize(serialized, transport)
+    trusted = operations.deserialize(serialized, transport, trusted=True)
+
+    assert trusted.get_id() == validated.get_id() == collection.get_id()
+    load_case, line = trusted.elements
+    assert load_case.loadType is LoadType.Dead
+    assert load_case.actionType is ActionType.Permanent
+    assert line.units == "mm"
+    assert line.start.x == 1.0
+
+
+def test_trusted_deserialize_skips_validation():
+    serialized = operations.serialize(Point(x=1, y=2)).replace("2.0", '"two"')
+
+    with pytest.raises(SpeckleException):
+        operations.deserialize(serialized, MemoryTransport())
+
+    point = operations.deserialize(serialized, MemoryTransport(), trusted=True)
+    assert point.y == "two"
@@ -0,0 +1,83 @@
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base, DataChunk
+from specklepy.objects.geometry import Line, Mesh, Point
+from specklepy.objects.other import Collection
+from specklepy.objects.units import Units
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.type_decoder import TypeDecoder
+from specklepy.transports.memory import MemoryTransport
+
+
+class InitCounter(Base, speckle_type="Test.TypeDecoder.InitCounter"):
+    calls = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        InitCounter.calls += 1
+
+
+def test_create_registered_type():
+    point = TypeDecoder(Point.speckle_type).create()
+
+    assert type(point) is Point
+    assert point.speckle_type == Point.speckle_type
+    assert point.x == 0.0
+
+
+def test_create_calls_init_of_classes_which_define_it():
+    InitCounter.calls = 0
+    assert type(TypeDecoder(InitCounter.speckle_type).create()) is InitCounter
+    assert InitCounter.calls == 1
+    assert TypeDecoder(DataChunk.speckle_type).create().data == []
+
+
+def test_create_unknown_type():
+    base = TypeDecoder("Objects.Unknown:Objects.Unknown.Thing").create()
+
+    assert type(base) is Base
+    assert base.speckle_type == "Objects.Unknown:Objects.Unknown.Thing"
+
+
+def test_assign_trusted():
+    line = Line()
+    TypeDecoder(Line.speckle_type).assign_trusted(
+        line,
+        {"speckle_type": "ignored", "units": Units.mm, "length": 2.0, "extra": "x"},
+    )
+
+    assert line.speckle_type == Line.speckle_type
+    assert line.units == "mm"
+    assert line.length == 2.0
+    assert line.extra == "x"
+
+
+@pytest.fixture()
+def model() -> Collection:
+    mesh = Mesh(vertices=[float(i) for i in range(30000)], faces=[3, 0, 1, 2])
+    lines = [
+        Line(start=Point(x=i), end=Point(y=i), units="m", applicationId=str(i))
+        for i in range(10)
+    ]
+    unknown = Base.of_type("Objects.Unknown", value=1)
+    return Collection(
+        name="model", collectionType="test", elements=[mesh, *lines, unknown]
+    )
+
+
+def test_trusted_receive_matches_validated(model: Collection):
+    transport = MemoryTransport()
+    obj_id = operations.send(model, [transport], use_default_cache=False)
+    root = transport.get_object(obj_id)
+
+    validated = BaseObjectSerializer(read_transport=transport).read_json(root)
+    trusted = BaseObjectSerializer(read_transport=transport, trusted=True).read_json(
+        root
+    )
+
+    assert trusted.get_id() == validated.get_id() == model.get_id()
+    mesh, *lines, unknown = trusted.elements
+    assert mesh.vertices == model.elements[0].vertices
+    assert [line.units for line in lines] == ["m"] * 10
+    assert unknown.speckle_type == "Objects.Unknown"
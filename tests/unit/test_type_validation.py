@@ -1,9 +1,10 @@
+from array import array
 from enum import Enum, IntEnum
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import pytest
 
-from specklepy.objects.base import Base, _validate_type
+from specklepy.objects.base import Base, _compile_validator, _validate_type
 from specklepy.objects.primitive import Interval
 
 test_base = Base()
@@ -28,7 +29,7 @@ class FakeBase(Base):
 fake_bases = [FakeBase("foo"), FakeBase("bar")]
 
 
-@pytest.mark.parametrize(
+validation_cases = pytest.mark.parametrize(
     "input_type, value, is_valid, return_value",
     [
         (str, 10, True, "10"),
@@ -70,6 +71,13 @@ fake_bases = [FakeBase("foo"), FakeBase("bar")]
         (Optional[Base], test_base, True, test_base),
         (Optional[Base], None, True, None),
         (List[int], [1, 2], True, [1, 2]),
+        (List[float], array("d", [1.5]), True, array("d", [1.5])),
+        (List[float], array("i", [1]), True, array("i", [1])),
+        (Optional[List[float]], array("f", [1]), True, array("f", [1])),
+        (List[int], array("q", [1]), True, array("q", [1])),
+        (List[int], array("d", [1.5]), False, array("d", [1.5])),
+        (List[str], array("d", [1.5]), False, array("d", [1.5])),
+        (List, array("d", [1.5]), True, array("d", [1.5])),
         (List[int], ["1", 2], False, ["1", 2]),
         # same as the dict typing below...
         (List[int], [None, 2], True, [None, 2]),
@@ -114,14 +122,40 @@ fake_bases = [FakeBase("foo"), FakeBase("bar")]
             {"foo": 1.0, "bar": 2.0},
         ),
         (Union[float, Dict[str, float]], {"foo": "bar"}, False, {"foo": "bar"}),
+        (Union[None, str], "m", True, "m"),
+        (Union[None, float], 1, True, 1.0),
+        (Union[None, List[int]], [1], True, [1]),
+        (type(None), None, True, None),
+        (type(None), "m", False, "m"),
     ],
 )
+
+
+@validation_cases
 def test_validate_type(
     input_type: type, value: Any, is_valid: bool, return_value: Any
 ) -> None:
     assert (is_valid, return_value) == _validate_type(input_type, value)
 
 
+@validation_cases
+def test_compiled_validator(
+    input_type: type, value: Any, is_valid: bool, return_value: Any
+) -> None:
+    assert (is_valid, return_value) == _compile_validator(input_type)(value)
+
+
+def test_compiled_union_checks_every_type(monkeypatch):
+    validate = _compile_validator(Union[None, str])
+
+    def fail(t: type, value: Any):
+        raise AssertionError(f"{t} fell back to the full validation")
+
+    monkeypatch.setattr("specklepy.objects.base._validate_type", fail)
+    assert validate("m") == (True, "m")
+    assert validate(None) == (True, None)
+
+
 def test_intervar_type():
     i = Interval(start=5, end=10)
     assert i